@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+히스토리 DB 벤치마크
+같은 질의를 SQLite 히스토리 DB와 data/history 전체 파일 스캔으로 실행해 시간을 비교합니다.
+
+- 모델 하나의 전체 가격 이력
+- 최근 N일 가격 변경 모델
+
+사용법:
+    python benchmarks/bench_history_db.py [--repeat 5] [--model anthropic/claude-3-5-sonnet-20241022] [--days 30]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.append(str(BASE_DIR / "scripts"))
+
+from history.history_db import HistoryDatabase
+from history.reader import open_history
+from history.records import iter_price_records
+
+
+def time_call(func, repeat: int) -> float:
+    """repeat회 실행 후 중앙값(ms) 반환"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def scan_model_history(history_dir: Path, unique_id: str) -> list:
+    """파일 스캔으로 모델 가격 이력 조회"""
+    rows = []
+    for date, snapshot in open_history(history_dir).iter_snapshots():
+        for record in iter_price_records(snapshot):
+            if record['unique_id'] == unique_id:
+                rows.append((date, record['input_price'], record['output_price']))
+    return rows
+
+
+def scan_changes(history_dir: Path, since: str) -> list:
+    """파일 스캔으로 since 이후 가격 변경 조회"""
+    history = open_history(history_dir)
+    start = history.latest(before=since) or since
+    changes = []
+    previous = {}
+    for date, snapshot in history.iter_snapshots(start=start):
+        current = {r['unique_id']: (r['input_price'], r['output_price']) for r in iter_price_records(snapshot)}
+        if date > start:
+            changes.extend((date, uid) for uid, prices in current.items()
+                           if uid in previous and previous[uid] != prices)
+        previous.update(current)
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="History DB benchmark")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument('--model', default='anthropic/claude-3-5-sonnet-20241022')
+    parser.add_argument('--days', type=int, default=30, help="변경 조회 기간 (마지막 날짜 기준)")
+    args = parser.parse_args()
+
+    history_dir = BASE_DIR / "data/history"
+    dates = open_history(history_dir).dates()
+    if not dates:
+        print("❌ No history snapshots found")
+        return
+    since = dates[max(0, len(dates) - 1 - args.days)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = HistoryDatabase(history_dir, Path(tmp) / "history.db")
+        start = time.perf_counter()
+        stats = db.sync()
+        ingest_ms = (time.perf_counter() - start) * 1000
+        resync_ms = time_call(db.sync, args.repeat)
+
+        print(f"📏 History DB benchmark: {stats['dates']} dates, {stats['records']} records "
+              f"(median of {args.repeat} runs)")
+        print(f"{'operation':<32} {'sqlite ms':>10} {'scan ms':>10} {'rows':>8}")
+        print(f"{'full ingest':<32} {ingest_ms:>10.2f} {'-':>10} {stats['records']:>8}")
+        print(f"{'incremental re-sync (no-op)':<32} {resync_ms:>10.2f} {'-':>10} {0:>8}")
+
+        rows = db.price_history(args.model)
+        print(f"{'model history':<32} "
+              f"{time_call(lambda: db.price_history(args.model), args.repeat):>10.2f} "
+              f"{time_call(lambda: scan_model_history(history_dir, args.model), args.repeat):>10.2f} "
+              f"{len(rows):>8}")
+
+        rows = db.price_changes(since)
+        print(f"{f'changes since {since}':<32} "
+              f"{time_call(lambda: db.price_changes(since), args.repeat):>10.2f} "
+              f"{time_call(lambda: scan_changes(history_dir, since), args.repeat):>10.2f} "
+              f"{len(rows):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+파이프라인 핫 패스 마이크로벤치마크
+크롤러 파싱/정규화, 데이터 통합, 가격 비교 함수를 여러 합성 데이터 크기에서 측정하고
+결과를 JSON으로 저장해 커밋 간에 비교합니다.
+
+측정 대상:
+    BaseCrawler.parse_price / normalize_model_data
+    WebScraperBase.clean_price_string / extract_context_window
+    OpenRouterCrawler.convert_openrouter_format
+    DataProcessor.deduplicate_models / calculate_statistics / categorize_models
+    PriceMonitor.compare_prices
+
+측정 방식:
+    - 한 샘플이 --min-time 이상 걸리도록 반복 횟수를 먼저 맞추고(timeit.autorange 방식), 워밍업 1회 후
+      --rounds개 샘플을 GC를 끈 상태로 측정합니다.
+    - 중앙값, 최솟값, IQR, 상대 MAD(중앙값 대비 %)를 항목당 시간(ns/item)으로 보고합니다.
+    - 크롤러 의존성(requests, aiohttp, bs4, playwright)이 없으면 해당 케이스는 건너뜁니다.
+    - 통합/비교 케이스와 OpenRouter 응답은 synthetic_catalog.py의 합성 카탈로그를 사용합니다.
+
+사용법:
+    python benchmarks/bench_hot_paths.py [--sizes 100 1000 10000] [--filter parse] [--rounds 7]
+    python benchmarks/bench_hot_paths.py --save                      # benchmarks/results/<커밋>.json
+    python benchmarks/bench_hot_paths.py --compare benchmarks/results/abc1234.json [--threshold 10]
+"""
+
+import argparse
+import gc
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+BASE_DIR = Path(__file__).parent.parent
+RESULTS_DIR = BASE_DIR / "benchmarks/results"
+sys.path.append(str(BASE_DIR / "scripts"))
+
+from utils.json_codec import load_json, dump_json
+from synthetic_catalog import SyntheticCatalog
+
+DEFAULT_SIZES = (100, 1000, 10000)
+FAMILIES = ('llama-3.1-70b', 'llama-3.1-8b', 'mistral-7b', 'mixtral-8x7b', 'gemma-2-27b', 'qwen-2.5-72b',
+            'gpt', 'claude', 'gemini', 'command', 'grok')
+
+
+# ---- 합성 입력 ----
+
+def price_texts(size: int, rng: random.Random) -> List[str]:
+    templates = ("${:.2f} / 1M tokens", "{:.2f}", "$ {:.3f} per million", "€{:,.2f}", "{:.2f} USD")
+    return [rng.choice(templates).format(rng.uniform(0.01, 2000)) for _ in range(size)]
+
+
+def context_texts(size: int, rng: random.Random) -> List[str]:
+    templates = ("{}K tokens", "{}k", "{}M context", "{:,} tokens", "Context window: {}K")
+    return [rng.choice(templates).format(rng.choice([8, 32, 128, 200, 1000, 2])) for _ in range(size)]
+
+
+def raw_models(size: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """크롤러 fetch_models 형식의 모델"""
+    models = []
+    for i in range(size):
+        family = rng.choice(FAMILIES)
+        models.append({
+            'id': f"{family}-{i}",
+            'name': f"{family.replace('-', ' ').title()} {i}",
+            'description': 'Synthetic model ' * rng.randint(1, 8),
+            'input_price': round(rng.uniform(0, 30), 2),
+            'output_price': round(rng.uniform(0, 120), 2),
+            'context_window': rng.choice([8192, 32768, 128000, 200000, 1000000, 2000000]),
+            'max_output': rng.choice([4096, 8192, 16384]),
+            'features': rng.sample(['chat', 'vision', 'function-calling', 'reasoning', 'code', 'fast'], 3),
+            'status': rng.choice(['ga', 'ga', 'beta', 'preview', 'deprecated'])
+        })
+    return models
+
+
+def synthetic_catalog(size: int, rng: random.Random) -> SyntheticCatalog:
+    providers = min(size, 10)
+    return SyntheticCatalog(providers, size // providers, duplicate_ratio=0.1, seed=rng.randrange(2 ** 32))
+
+
+def openrouter_payload(size: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """OpenRouter /models 응답의 data 항목"""
+    api_payload, _ = synthetic_catalog(size, rng).openrouter(1.0, datetime.now().isoformat())
+    return api_payload['data']
+
+
+def consolidated_models(size: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """DataProcessor.load_provider_data 이후 형식 (중복 계열 포함)"""
+    catalog = synthetic_catalog(size, rng)
+    timestamp = datetime.now().isoformat()
+    return [{**catalog.model(index, timestamp), 'unique_id': catalog.unique_ids[index]}
+            for index in range(len(catalog))]
+
+
+def changed_catalog(models: List[Dict[str, Any]], rng: random.Random, rate: float = 0.05) -> Tuple[Dict, Dict]:
+    """(이전 스냅샷, 현재 consolidated) - rate 비율의 모델 가격 변경"""
+    previous = {'price_snapshot': [
+        {'unique_id': m['unique_id'], 'input_price': m['pricing']['input'], 'output_price': m['pricing']['output']}
+        for m in models
+    ]}
+    current = []
+    for model in models:
+        if rng.random() < rate:
+            model = {**model, 'pricing': {**model['pricing'], 'input': round(model['pricing']['input'] * 0.8, 4)}}
+        current.append(model)
+    return previous, {'models': current}
+
+
+# ---- 케이스 ----
+
+def _crawler_classes():
+    from crawlers.base_crawler import BaseCrawler
+
+    class SyntheticCrawler(BaseCrawler):
+        def fetch_models(self):
+            return []
+
+        def get_model_details(self, model_id):
+            return {}
+
+    return SyntheticCrawler
+
+
+def _scraper_class():
+    from crawlers.web_scraper_base import WebScraperBase
+
+    class SyntheticScraper(WebScraperBase):
+        async def scrape_models(self):
+            return []
+
+        async def scrape_pricing(self):
+            return {}
+
+    return SyntheticScraper
+
+
+def case_parse_price(size, rng):
+    crawler = _crawler_classes()('synthetic')
+    texts = price_texts(size, rng)
+    return lambda: [crawler.parse_price(text) for text in texts]
+
+
+def case_normalize_model_data(size, rng):
+    crawler = _crawler_classes()('synthetic')
+    models = raw_models(size, rng)
+    return lambda: [crawler.normalize_model_data(model) for model in models]
+
+
+def case_clean_price_string(size, rng):
+    scraper = _scraper_class()('synthetic')
+    texts = price_texts(size, rng)
+    return lambda: [scraper.clean_price_string(text) for text in texts]
+
+
+def case_extract_context_window(size, rng):
+    scraper = _scraper_class()('synthetic')
+    texts = context_texts(size, rng)
+    return lambda: [scraper.extract_context_window(text) for text in texts]
+
+
+def case_convert_openrouter_format(size, rng):
+    from crawlers.openrouter_crawler import OpenRouterCrawler
+    crawler = OpenRouterCrawler()
+    payload = openrouter_payload(size, rng)
+    return lambda: [crawler.convert_openrouter_format(model) for model in payload]
+
+
+def case_deduplicate_models(size, rng):
+    from data_processor import DataProcessor
+    processor = DataProcessor()
+    models = consolidated_models(size, rng)
+    return lambda: processor.deduplicate_models(models)
+
+
+def case_calculate_statistics(size, rng):
+    from data_processor import DataProcessor
+    processor = DataProcessor()
+    models = consolidated_models(size, rng)
+    return lambda: processor.calculate_statistics(models)
+
+
+def case_categorize_models(size, rng):
+    from data_processor import DataProcessor
+    processor = DataProcessor()
+    models = consolidated_models(size, rng)
+    return lambda: processor.categorize_models(models)
+
+
+def case_compare_prices(size, rng):
+    from price_monitor import PriceMonitor
+    monitor = PriceMonitor()
+    previous, current = changed_catalog(consolidated_models(size, rng), rng)
+    return lambda: monitor.compare_prices(previous, current)
+
+
+CASES: Dict[str, Callable] = {
+    'BaseCrawler.parse_price': case_parse_price,
+    'BaseCrawler.normalize_model_data': case_normalize_model_data,
+    'WebScraperBase.clean_price_string': case_clean_price_string,
+    'WebScraperBase.extract_context_window': case_extract_context_window,
+    'OpenRouterCrawler.convert_openrouter_format': case_convert_openrouter_format,
+    'DataProcessor.deduplicate_models': case_deduplicate_models,
+    'DataProcessor.calculate_statistics': case_calculate_statistics,
+    'DataProcessor.categorize_models': case_categorize_models,
+    'PriceMonitor.compare_prices': case_compare_prices,
+}
+
+
+# ---- 측정 ----
+
+def calibrate(func: Callable, min_time: float) -> int:
+    """한 샘플이 min_time 이상 걸리는 반복 횟수 (1, 2, 5, 10, 20, ...)"""
+    number = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            loops = number * multiplier
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            if time.perf_counter() - start >= min_time:
+                return loops
+        number *= 10
+
+
+def measure(func: Callable, size: int, rounds: int, min_time: float) -> Dict[str, Any]:
+    """항목당 시간(ns) 통계"""
+    loops = calibrate(func, min_time)
+    func()  # 워밍업
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            samples.append((time.perf_counter() - start) / loops / size * 1e9)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    median = statistics.median(samples)
+    quartiles = statistics.quantiles(samples, n=4) if len(samples) > 1 else [median, median, median]
+    mad = statistics.median(abs(sample - median) for sample in samples)
+    return {
+        'size': size,
+        'loops': loops,
+        'rounds': rounds,
+        'median_ns': round(median, 2),
+        'min_ns': round(min(samples), 2),
+        'iqr_ns': round(quartiles[2] - quartiles[0], 2),
+        'rel_mad_pct': round(mad / median * 100, 2) if median else 0.0
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run_suite(sizes: List[int], rounds: int, min_time: float, name_filter: Optional[str], seed: int) -> Dict[str, Any]:
+    results = {}
+    skipped = {}
+    for name, factory in CASES.items():
+        if name_filter and name_filter.lower() not in name.lower():
+            continue
+        results[name] = []
+        for size in sizes:
+            try:
+                func = factory(size, random.Random(seed))
+            except ImportError as e:
+                skipped[name] = str(e)
+                del results[name]
+                break
+            stats = measure(func, size, rounds, min_time)
+            results[name].append(stats)
+            print(f"   {name:<45} n={size:<7,} {stats['median_ns']:>12,.1f} ns/item "
+                  f"(min {stats['min_ns']:,.1f}, ±{stats['rel_mad_pct']:.1f}%)")
+
+    for name, reason in skipped.items():
+        print(f"   ⏭️ {name}: skipped ({reason})")
+
+    return {
+        'revision': git_revision(),
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': sizes,
+        'results': results,
+        'skipped': skipped
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float):
+    """기준 결과 대비 중앙값 변화 출력 (threshold% 이상이면 표시)"""
+    print(f"\n📊 {current['revision']} vs {baseline.get('revision', '?')} (threshold ±{threshold:.0f}%)")
+    for name, rows in current['results'].items():
+        base_rows = {row['size']: row for row in baseline.get('results', {}).get(name, [])}
+        for row in rows:
+            base = base_rows.get(row['size'])
+            if not base or not base['median_ns']:
+                continue
+            delta = (row['median_ns'] - base['median_ns']) / base['median_ns'] * 100
+            # 두 측정의 잡음보다 작은 변화는 표시하지 않음
+            noise = max(row['rel_mad_pct'], base.get('rel_mad_pct', 0))
+            marker = ''
+            if abs(delta) >= max(threshold, noise * 2):
+                marker = '🔴 slower' if delta > 0 else '🟢 faster'
+            print(f"   {name:<45} n={row['size']:<7,} {base['median_ns']:>10,.1f} → {row['median_ns']:>10,.1f} ns "
+                  f"({delta:+.1f}%) {marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline hot path microbenchmarks")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--rounds', type=int, default=7, help="측정 샘플 수")
+    parser.add_argument('--min-time', type=float, default=0.05, help="샘플당 최소 시간(초)")
+    parser.add_argument('--filter', help="이름에 이 문자열이 포함된 케이스만 실행")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', nargs='?', const='', metavar='PATH',
+                        help="결과 저장 (경로 생략 시 benchmarks/results/<커밋>.json)")
+    parser.add_argument('--compare', type=Path, metavar='PATH', help="비교할 이전 결과 파일")
+    parser.add_argument('--threshold', type=float, default=10.0, help="변화 표시 기준(%%)")
+    args = parser.parse_args()
+
+    print(f"📏 Hot path microbenchmarks: sizes {', '.join(f'{size:,}' for size in args.sizes)}, "
+          f"{args.rounds} rounds")
+    current = run_suite(args.sizes, args.rounds, args.min_time, args.filter, args.seed)
+
+    if args.save is not None:
+        path = Path(args.save) if args.save else RESULTS_DIR / f"{current['revision']}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        dump_json(current, path)
+        print(f"\n💾 Saved results to {path}")
+
+    if args.compare:
+        compare(current, load_json(args.compare), args.threshold)
+
+
+if __name__ == "__main__":
+    main()
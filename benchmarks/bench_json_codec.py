@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+JSON 코덱 벤치마크
+설치된 백엔드별로 openrouter.json, consolidated.json, data/history 전체 스캔의
+로드/덤프 시간을 측정합니다.
+
+사용법:
+    python benchmarks/bench_json_codec.py [--repeat 5]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.append(str(BASE_DIR / "scripts"))
+
+from utils import json_codec
+
+
+def time_call(func, repeat: int) -> float:
+    """repeat회 실행 후 중앙값(ms) 반환"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def bench_file(path: Path, backend: str, repeat: int) -> dict:
+    """단일 파일 로드/덤프 측정"""
+    raw = path.read_bytes()
+    data = json_codec.loads(raw, backend=backend)
+    return {
+        'load_ms': time_call(lambda: json_codec.loads(raw, backend=backend), repeat),
+        'dump_ms': time_call(lambda: json_codec.dumps(data, backend=backend, canonical=False), repeat),
+        'bytes': len(raw)
+    }
+
+
+def bench_history_scan(history_dir: Path, backend: str, repeat: int) -> dict:
+    """data/history 전체 파일 읽기 + 파싱 측정"""
+    files = sorted(history_dir.glob("*.json"))
+
+    def scan():
+        for history_file in files:
+            json_codec.load_json(history_file, backend=backend)
+
+    return {
+        'load_ms': time_call(scan, repeat),
+        'dump_ms': None,
+        'bytes': sum(f.stat().st_size for f in files)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON codec benchmark")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    targets = [
+        ('openrouter.json', BASE_DIR / "data/models/openrouter.json"),
+        ('consolidated.json', BASE_DIR / "data/consolidated.json"),
+    ]
+    history_dir = BASE_DIR / "data/history"
+
+    print(f"📏 JSON codec benchmark (median of {args.repeat} runs)")
+    print(f"{'backend':<10} {'target':<22} {'size':>10} {'load ms':>10} {'dump ms':>10}")
+
+    for backend in json_codec.available_backends():
+        for name, path in targets:
+            if not path.exists():
+                continue
+            result = bench_file(path, backend, args.repeat)
+            print(f"{backend:<10} {name:<22} {result['bytes']:>10} "
+                  f"{result['load_ms']:>10.2f} {result['dump_ms']:>10.2f}")
+
+        if history_dir.exists():
+            result = bench_history_scan(history_dir, backend, args.repeat)
+            print(f"{backend:<10} {'history/*.json scan':<22} {result['bytes']:>10} "
+                  f"{result['load_ms']:>10.2f} {'-':>10}")
+
+
+if __name__ == "__main__":
+    main()
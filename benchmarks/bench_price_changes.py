@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+다중 구간 가격 변경 감지 벤치마크
+합성 가격 배열(날짜 × 모델)에서 1/7/30일 변경 감지 시간을 측정합니다.
+
+사용법:
+    python benchmarks/bench_price_changes.py [--models 100000] [--days 365] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.append(str(BASE_DIR / "scripts"))
+
+from analytics.price_changes import detect_changes, DEFAULT_WINDOWS
+
+
+def synthetic_prices(models: int, days: int, seed: int = 0):
+    """모델별 기본 가격에 드문 가격 변경과 결측(미등록)을 섞은 배열"""
+    rng = np.random.default_rng(seed)
+    base = rng.choice([0.0, 0.1, 0.5, 1.0, 3.0, 15.0], size=models)
+    steps = np.where(rng.random((days, models)) < 0.001, rng.uniform(0.5, 1.5, (days, models)), 1.0)
+    input_prices = base[None, :] * np.cumprod(steps, axis=0)
+    input_prices[rng.random((days, models)) < 0.01] = np.nan
+    output_prices = input_prices * 4
+    dates = [str(np.datetime64('2025-01-01') + day) for day in range(days)]
+    return input_prices, output_prices, dates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Price change detection benchmark")
+    parser.add_argument('--models', type=int, default=100_000)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    input_prices, output_prices, dates = synthetic_prices(args.models, args.days)
+    samples = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        results = detect_changes(input_prices, output_prices, dates, DEFAULT_WINDOWS)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    print(f"📏 Change detection: {args.models:,} models × {args.days} days, "
+          f"windows {', '.join(f'{w}d' for w in DEFAULT_WINDOWS)}")
+    print(f"   - Median: {statistics.median(samples):.1f} ms (min {min(samples):.1f} ms)")
+    for result in results:
+        print(f"   - {result['window']}d: {len(result['changed']):,} changed, {len(result['new']):,} new, "
+              f"{len(result['removed']):,} removed, {len(result['relisted']):,} relisted")
+
+
+if __name__ == "__main__":
+    main()
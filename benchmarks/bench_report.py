@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+가격 변경 리포트 작성 벤치마크
+합성 변경 목록(신규/인상/인하/제외 혼합)으로 리포트 작성 시간과 길이를 측정합니다.
+
+사용법:
+    python benchmarks/bench_report.py [--changes 100000] [--providers 50] [--repeat 5]
+"""
+
+import argparse
+import io
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.append(str(BASE_DIR / "scripts"))
+
+from analytics.report import write_report, ISSUE_BODY_LIMIT
+
+
+def price_move(rng: random.Random, old: float) -> dict:
+    new = round(old * rng.choice([0.5, 0.8, 0.9, 1.1, 1.25, 2.0]), 4)
+    return {'old': old, 'new': new, 'change': new - old, 'change_percent': (new - old) / old * 100}
+
+
+def synthetic_changes(count: int, providers: int, seed: int = 0) -> list:
+    """PriceMonitor.compare_prices 형식의 합성 변경 목록"""
+    rng = random.Random(seed)
+    changes = []
+    for i in range(count):
+        provider = f"provider-{i % providers:03d}"
+        base = {'model_id': f"model-{i}", 'unique_id': f"{provider}/model-{i}",
+                'name': f"Model {i}", 'provider': provider}
+        old = rng.choice([0.1, 0.5, 1.0, 3.0, 15.0])
+        kind = rng.random()
+        if kind < 0.1:
+            changes.append({**base, 'type': 'new', 'input_price': {'new': old}, 'output_price': {'new': old * 4},
+                            'confidence': 1.0, 'anomaly_reasons': [], 'suppressed': False})
+        else:
+            suppressed = kind > 0.95
+            changes.append({**base, 'input_price': price_move(rng, old), 'output_price': price_move(rng, old * 4),
+                            'confidence': 0.1 if suppressed else 1.0,
+                            'anomaly_reasons': ['input: order-of-magnitude change'] if suppressed else [],
+                            'suppressed': suppressed})
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Price change report benchmark")
+    parser.add_argument('--changes', type=int, default=100_000)
+    parser.add_argument('--providers', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    changes = synthetic_changes(args.changes, args.providers)
+    samples = []
+    for _ in range(args.repeat):
+        buffer = io.StringIO()
+        start = time.perf_counter()
+        written = write_report(changes, buffer)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    print(f"📏 Report: {args.changes:,} changes across {args.providers} providers")
+    print(f"   - Median: {statistics.median(samples):.1f} ms (min {min(samples):.1f} ms)")
+    print(f"   - Length: {written['length']:,} / {ISSUE_BODY_LIMIT:,} characters, "
+          f"{written['omitted']} section(s) omitted")
+
+
+if __name__ == "__main__":
+    main()
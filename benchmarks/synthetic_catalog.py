@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+합성 카탈로그 / 히스토리 생성기
+실제 데이터(통합 후 약 50개 모델)로는 보이지 않는 확장성 문제를 재현하기 위해
+저장소와 같은 배치의 데이터 트리를 만듭니다.
+
+<output>/
+    data/models/<provider>.json   - 크롤러 save_data 형식 (provider-000 ...)
+    data/models/openrouter.json   - OpenRouter 크롤러 변환 결과 형식 (id = provider/model-id)
+    data/history/                 - HistoryStore 스냅샷 (어제까지 days일)
+    openrouter_api.json           - OpenRouter /api/v1/models 응답 형식 ($/token 문자열 가격)
+
+- 모델 속성은 열(column) 단위로 보관하고 파일을 쓸 때 모델 dict를 만들므로 100만 모델도 생성할 수 있습니다.
+- 히스토리는 하루마다 change_rate 비율의 모델 가격을 바꾸며 기록하고, 마지막 변경(오늘)은
+  data/models에만 반영됩니다. 따라서 --process로 실행하면 PriceMonitor가 약 change_rate × 모델 수의 변경을 찾습니다.
+- duplicate_ratio 비율의 모델은 DataProcessor.deduplicate_models가 묶는 계열(Llama/Mistral/Gemma/Qwen)에 속합니다.
+- 같은 seed와 설정이면 같은 데이터를 만듭니다.
+
+사용법:
+    python benchmarks/synthetic_catalog.py --scale 10k                       # synthetic_data/10k
+    python benchmarks/synthetic_catalog.py --providers 200 --models-per-provider 500 --days 90 \\
+        --change-rate 0.02 --duplicate-ratio 0.2 --output /tmp/synthetic
+    python benchmarks/synthetic_catalog.py --scale 100k --process            # 생성 후 파이프라인 단계 실행
+    python benchmarks/synthetic_catalog.py --scale 100k --process --profile  # 단계별 cProfile/tracemalloc 기록
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import time
+from array import array
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_OUTPUT_DIR = BASE_DIR / "synthetic_data"
+sys.path.append(str(BASE_DIR / "scripts"))
+
+from utils.json_codec import dump_json
+from history.snapshot_store import HistoryStore
+from history.records import SNAPSHOT_SCHEMA_VERSION
+from utils.profiling import add_profile_argument, enable as enable_profiling
+
+# 규모 프리셋: 이름 -> (제공업체 수, 제공업체당 모델 수)
+SCALES = {
+    '1k': (10, 100),
+    '10k': (50, 200),
+    '100k': (200, 500),
+    '1m': (1000, 1000),
+}
+
+# DataProcessor.deduplicate_models가 같은 그룹으로 묶는 계열: (이름, id)
+FAMILIES = (
+    ('Llama 3.1 405B Instruct', 'llama-3.1-405b-instruct'),
+    ('Llama 3.1 70B Instruct', 'llama-3.1-70b-instruct'),
+    ('Llama 3.1 8B Instruct', 'llama-3.1-8b-instruct'),
+    ('Mistral 7B Instruct', 'mistral-7b-instruct'),
+    ('Gemma 2 27B', 'gemma-2-27b-it'),
+    ('Gemma 2 9B', 'gemma-2-9b-it'),
+    ('Qwen 2.5 72B Instruct', 'qwen-2.5-72b-instruct'),
+    ('Qwen 2.5 7B Instruct', 'qwen-2.5-7b-instruct'),
+)
+# 계열에 속하지 않는 모델 이름 (계열 키워드를 포함하지 않음)
+NAME_WORDS = ('Nova', 'Orion', 'Atlas', 'Zephyr', 'Sage', 'Pulse', 'Vega', 'Echo', 'Lumen', 'Helix', 'Aria', 'Quill')
+NAME_TIERS = ('Mini', 'Lite', 'Pro', 'Ultra', 'Max', 'Flash', 'Turbo', 'Reasoner')
+
+FEATURE_SETS = (
+    ('chat', 'coding', 'analysis'),
+    ('chat', 'fast', 'cost-effective'),
+    ('chat', 'vision', 'function-calling'),
+    ('chat', 'coding', 'reasoning', 'large-context'),
+    ('chat', 'vision', 'reasoning', 'analysis', 'creative-writing'),
+    ('chat', 'multilingual', 'function-calling'),
+    ('embeddings',),
+    ('chat', 'large-context'),
+)
+CONTEXT_WINDOWS = (8192, 32768, 65536, 128000, 131072, 200000, 1000000, 2000000)
+MAX_OUTPUTS = (4096, 8192, 16384, 32768)
+STATUSES = ('ga',) * 7 + ('beta', 'preview', 'deprecated')
+# 가격 변경 배수 (인하가 인상보다 흔함)
+PRICE_FACTORS = (0.5, 0.6, 0.75, 0.8, 0.9, 1.1, 1.2, 1.5)
+FREE_RATIO = 0.02          # 입력/출력 가격이 모두 0인 모델 비율 (DataProcessor가 제외)
+OPENROUTER_MARKUP_RATIO = 0.05  # OpenRouter 가격이 제공업체 가격과 다른 비율
+
+
+def provider_name(index: int) -> str:
+    return f"provider-{index:03d}"
+
+
+def format_token_price(price_per_million: float) -> str:
+    """$/1M tokens -> OpenRouter 형식의 $/token 문자열 ('0.000003')"""
+    text = f"{price_per_million / 1_000_000:.12f}".rstrip('0').rstrip('.')
+    return text or "0"
+
+
+class SyntheticCatalog:
+    """열 단위로 보관하는 합성 모델 카탈로그와 가격 변경 시뮬레이션"""
+
+    def __init__(self, providers: int, models_per_provider: int, duplicate_ratio: float = 0.1, seed: int = 0):
+        self.providers = [provider_name(index) for index in range(providers)]
+        self.rng = random.Random(seed)
+        count = providers * models_per_provider
+
+        self.provider_of = array('I')
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.feature_set = array('B')
+        self.context_window = array('I')
+        self.max_output = array('I')
+        self.status: List[str] = []
+        self.input_price = array('d')
+        self.output_price = array('d')
+
+        rng = self.rng
+        for index in range(count):
+            provider = index // models_per_provider
+            local = index % models_per_provider
+            if rng.random() < duplicate_ratio:
+                family_name, family_id = rng.choice(FAMILIES)
+                # 같은 제공업체 안에서도 id가 겹치지 않도록 변형 번호 부여
+                self.names.append(f"{family_name} v{local}")
+                self.ids.append(f"{family_id}-v{local}")
+            else:
+                word, tier = rng.choice(NAME_WORDS), rng.choice(NAME_TIERS)
+                self.names.append(f"{word} {tier} {local // len(NAME_TIERS) + 1}")
+                self.ids.append(f"{word.lower()}-{tier.lower()}-{local}")
+            self.provider_of.append(provider)
+            self.feature_set.append(rng.randrange(len(FEATURE_SETS)))
+            self.context_window.append(rng.choice(CONTEXT_WINDOWS))
+            self.max_output.append(rng.choice(MAX_OUTPUTS))
+            self.status.append(rng.choice(STATUSES))
+
+            if rng.random() < FREE_RATIO:
+                input_price = output_price = 0.0
+            else:
+                # 0.05 ~ 60 $/1M tokens 로그 균등 분포, 출력은 입력의 1~5배
+                input_price = round(10 ** rng.uniform(-1.3, 1.78), 4)
+                output_price = round(input_price * rng.choice((1, 2, 3, 4, 5)), 4)
+            self.input_price.append(input_price)
+            self.output_price.append(output_price)
+
+        self.unique_ids = [f"{self.providers[p]}/{model_id}" for p, model_id in zip(self.provider_of, self.ids)]
+        self.sorted_order = sorted(range(count), key=self.unique_ids.__getitem__)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # ---- 가격 변경 ----
+
+    def step(self, change_rate: float) -> int:
+        """change_rate 비율의 유료 모델 가격 변경 후 변경 수 반환"""
+        rng = self.rng
+        count = int(round(len(self) * change_rate))
+        for index in rng.sample(range(len(self)), count):
+            factor = rng.choice(PRICE_FACTORS)
+            target = rng.random()
+            # 70%는 입력/출력을 함께, 나머지는 한쪽만 변경
+            if target < 0.85:
+                self.input_price[index] = round(max(self.input_price[index] * factor, 0.0001), 4) \
+                    if self.input_price[index] else 0.0
+            if target >= 0.15:
+                self.output_price[index] = round(max(self.output_price[index] * factor, 0.0001), 4) \
+                    if self.output_price[index] else 0.0
+        return count
+
+    # ---- 출력 형식 ----
+
+    def price_records(self) -> Iterator[Dict[str, Any]]:
+        """unique_id 순 가격 레코드 (history.records.sorted_records 형식)"""
+        for index in self.sorted_order:
+            yield {
+                'unique_id': self.unique_ids[index],
+                'id': self.ids[index],
+                'name': self.names[index],
+                'provider': self.providers[self.provider_of[index]],
+                'input_price': self.input_price[index],
+                'output_price': self.output_price[index],
+                'context_window': self.context_window[index],
+                'status': self.status[index]
+            }
+
+    def model(self, index: int, timestamp: str) -> Dict[str, Any]:
+        """크롤러 normalize_model_data 형식의 모델"""
+        features = list(FEATURE_SETS[self.feature_set[index]])
+        return {
+            'id': self.ids[index],
+            'name': self.names[index],
+            'provider': self.providers[self.provider_of[index]],
+            'description': f"Synthetic {self.names[index]} model for {', '.join(features)}",
+            'pricing': {'input': self.input_price[index], 'output': self.output_price[index], 'unit': '1M tokens'},
+            'context_window': self.context_window[index],
+            'max_output': self.max_output[index],
+            'release_date': '',
+            'status': self.status[index],
+            'features': features,
+            'modalities': ['text', 'image'] if 'vision' in features else ['text'],
+            'use_cases': [],
+            'training_cutoff': '',
+            'last_updated': timestamp
+        }
+
+    def provider_files(self, timestamp: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """(제공업체, 크롤러 save_data 형식 데이터)"""
+        models = {provider: [] for provider in self.providers}
+        for index in range(len(self)):
+            models[self.providers[self.provider_of[index]]].append(self.model(index, timestamp))
+        for provider in self.providers:
+            title = provider.replace('-', ' ').title()
+            yield provider, {
+                'provider': provider,
+                'provider_info': {
+                    'name': title,
+                    'website': f"https://{provider}.example.com",
+                    'api_endpoint': f"https://api.{provider}.example.com/v1"
+                },
+                'last_updated': timestamp,
+                'models': models.pop(provider)
+            }
+
+    def openrouter(self, ratio: float, timestamp: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """(OpenRouter API 응답, data/models/openrouter.json) - ratio 비율의 모델을 재판매"""
+        rng = self.rng
+        api_models, models = [], []
+        for index in sorted(rng.sample(range(len(self)), int(round(len(self) * ratio)))):
+            markup = 1.1 if rng.random() < OPENROUTER_MARKUP_RATIO else 1.0
+            input_price = round(self.input_price[index] * markup, 4)
+            output_price = round(self.output_price[index] * markup, 4)
+            provider = self.providers[self.provider_of[index]]
+            model_id = self.unique_ids[index]
+            name = f"{provider.replace('-', ' ').title()}: {self.names[index]}"
+            features = list(FEATURE_SETS[self.feature_set[index]])
+            modality = 'text+image->text' if 'vision' in features else 'text->text'
+            api_models.append({
+                'id': model_id,
+                'name': name,
+                'created': 1720000000 + index,
+                'description': f"Synthetic {self.names[index]} served through OpenRouter",
+                'context_length': self.context_window[index],
+                'architecture': {'modality': modality, 'tokenizer': 'Other', 'instruct_type': None},
+                'pricing': {'prompt': format_token_price(input_price),
+                            'completion': format_token_price(output_price),
+                            'image': '0', 'request': '0'},
+                'top_provider': {'context_length': self.context_window[index],
+                                 'max_completion_tokens': self.max_output[index], 'is_moderated': False},
+                'per_request_limits': None
+            })
+            models.append({
+                **self.model(index, timestamp),
+                'id': model_id,
+                'name': name,
+                'provider': 'openrouter',
+                'pricing': {'input': input_price, 'output': output_price, 'unit': '1M tokens'}
+            })
+        file_data = {
+            'provider': 'openrouter',
+            'provider_info': {'name': 'OpenRouter', 'website': 'https://openrouter.ai',
+                              'api_endpoint': 'https://openrouter.ai/api/v1'},
+            'last_updated': timestamp,
+            'models': models
+        }
+        return {'data': api_models}, file_data
+
+
+def generate(output_dir: Path, providers: int, models_per_provider: int, days: int = 30,
+             change_rate: float = 0.01, duplicate_ratio: float = 0.1, openrouter_ratio: float = 0.3,
+             seed: int = 0, today: Optional[datetime] = None) -> Dict[str, Any]:
+    """합성 데이터 트리 생성 후 통계 반환"""
+    today = today or datetime.now()
+    data_dir = output_dir / "data"
+    models_dir = data_dir / "models"
+    models_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    catalog = SyntheticCatalog(providers, models_per_provider, duplicate_ratio, seed)
+
+    # 어제까지 days일의 스냅샷 (첫날은 초기 가격)
+    store = HistoryStore(data_dir / "history")
+    changes = 0
+    for offset in range(days, 0, -1):
+        if offset != days:
+            changes += catalog.step(change_rate)
+        date = (today - timedelta(days=offset)).strftime("%Y-%m-%d")
+        with store.open_snapshot(date, {'date': date, 'timestamp': f"{date}T00:00:00"}) as writer:
+            writer.write_field('schema_version', SNAPSHOT_SCHEMA_VERSION)
+            writer.write_array('price_snapshot', catalog.price_records())
+
+    # 오늘 가격은 크롤러 출력에만 반영
+    changes_today = catalog.step(change_rate) if days else 0
+    timestamp = today.isoformat()
+    for provider, file_data in catalog.provider_files(timestamp):
+        dump_json(file_data, models_dir / f"{provider}.json")
+
+    api_payload, openrouter_file = catalog.openrouter(openrouter_ratio, timestamp)
+    dump_json(openrouter_file, models_dir / "openrouter.json")
+    dump_json(api_payload, output_dir / "openrouter_api.json")
+
+    return {
+        'models': len(catalog),
+        'providers': providers,
+        'days': days,
+        'history_changes': changes,
+        'changes_today': changes_today,
+        'openrouter_models': len(openrouter_file['models']),
+        'seconds': round(time.perf_counter() - start, 2)
+    }
+
+
+def process(output_dir: Path) -> Optional[Dict[str, Any]]:
+    """생성한 트리에서 워크플로 순서대로 시계열 동기화 / 데이터 통합 / 가격 모니터링 실행"""
+    os.environ['PIPELINE_RUN_DIR'] = str(output_dir / "run_reports")
+    from utils.run_metrics import stage, write_run_report
+    from history.timeseries import TimeSeriesStore
+    from data_processor import DataProcessor
+    from price_monitor import PriceMonitor
+
+    history_dir = output_dir / "data/history"
+    with stage('timeseries'):
+        TimeSeriesStore(history_dir).sync()
+    DataProcessor(base_dir=output_dir).run()
+    # 워크플로처럼 오늘 스냅샷까지 시계열에 반영한 뒤 모니터링
+    with stage('timeseries'):
+        TimeSeriesStore(history_dir).sync()
+    with stage('monitor'):
+        PriceMonitor(base_dir=output_dir).run()
+    return write_run_report()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic catalogue and history generator")
+    parser.add_argument('--scale', choices=list(SCALES), help="규모 프리셋 (제공업체 수 × 모델 수)")
+    parser.add_argument('--providers', type=int, help="제공업체 수")
+    parser.add_argument('--models-per-provider', type=int, help="제공업체당 모델 수")
+    parser.add_argument('--days', type=int, default=30, help="히스토리 일수")
+    parser.add_argument('--change-rate', type=float, default=0.01, help="하루에 가격이 바뀌는 모델 비율")
+    parser.add_argument('--duplicate-ratio', type=float, default=0.1, help="중복 계열에 속하는 모델 비율")
+    parser.add_argument('--openrouter-ratio', type=float, default=0.3, help="OpenRouter에도 있는 모델 비율")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, help="출력 디렉토리 (기본: synthetic_data/<규모>)")
+    parser.add_argument('--force', action='store_true', help="기존 출력의 data/ 삭제 후 생성")
+    parser.add_argument('--process', action='store_true', help="생성 후 파이프라인 단계 실행")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    providers, per_provider = SCALES[args.scale or '10k']
+    providers = args.providers or providers
+    per_provider = args.models_per_provider or per_provider
+    output_dir = args.output or DEFAULT_OUTPUT_DIR / (args.scale or f"{providers}x{per_provider}")
+
+    if (output_dir / "data").exists():
+        if not args.force:
+            print(f"❌ {output_dir / 'data'} already exists (use --force to replace it)")
+            sys.exit(1)
+        shutil.rmtree(output_dir / "data")
+
+    print(f"🧪 Generating {providers * per_provider:,} models ({providers} providers × {per_provider}), "
+          f"{args.days} days → {output_dir}")
+    stats = generate(output_dir, providers, per_provider, args.days, args.change_rate,
+                     args.duplicate_ratio, args.openrouter_ratio, args.seed)
+    print(f"✅ Generated in {stats['seconds']}s")
+    print(f"   - Price changes: {stats['history_changes']:,} in history, {stats['changes_today']:,} today")
+    print(f"   - OpenRouter models: {stats['openrouter_models']:,}")
+
+    if args.process:
+        if args.profile:
+            enable_profiling(args.profile)
+        print("\n⚙️ Running pipeline stages on synthetic data...")
+        report = process(output_dir)
+        if report:
+            for total in report['summary']:
+                print(f"   - {total['stage']}: {total['wall_seconds']:.2f}s wall, "
+                      f"{total['peak_rss_bytes'] / 1_048_576:,.0f} MB peak RSS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+가격 변경 이상치 점수
+스크레이퍼가 하드코딩된 대체 데이터나 정규식으로 잘못 읽은 숫자를 실제 가격 변경과 구분하기 위해
+감지된 변경마다 신뢰도(0~1, 실제 변경일 가능성)를 매깁니다.
+
+모델별 가격 이력(로그 가격)에서 벡터화하여 계산하는 지표:
+    level_z     - 새 가격이 최근 이력 중앙값에서 떨어진 정도 (MAD 단위)
+    jump_z      - 이번 변동폭 / 모델의 평소 일간 변동성 (일간 로그 수익률의 MAD)
+    magnitude   - |log10(새 가격 / 이전 가격)|, 단위 착오(1K/1M 토큰)는 1 이상
+
+교차 검증:
+    provider_pricing에 있는 다른 제공업체 가격, OpenRouter에 같은 unique_id로 등록된 모델 가격과
+    새 가격이 일치하면 실제 변경으로 봅니다. 이전 가격만 일치하는 경우는 참조 가격이 아직 갱신되지 않았을 수 있으므로
+    변동폭이 모델의 평소 변동성을 크게 벗어날 때만 잘못 읽은 값 쪽으로 감점합니다.
+
+신뢰도가 SUPPRESS_BELOW 미만인 변경은 알림 리포트에서 제외하고 별도 목록으로 보고합니다.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 점수 없이 모든 변경을 그대로 보고
+    np = None
+
+from utils.json_codec import load_json
+
+HISTORY_WINDOW = 90          # 이력 지표 계산에 사용하는 최근 행 수
+MAD_SCALE = 1.4826           # 정규분포 기준 MAD -> 표준편차 환산
+VOLATILITY_FLOOR = 0.25      # 최소 변동성 (로그 기준 약 28%, 가격이 고정된 모델의 일반적인 인하/인상 허용)
+JUMP_LIMIT = 6.0             # 평소 변동성 대비 이 배수를 넘으면 감점 시작
+MAGNITUDE_LIMIT = 0.9        # log10 기준 약 8배 이상 변동은 단위 착오 의심
+REFERENCE_TOLERANCE = 0.1    # 교차 검증 가격 일치 허용 오차 (10%)
+STALE_REFERENCE_JUMP = 2.0   # 평소 변동성의 이 배수 이내 변동은 이전 가격과 일치하는 참조 가격으로 감점하지 않음
+SUPPRESS_BELOW = 0.5         # 이 신뢰도 미만은 리포트에서 제외
+
+PRICE_FIELDS = ('input_price', 'output_price')
+
+
+def _log_prices(prices: 'np.ndarray') -> 'np.ndarray':
+    """0 이하/결측은 NaN인 로그 가격"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(prices > 0, np.log(prices), np.nan)
+
+
+def _nanmedian(values: 'np.ndarray') -> 'np.ndarray':
+    """열 전체가 NaN이어도 경고 없이 NaN을 반환하는 열별 중앙값"""
+    result = np.full(values.shape[1], np.nan)
+    valid = ~np.isnan(values).all(axis=0)
+    if valid.any():
+        result[valid] = np.nanmedian(values[:, valid], axis=0)
+    return result
+
+
+def history_statistics(prices: 'np.ndarray', end_row: int, window: int = HISTORY_WINDOW,
+                       columns: Optional['np.ndarray'] = None) -> Dict[str, 'np.ndarray']:
+    """end_row까지 최근 window행의 모델별 로그 가격 중앙값/MAD와 일간 변동성 (columns: 일부 모델만)"""
+    start = max(0, end_row + 1 - window)
+    rows = prices[start:end_row + 1]
+    if columns is not None:
+        rows = rows[:, columns]
+    logs = _log_prices(np.asarray(rows, dtype=float))
+    median = _nanmedian(logs)
+    mad = _nanmedian(np.abs(logs - median))
+
+    returns = np.diff(logs, axis=0)
+    if len(returns):
+        volatility = MAD_SCALE * _nanmedian(np.abs(returns - _nanmedian(returns)))
+    else:
+        volatility = np.full(logs.shape[1], np.nan)
+    return {
+        'median': median,
+        'spread': np.fmax(np.nan_to_num(MAD_SCALE * mad, nan=0.0), VOLATILITY_FLOOR),
+        'volatility': np.fmax(np.nan_to_num(volatility, nan=0.0), VOLATILITY_FLOOR)
+    }
+
+
+def load_references(current: Dict[str, Any], openrouter_file: Optional[Path] = None) -> Dict[str, List[Tuple[str, float, float]]]:
+    """unique_id -> [(출처, 입력 가격, 출력 가격)] 교차 검증용 가격"""
+    references = {}
+    for model in (current or {}).get('models', []):
+        unique_id = model.get('unique_id') or f"{model['provider']}/{model['id']}"
+        for provider, pricing in (model.get('provider_pricing') or {}).items():
+            if provider != model.get('provider'):
+                references.setdefault(unique_id, []).append(
+                    (provider, pricing.get('input', 0), pricing.get('output', 0))
+                )
+
+    if openrouter_file and Path(openrouter_file).exists():
+        for model in load_json(openrouter_file).get('models', []):
+            pricing = model.get('pricing', {})
+            if pricing.get('input', 0) > 0 or pricing.get('output', 0) > 0:
+                references.setdefault(model['id'], []).append(
+                    ('openrouter', pricing.get('input', 0), pricing.get('output', 0))
+                )
+    return references
+
+
+def _matches(value: float, reference: float) -> bool:
+    if reference == 0 or value == 0:
+        return reference == value
+    return abs(value - reference) / reference <= REFERENCE_TOLERANCE
+
+
+def score_changes(changes: List[Dict[str, Any]], input_prices: Optional['np.ndarray'] = None,
+                  output_prices: Optional['np.ndarray'] = None, ordinals: Optional[Dict[str, int]] = None,
+                  end_row: Optional[int] = None,
+                  references: Optional[Dict[str, List[Tuple[str, float, float]]]] = None) -> List[Dict[str, Any]]:
+    """가격 변경(PriceMonitor.compare_prices 형식)에 confidence / anomaly_reasons / suppressed 추가
+
+    input_prices/output_prices: (days, models) 가격 배열, end_row: 이전 가격이 기록된 마지막 행
+    """
+    references = references or {}
+    scored = [change for change in changes if change.get('type') != 'new']
+    for change in changes:
+        change.setdefault('confidence', 1.0)
+        change.setdefault('anomaly_reasons', [])
+        change.setdefault('suppressed', False)
+    if not scored or np is None:
+        return changes
+
+    count = len(scored)
+    confidence = np.ones(count)
+    largest_jump = np.zeros(count)
+    reasons = [[] for _ in range(count)]
+
+    # 변경별 이력 지표 (모델이 배열에 없으면 최소 변동성 기준)
+    have_history = input_prices is not None and end_row is not None and end_row >= 0 and ordinals
+    positions = np.array([
+        ordinals.get(change.get('unique_id'), -1) if have_history else -1 for change in scored
+    ])
+    known = positions >= 0
+
+    for field, prices in zip(PRICE_FIELDS, (input_prices, output_prices)):
+        old = np.array([change[field]['old'] for change in scored], dtype=float)
+        new = np.array([change[field]['new'] for change in scored], dtype=float)
+        moved = old != new
+
+        median = np.full(count, np.nan)
+        spread = np.full(count, VOLATILITY_FLOOR)
+        volatility = np.full(count, VOLATILITY_FLOOR)
+        if have_history and known.any():
+            stats = history_statistics(prices, end_row, columns=positions[known])
+            median[known] = stats['median']
+            spread[known] = stats['spread']
+            volatility[known] = stats['volatility']
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_old, log_new = _log_prices(old), _log_prices(new)
+            jump_z = np.abs(log_new - log_old) / volatility
+            level_z = np.abs(log_new - median) / spread
+            magnitude = np.abs(log_new - log_old) / np.log(10)
+        largest_jump = np.fmax(largest_jump, np.where(moved, np.nan_to_num(jump_z, nan=np.inf), 0.0))
+
+        # 이전 가격과 이력 중앙값 모두에서 크게 벗어난 변동만 한계를 넘는 만큼 감점
+        # (잘못 읽은 값이 중앙값으로 되돌아오는 변경은 감점하지 않음)
+        excess = np.nan_to_num(np.fmin(jump_z, level_z) - JUMP_LIMIT, nan=0.0)
+        unusual = moved & (excess > 0)
+        confidence[unusual] /= 1.0 + excess[unusual] / JUMP_LIMIT
+
+        order = moved & (np.nan_to_num(magnitude, nan=0.0) >= MAGNITUDE_LIMIT)
+        confidence[order] *= 0.3
+
+        dropped = moved & (new <= 0) & (old > 0)
+        confidence[dropped] *= 0.4
+
+        label = field.split('_')[0]
+        for i in np.flatnonzero(unusual):
+            reasons[i].append(f"{label}: unusual jump ({jump_z[i]:.1f}× typical volatility)")
+        for i in np.flatnonzero(order):
+            reasons[i].append(f"{label}: order-of-magnitude change (×{new[i] / old[i]:g})")
+        for i in np.flatnonzero(dropped):
+            reasons[i].append(f"{label}: dropped to zero")
+
+    # 출력 가격이 입력 가격보다 낮아진 경우 (필드 뒤바뀜 의심)
+    for i, change in enumerate(scored):
+        before = change['output_price']['old'] >= change['input_price']['old']
+        after = change['output_price']['new'] >= change['input_price']['new']
+        if before and not after:
+            confidence[i] *= 0.4
+            reasons[i].append("output price fell below input price")
+
+    # 교차 검증 가격
+    for i, change in enumerate(scored):
+        for source, ref_input, ref_output in references.get(change.get('unique_id'), []):
+            new_match = (_matches(change['input_price']['new'], ref_input)
+                         and _matches(change['output_price']['new'], ref_output))
+            old_match = (_matches(change['input_price']['old'], ref_input)
+                         and _matches(change['output_price']['old'], ref_output))
+            if new_match:
+                confidence[i] = max(confidence[i], 0.9)
+                reasons[i].append(f"new price matches {source}")
+                break
+            if old_match:
+                # 참조 가격이 늦게 갱신되는 경우가 많으므로 평소 범위 안의 변경은 감점하지 않음
+                if largest_jump[i] > STALE_REFERENCE_JUMP:
+                    confidence[i] *= 0.7
+                    reasons[i].append(f"previous price still matches {source}")
+                break
+
+    for i, change in enumerate(scored):
+        change['confidence'] = round(float(confidence[i]), 3)
+        change['anomaly_reasons'] = reasons[i]
+        change['suppressed'] = bool(confidence[i] < SUPPRESS_BELOW)
+    return changes
+
+
+def score_with_history(changes: List[Dict[str, Any]], arrays: Optional[Any], end_date: Optional[str],
+                       references: Optional[Dict[str, List[Tuple[str, float, float]]]] = None) -> List[Dict[str, Any]]:
+    """HistoryArrays(없으면 None)의 end_date까지 이력으로 score_changes 실행"""
+    if arrays is None or not arrays.dates or end_date is None:
+        return score_changes(changes, references=references)
+
+    end_row = arrays.date_slice(end=end_date).stop - 1
+    return score_changes(
+        changes,
+        arrays.array('input_price'),
+        arrays.array('output_price'),
+        arrays.store.ordinals(),
+        end_row,
+        references
+    )
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+다중 구간 가격 변경 감지 (벡터화)
+가격 시계열 배열(날짜 × 모델)에서 1/7/30일 전 대비 변경을 모든 모델에 대해 한 번에 계산합니다.
+
+구간별 결과:
+    changed   - 두 시점 모두 있고 입력 또는 출력 가격이 바뀐 모델
+    new       - 지금 있고 기준 시점까지 한 번도 없던 모델
+    removed   - 기준 시점에 있고 지금 없는 모델
+    relisted  - 기준 시점에는 없었지만 그 이전에 있었고 지금 다시 있는 모델
+
+기준 시점은 마지막 날짜에서 구간 일수만큼 이전 날짜 이하의 가장 최근 스냅샷입니다
+(압축된 히스토리처럼 날짜가 비어 있어도 동작).
+
+사용법:
+    python scripts/analytics/price_changes.py [--windows 1,7,30] [--top 10]
+"""
+
+import argparse
+import sys
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 사용할 수 없음 (HistoryArrays.open()도 None)
+    np = None
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from history.array_reader import HistoryArrays
+
+DEFAULT_WINDOWS = (1, 7, 30)
+
+
+def base_row(dates: Sequence[str], end_row: int, days: int) -> Optional[int]:
+    """end_row 날짜에서 days일 이전 날짜 이하의 가장 최근 행 (없으면 None)"""
+    target = (datetime.strptime(dates[end_row], "%Y-%m-%d") - timedelta(days=days)).strftime("%Y-%m-%d")
+    position = bisect_right(dates, target, 0, end_row) - 1
+    return position if position >= 0 else None
+
+
+def percent_change(now: 'np.ndarray', then: 'np.ndarray') -> 'np.ndarray':
+    """(now - then) / then * 100, 기준 가격이 0이거나 없으면 NaN"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(then > 0, (now - then) / then * 100.0, np.nan)
+
+
+def detect_changes(input_prices: 'np.ndarray', output_prices: 'np.ndarray', dates: Sequence[str],
+                   windows: Sequence[int] = DEFAULT_WINDOWS, end_row: Optional[int] = None) -> List[Dict[str, Any]]:
+    """구간별 가격 변경 / 신규 / 제거 / 재등록 모델 ordinal과 변동률
+
+    input_prices, output_prices: (days, models) 배열, 모델이 없는 날은 NaN
+    """
+    if end_row is None:
+        end_row = len(dates) - 1
+    if end_row < 0:
+        return []
+
+    now_in = np.asarray(input_prices[end_row])
+    now_out = np.asarray(output_prices[end_row])
+    present_now = ~np.isnan(now_in)
+
+    # 모델별 처음 관측 행 (한 번도 없으면 end_row + 1): 신규/재등록 구분에 사용
+    present = ~np.isnan(np.asarray(input_prices[:end_row + 1]))
+    first_seen = np.where(present.any(axis=0), present.argmax(axis=0), end_row + 1)
+
+    results = []
+    for days in windows:
+        row = base_row(dates, end_row, days)
+        if row is None:
+            continue
+        then_in = np.asarray(input_prices[row])
+        then_out = np.asarray(output_prices[row])
+        present_then = ~np.isnan(then_in)
+        both = present_now & present_then
+        changed = both & ((now_in != then_in) | (now_out != then_out))
+        appeared = present_now & ~present_then
+
+        results.append({
+            'window': days,
+            'date': dates[end_row],
+            'base_date': dates[row],
+            'changed': np.flatnonzero(changed),
+            'new': np.flatnonzero(appeared & (first_seen > row)),
+            'relisted': np.flatnonzero(appeared & (first_seen < row)),
+            'removed': np.flatnonzero(present_then & ~present_now),
+            'input_change_pct': percent_change(now_in, then_in),
+            'output_change_pct': percent_change(now_out, then_out),
+            'input_then': then_in,
+            'input_now': now_in,
+            'output_then': then_out,
+            'output_now': now_out
+        })
+    return results
+
+
+def top_moves(result: Dict[str, Any], limit: int = 10) -> 'np.ndarray':
+    """변동률 절댓값(입력/출력 중 큰 값) 기준 상위 변경 모델 ordinal"""
+    changed = result['changed']
+    if not len(changed):
+        return changed
+    moves = np.fmax(np.abs(result['input_change_pct'][changed]), np.abs(result['output_change_pct'][changed]))
+    moves = np.nan_to_num(moves, nan=np.inf)  # 0에서 유료로 바뀐 경우 가장 큰 변동으로 취급
+    order = np.argsort(-moves, kind='stable')
+    return changed[order[:limit]]
+
+
+def change_records(result: Dict[str, Any], unique_ids: Sequence[str],
+                   ordinals: Optional[Sequence[int]] = None) -> List[Dict[str, Any]]:
+    """변경 모델을 리포트용 레코드로 변환"""
+    records = []
+    for ordinal in (result['changed'] if ordinals is None else ordinals):
+        ordinal = int(ordinal)
+        records.append({
+            'unique_id': unique_ids[ordinal],
+            'input_price': {
+                'old': float(result['input_then'][ordinal]),
+                'new': float(result['input_now'][ordinal]),
+                'change_percent': float(result['input_change_pct'][ordinal])
+            },
+            'output_price': {
+                'old': float(result['output_then'][ordinal]),
+                'new': float(result['output_now'][ordinal]),
+                'change_percent': float(result['output_change_pct'][ordinal])
+            }
+        })
+    return records
+
+
+def detect_history_changes(arrays: HistoryArrays,
+                           windows: Sequence[int] = DEFAULT_WINDOWS) -> List[Dict[str, Any]]:
+    """히스토리 배열의 마지막 날짜 기준 구간별 변경"""
+    return detect_changes(arrays.array('input_price'), arrays.array('output_price'), arrays.dates, windows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-window price change detection")
+    parser.add_argument('--history-dir', type=Path, default=None)
+    parser.add_argument('--windows', default=','.join(map(str, DEFAULT_WINDOWS)), help="구간 일수 (쉼표 구분)")
+    parser.add_argument('--top', type=int, default=10, help="구간별 출력할 상위 변경 수")
+    args = parser.parse_args()
+
+    arrays = HistoryArrays.open(args.history_dir)
+    if arrays is None:
+        print("❌ No price arrays found (run scripts/history/timeseries.py sync)")
+        return 1
+
+    windows = [int(value) for value in args.windows.split(',') if value.strip()]
+    unique_ids = arrays.unique_ids
+    for result in detect_history_changes(arrays, windows):
+        print(f"📆 {result['window']}d ({result['base_date']} → {result['date']}): "
+              f"{len(result['changed'])} changed, {len(result['new'])} new, "
+              f"{len(result['removed'])} removed, {len(result['relisted'])} relisted")
+        for record in change_records(result, unique_ids, top_moves(result, args.top)):
+            print(f"   {record['unique_id']}: ${record['input_price']['old']} → ${record['input_price']['new']} "
+                  f"({record['input_price']['change_percent']:+.1f}%), "
+                  f"${record['output_price']['old']} → ${record['output_price']['new']} "
+                  f"({record['output_price']['change_percent']:+.1f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+가격 변경 리포트 작성기
+PriceMonitor 변경 목록을 마크다운으로 버퍼나 파일에 바로 씁니다.
+
+- 요약 표(전체/제공업체별 건수)를 먼저 쓰고, 상세 목록은 상위 N개만 씁니다.
+- 섹션 순서: 요약, 제공업체별 건수, 최대 인상/인하, 신규 모델, 제외된 변경, 제공업체별 상세, appendix
+- 상세 변경은 제공업체별로 묶고, 각 그룹은 변동폭이 큰 순서로 per_provider개까지만 씁니다.
+- 전체 길이가 limit(기본: GitHub 이슈 본문 최대 길이)를 넘으면 이후 섹션을 생략하고 안내 문구를 남깁니다.
+
+변경 목록은 한 번만 순회하며 제공업체별 건수와 상위 N개 힙을 만들므로,
+리포트 크기는 변경 수가 아니라 top_n / per_provider / limit에 비례합니다.
+"""
+
+import heapq
+import io
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Any, Iterable, Optional, TextIO
+
+ISSUE_BODY_LIMIT = 65536     # GitHub 이슈 본문 최대 문자 수
+DEFAULT_TOP_N = 20
+DEFAULT_PER_PROVIDER = 10
+
+TRUNCATION_NOTICE = "\n---\n_Report truncated to {limit:,} characters: {omitted} section(s) omitted. " \
+                    "See the event log for the full list._\n"
+# 안내 문구를 위해 항상 남겨두는 길이
+NOTICE_RESERVE = 200
+
+
+def change_magnitude(change: Dict[str, Any]) -> float:
+    """입력/출력 가격 변동률 중 큰 절댓값 (%)"""
+    return max(abs(change['input_price'].get('change_percent', 0)),
+               abs(change['output_price'].get('change_percent', 0)))
+
+
+def is_increase(change: Dict[str, Any]) -> bool:
+    return change['input_price']['change'] > 0 or change['output_price']['change'] > 0
+
+
+def format_price_move(price: Dict[str, Any]) -> str:
+    """'$old → $new (+x.xx, +y.y%)' (변동이 없으면 '-')"""
+    if price.get('change', 0) == 0:
+        return "-"
+    return f"${price['old']} → ${price['new']} ({price['change']:+.2f}, {price['change_percent']:+.1f}%)"
+
+
+def change_row(change: Dict[str, Any]) -> str:
+    return (f"| {change['name']} | {change['provider']} | {format_price_move(change['input_price'])} | "
+            f"{format_price_move(change['output_price'])} | {change.get('confidence', 1.0):.2f} |\n")
+
+
+CHANGE_TABLE_HEADER = ("| Model | Provider | Input | Output | Confidence |\n"
+                       "|-------|----------|-------|--------|------------|\n")
+
+
+class ReportWriter:
+    """길이 제한이 있는 마크다운 스트림
+
+    섹션 단위로 쓰며, 섹션 하나가 남은 길이에 들어가지 않으면 그 섹션부터 모두 생략합니다.
+    """
+
+    def __init__(self, stream: TextIO, limit: int = ISSUE_BODY_LIMIT):
+        self.stream = stream
+        self.limit = limit
+        self.length = 0
+        self.omitted = 0
+
+    def section(self, lines: Iterable[str]) -> bool:
+        """섹션 쓰기 (이미 생략이 시작됐거나 길이를 넘으면 False)"""
+        text = ''.join(lines)
+        if self.omitted or self.length + len(text) > self.limit - NOTICE_RESERVE:
+            self.omitted += 1
+            return False
+        self.stream.write(text)
+        self.length += len(text)
+        return True
+
+    def close(self):
+        if self.omitted:
+            notice = TRUNCATION_NOTICE.format(limit=self.limit, omitted=self.omitted)
+            self.stream.write(notice)
+            self.length += len(notice)
+
+
+def _summarize(changes: Iterable[Dict[str, Any]], top_n: int, per_provider: int) -> Dict[str, Any]:
+    """변경 목록 한 번 순회로 건수와 상위 N개 후보 수집"""
+    counts = defaultdict(lambda: {'new': 0, 'increases': 0, 'decreases': 0, 'suppressed': 0})
+    increases, decreases, new_models, suppressed = [], [], [], []
+    by_provider = defaultdict(list)
+    sequence = 0
+
+    def push(heap, limit, key, change):
+        # (key, 순번, 변경) - 같은 key면 먼저 나온 변경 우선
+        item = (key, -sequence, change)
+        if len(heap) < limit:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    for change in changes:
+        sequence += 1
+        provider = change['provider']
+        if change.get('suppressed'):
+            counts[provider]['suppressed'] += 1
+            push(suppressed, top_n, -change.get('confidence', 0), change)
+        elif change.get('type') == 'new':
+            counts[provider]['new'] += 1
+            push(new_models, top_n, 0, change)
+        else:
+            magnitude = change_magnitude(change)
+            if is_increase(change):
+                counts[provider]['increases'] += 1
+                push(increases, top_n, magnitude, change)
+            else:
+                counts[provider]['decreases'] += 1
+                push(decreases, top_n, magnitude, change)
+            push(by_provider[provider], per_provider, magnitude, change)
+
+    ordered = lambda heap: [item[2] for item in sorted(heap, reverse=True)]
+    return {
+        'counts': dict(sorted(counts.items())),
+        'increases': ordered(increases),
+        'decreases': ordered(decreases),
+        'new': ordered(new_models),
+        'suppressed': ordered(suppressed),
+        'by_provider': {provider: ordered(heap) for provider, heap in sorted(by_provider.items())}
+    }
+
+
+def write_report(changes: Iterable[Dict[str, Any]], stream: TextIO, limit: int = ISSUE_BODY_LIMIT,
+                 top_n: int = DEFAULT_TOP_N, per_provider: int = DEFAULT_PER_PROVIDER,
+                 appendix: Optional[List[Iterable[str]]] = None, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """변경 리포트를 stream에 쓰고 {length, omitted, total} 반환
+
+    appendix: 마지막에 덧붙일 섹션 목록 (섹션마다 줄 목록 또는 문자열, 섹션 단위로 길이 제한 적용)
+    """
+    summary = _summarize(changes, top_n, per_provider)
+    counts = summary['counts']
+    totals = {key: sum(c[key] for c in counts.values()) for key in ('new', 'increases', 'decreases', 'suppressed')}
+    total = sum(totals.values())
+
+    writer = ReportWriter(stream, limit)
+    writer.section([
+        "# 🚨 AI Model Price Changes Report\n\n",
+        f"**Date**: {(now or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        "## 📊 Summary\n\n",
+        "| | Count |\n|---|---|\n",
+        f"| Total changes detected | {total:,} |\n",
+        f"| New models | {totals['new']:,} |\n",
+        f"| Price increases | {totals['increases']:,} |\n",
+        f"| Price decreases | {totals['decreases']:,} |\n",
+        f"| Suppressed as likely misparse | {totals['suppressed']:,} |\n\n"
+    ])
+
+    if len(counts) > 1:
+        rows = [f"| {provider} | {c['new']:,} | {c['increases']:,} | {c['decreases']:,} | {c['suppressed']:,} |\n"
+                for provider, c in counts.items()]
+        writer.section(["## 🏢 By Provider\n\n",
+                        "| Provider | New | Increases | Decreases | Suppressed |\n",
+                        "|----------|-----|-----------|-----------|------------|\n", *rows, "\n"])
+
+    price_changes = totals['increases'] + totals['decreases']
+    if price_changes > per_provider:
+        for title, key in (("📈 Largest Increases", 'increases'), ("📉 Largest Decreases", 'decreases')):
+            if summary[key]:
+                writer.section([f"## {title}\n\n", CHANGE_TABLE_HEADER,
+                                *map(change_row, summary[key]), "\n"])
+
+    if summary['new']:
+        lines = ["## 🆕 New Models\n\n"]
+        for change in summary['new']:
+            lines.append(f"- {change['name']} ({change['provider']}): input ${change['input_price']['new']}, "
+                         f"output ${change['output_price']['new']} /1M tokens\n")
+        if totals['new'] > len(summary['new']):
+            lines.append(f"- … and {totals['new'] - len(summary['new']):,} more\n")
+        writer.section(lines + ["\n"])
+
+    if summary['suppressed']:
+        lines = ["## ⚠️ Suppressed (likely misparse)\n\n"]
+        for change in summary['suppressed']:
+            lines.append(f"- {change['name']} ({change['provider']}): "
+                         f"input ${change['input_price']['old']} → ${change['input_price']['new']}, "
+                         f"output ${change['output_price']['old']} → ${change['output_price']['new']} "
+                         f"(confidence {change['confidence']:.2f}; {'; '.join(change['anomaly_reasons'])})\n")
+        if totals['suppressed'] > len(summary['suppressed']):
+            lines.append(f"- … and {totals['suppressed'] - len(summary['suppressed']):,} more\n")
+        writer.section(lines + ["\n"])
+
+    if summary['by_provider']:
+        writer.section(["## 💰 Price Changes\n\n"])
+        for provider, shown in summary['by_provider'].items():
+            count = counts[provider]['increases'] + counts[provider]['decreases']
+            lines = [f"### {provider} ({count:,})\n\n", CHANGE_TABLE_HEADER, *map(change_row, shown)]
+            if count > len(shown):
+                lines.append(f"\n_… and {count - len(shown):,} more_\n")
+            writer.section(lines + ["\n"])
+
+    for section in appendix or []:
+        if section:
+            writer.section([section] if isinstance(section, str) else section)
+
+    writer.close()
+    return {'length': writer.length, 'omitted': writer.omitted, 'total': total}
+
+
+def render_report(changes: Iterable[Dict[str, Any]], **options) -> str:
+    """write_report 결과를 문자열로 반환"""
+    buffer = io.StringIO()
+    write_report(changes, buffer, **options)
+    return buffer.getvalue()
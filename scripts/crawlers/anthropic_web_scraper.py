@@ -24,26 +24,28 @@ class AnthropicWebScraper(WebScraperBase):
         
         # 페이지 가져오기 (JavaScript 렌더링 필요)
         html = await self.fetch_html(self.models_url, use_playwright=True)
-        soup = self.parse_html(html)
+        # 파싱과 추출을 parse 단계로 기록
+        with self.parse_stage():
+            soup = self.parse_html(html)
         
-        # 테이블 찾기
-        tables = soup.find_all('table')
+            # 테이블 찾기
+            tables = soup.find_all('table')
         
-        for table in tables:
-            # 모델 정보가 있는 테이블인지 확인
-            headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
+            for table in tables:
+                # 모델 정보가 있는 테이블인지 확인
+                headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
             
-            if any('model' in h for h in headers):
-                table_models = await self.extract_models_from_table(table)
-                models.extend(table_models)
+                if any('model' in h for h in headers):
+                    table_models = await self.extract_models_from_table(table)
+                    models.extend(table_models)
         
-        # 추가로 카드 형태의 정보도 확인
-        model_sections = soup.find_all(['section', 'div'], class_=re.compile('model|feature'))
-        for section in model_sections:
-            if self.is_model_section(section):
-                model_data = await self.extract_model_from_section(section)
-                if model_data:
-                    models.append(model_data)
+            # 추가로 카드 형태의 정보도 확인
+            model_sections = soup.find_all(['section', 'div'], class_=re.compile('model|feature'))
+            for section in model_sections:
+                if self.is_model_section(section):
+                    model_data = await self.extract_model_from_section(section)
+                    if model_data:
+                        models.append(model_data)
         
         # 스크래핑 실패 시 기본 데이터 사용
         if not models:
@@ -1,10 +1,11 @@
-import json
 import os
 from datetime import datetime
 from pathlib import Path
 from abc import ABC, abstractmethod
 import requests
 from typing import Dict, List, Optional
+from utils.json_codec import dump_json
+from utils.run_metrics import get_metrics
 
 class BaseCrawler(ABC):
     """모든 크롤러의 기본 클래스"""
@@ -17,6 +18,10 @@ class BaseCrawler(ABC):
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # 응답 크기를 진행 중인 단계의 fetch 바이트로 기록
+        self.session.hooks['response'].append(
+            lambda response, *args, **kwargs: get_metrics().add_bytes(len(response.content))
+        )
         
     @abstractmethod
     def fetch_models(self) -> List[Dict]:
@@ -62,8 +67,7 @@ class BaseCrawler(ABC):
             'models': models
         }
         
-        with open(self.data_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        dump_json(output, self.data_path)
             
     def get_provider_info(self) -> Dict:
         """제공업체 정보 반환"""
@@ -123,25 +127,32 @@ class BaseCrawler(ABC):
         return float(match.group(1)) if match else 0.0
     
     def run(self):
-        """크롤러 실행"""
+        """크롤러 실행 (fetch / normalize / save 단계별 지표 기록)"""
+        metrics = get_metrics()
         try:
             print(f"🤖 Starting {self.provider_name} crawler...")
-            models = self.fetch_models()
+            with metrics.stage('fetch', provider=self.provider_name) as stage:
+                models = self.fetch_models()
+                stage.add_models(len(models))
             
             # 모델 데이터 정규화
-            normalized_models = []
-            for model in models:
-                try:
-                    normalized = self.normalize_model_data(model)
-                    normalized_models.append(normalized)
-                except Exception as e:
-                    print(f"❌ Error normalizing model {model.get('id', 'unknown')}: {e}")
-                    continue
+            with metrics.stage('normalize', provider=self.provider_name) as stage:
+                normalized_models = []
+                for model in models:
+                    try:
+                        normalized = self.normalize_model_data(model)
+                        normalized_models.append(normalized)
+                    except Exception as e:
+                        print(f"❌ Error normalizing model {model.get('id', 'unknown')}: {e}")
+                        continue
+                stage.add_models(len(normalized_models))
             
-            self.save_data(normalized_models)
+            with metrics.stage('save', provider=self.provider_name) as stage:
+                self.save_data(normalized_models)
+                stage.add_models(len(normalized_models))
             print(f"✅ Saved {len(normalized_models)} {self.provider_name} models")
             
         except Exception as e:
             print(f"❌ Error in {self.provider_name} crawler: {e}")
             # 빈 데이터라도 저장하여 전체 프로세스가 중단되지 않도록 함
-            self.save_data([])
\ No newline at end of file
+            self.save_data([])
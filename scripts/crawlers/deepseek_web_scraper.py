@@ -23,26 +23,28 @@ class DeepSeekWebScraper(WebScraperBase):
         
         # 페이지 가져오기
         html = await self.fetch_html(self.pricing_url, use_playwright=True)
-        soup = self.parse_html(html)
-        
-        # 가격 테이블 찾기
-        tables = soup.find_all('table')
-        
-        for table in tables:
-            # 테이블이 가격 정보를 포함하는지 확인
-            if self.is_pricing_table(table):
-                table_models = await self.extract_models_from_table(table)
-                models.extend(table_models)
-        
-        # 모델 설명 섹션 찾기
-        model_sections = soup.find_all(['section', 'div'], class_=re.compile('model|feature|pricing'))
-        for section in model_sections:
-            model_data = await self.extract_model_from_section(section)
-            if model_data:
-                models.append(model_data)
-        
-        # 중복 제거 및 병합
-        models = self.merge_duplicate_models(models)
+        # 파싱과 추출을 parse 단계로 기록
+        with self.parse_stage():
+            soup = self.parse_html(html)
+        
+            # 가격 테이블 찾기
+            tables = soup.find_all('table')
+        
+            for table in tables:
+                # 테이블이 가격 정보를 포함하는지 확인
+                if self.is_pricing_table(table):
+                    table_models = await self.extract_models_from_table(table)
+                    models.extend(table_models)
+        
+            # 모델 설명 섹션 찾기
+            model_sections = soup.find_all(['section', 'div'], class_=re.compile('model|feature|pricing'))
+            for section in model_sections:
+                model_data = await self.extract_model_from_section(section)
+                if model_data:
+                    models.append(model_data)
+        
+            # 중복 제거 및 병합
+            models = self.merge_duplicate_models(models)
         
         # 스크래핑 실패 시 기본 데이터 사용
         if not models:
@@ -23,35 +23,37 @@ class GoogleWebScraper(WebScraperBase):
         
         # 페이지 가져오기
         html = await self.fetch_html(self.pricing_url, use_playwright=True)
-        soup = self.parse_html(html)
-        
-        # 가격 카드 찾기
-        pricing_cards = soup.find_all(['div', 'section'], class_=re.compile('pricing|model|card'))
-        
-        for card in pricing_cards:
-            model_data = await self.extract_model_from_card(card)
-            if model_data:
-                models.append(model_data)
-        
-        # 테이블 형태의 가격 정보도 확인
-        tables = soup.find_all('table')
-        for table in tables:
-            table_models = await self.extract_models_from_table(table)
-            models.extend(table_models)
-        
-        # JavaScript에서 데이터 추출 시도
-        script_data = self.extract_json_from_script(soup, 'models')
-        if script_data:
-            script_models = self.process_script_data(script_data)
-            models.extend(script_models)
-        
-        # 중복 제거
-        seen = set()
-        unique_models = []
-        for model in models:
-            if model.get('id') and model['id'] not in seen:
-                seen.add(model['id'])
-                unique_models.append(model)
+        # 파싱과 추출을 parse 단계로 기록
+        with self.parse_stage():
+            soup = self.parse_html(html)
+        
+            # 가격 카드 찾기
+            pricing_cards = soup.find_all(['div', 'section'], class_=re.compile('pricing|model|card'))
+        
+            for card in pricing_cards:
+                model_data = await self.extract_model_from_card(card)
+                if model_data:
+                    models.append(model_data)
+        
+            # 테이블 형태의 가격 정보도 확인
+            tables = soup.find_all('table')
+            for table in tables:
+                table_models = await self.extract_models_from_table(table)
+                models.extend(table_models)
+        
+            # JavaScript에서 데이터 추출 시도
+            script_data = self.extract_json_from_script(soup, 'models')
+            if script_data:
+                script_models = self.process_script_data(script_data)
+                models.extend(script_models)
+        
+            # 중복 제거
+            seen = set()
+            unique_models = []
+            for model in models:
+                if model.get('id') and model['id'] not in seen:
+                    seen.add(model['id'])
+                    unique_models.append(model)
         
         # 스크래핑 실패 시 기본 데이터 사용
         if not unique_models:
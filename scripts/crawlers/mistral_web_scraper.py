@@ -23,31 +23,33 @@ class MistralWebScraper(WebScraperBase):
         
         # 페이지 가져오기
         html = await self.fetch_html(self.pricing_url, use_playwright=True)
-        soup = self.parse_html(html)
+        # 파싱과 추출을 parse 단계로 기록
+        with self.parse_stage():
+            soup = self.parse_html(html)
         
-        # 가격 카드 찾기
-        pricing_cards = soup.find_all(['div', 'section'], class_=re.compile('pricing|model|card'))
+            # 가격 카드 찾기
+            pricing_cards = soup.find_all(['div', 'section'], class_=re.compile('pricing|model|card'))
         
-        for card in pricing_cards:
-            model_data = await self.extract_model_from_card(card)
-            if model_data:
-                models.append(model_data)
+            for card in pricing_cards:
+                model_data = await self.extract_model_from_card(card)
+                if model_data:
+                    models.append(model_data)
         
-        # 테이블 형태의 정보도 확인
-        tables = soup.find_all('table')
-        for table in tables:
-            if self.is_pricing_table(table):
-                table_models = await self.extract_models_from_table(table)
-                models.extend(table_models)
-        
-        # 모델 목록 섹션 찾기
-        model_lists = soup.find_all(['ul', 'ol', 'div'], class_=re.compile('models?-list'))
-        for model_list in model_lists:
-            list_models = await self.extract_models_from_list(model_list)
-            models.extend(list_models)
-        
-        # 중복 제거 및 병합
-        models = self.merge_duplicate_models(models)
+            # 테이블 형태의 정보도 확인
+            tables = soup.find_all('table')
+            for table in tables:
+                if self.is_pricing_table(table):
+                    table_models = await self.extract_models_from_table(table)
+                    models.extend(table_models)
+        
+            # 모델 목록 섹션 찾기
+            model_lists = soup.find_all(['ul', 'ol', 'div'], class_=re.compile('models?-list'))
+            for model_list in model_lists:
+                list_models = await self.extract_models_from_list(model_list)
+                models.extend(list_models)
+        
+            # 중복 제거 및 병합
+            models = self.merge_duplicate_models(models)
         
         # 기본 모델이 없으면 하드코딩된 데이터 추가
         if not models:
@@ -25,25 +25,27 @@ class OpenAIWebScraper(WebScraperBase):
         try:
             # 가격 페이지에서 모델 정보 추출
             html = await self.fetch_html(self.pricing_url, use_playwright=True, wait_selector='body')
-            soup = self.parse_html(html)
+            # 파싱과 추출을 parse 단계로 기록
+            with self.parse_stage():
+                soup = self.parse_html(html)
             
-            # 가격 테이블 찾기
-            pricing_sections = soup.find_all(['section', 'div'], class_=re.compile('pricing|model'))
+                # 가격 테이블 찾기
+                pricing_sections = soup.find_all(['section', 'div'], class_=re.compile('pricing|model'))
             
-            for section in pricing_sections:
-                # 모델 카드 찾기
-                model_cards = section.find_all(['div', 'article'], class_=re.compile('card|model|pricing-item'))
+                for section in pricing_sections:
+                    # 모델 카드 찾기
+                    model_cards = section.find_all(['div', 'article'], class_=re.compile('card|model|pricing-item'))
                 
-                for card in model_cards:
-                    model_data = await self.extract_model_from_card(card)
-                    if model_data:
-                        models.append(model_data)
+                    for card in model_cards:
+                        model_data = await self.extract_model_from_card(card)
+                        if model_data:
+                            models.append(model_data)
             
-            # 테이블 형태의 가격 정보도 확인
-            tables = soup.find_all('table')
-            for table in tables:
-                table_models = await self.extract_models_from_table(table)
-                models.extend(table_models)
+                # 테이블 형태의 가격 정보도 확인
+                tables = soup.find_all('table')
+                for table in tables:
+                    table_models = await self.extract_models_from_table(table)
+                    models.extend(table_models)
         
         except Exception as e:
             print(f"Web scraping failed: {e}, using fallback data")
@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 import re
 from playwright.async_api import async_playwright
 import time
+from utils.run_metrics import get_metrics
+from utils.page_telemetry import PageTelemetry
 
 class WebScraperBase(ABC):
     """웹 스크래핑을 위한 베이스 클래스"""
@@ -41,32 +43,52 @@ class WebScraperBase(ABC):
         }
         
         async with self.session.get(url, headers=headers) as response:
+            get_metrics().add_bytes(len(await response.read()))
             return await response.text()
     
     async def fetch_with_playwright(self, url: str, wait_selector: str = None) -> str:
-        """Playwright를 사용하여 JavaScript 렌더링 페이지 가져오기"""
-        if not self.browser:
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(headless=True)
-            self.context = await self.browser.new_context()
+        """Playwright를 사용하여 JavaScript 렌더링 페이지 가져오기
         
-        page = await self.context.new_page()
-        await page.goto(url, wait_until='networkidle')
-        
-        if wait_selector:
-            try:
-                await page.wait_for_selector(wait_selector, timeout=10000, state='attached')
-            except Exception as e:
-                print(f"Warning: Timeout waiting for selector '{wait_selector}'")
-        else:
-            # 페이지가 완전히 로드될 때까지 대기
-            await page.wait_for_timeout(3000)
-        
-        content = await page.content()
-        await page.close()
+        구간별 시간, 네비게이션 타이밍, 리소스 유형별 네트워크 사용량을 render 단계의 extra.playwright에 기록합니다.
+        """
+        with get_metrics().stage('render', provider=self.provider_name) as stage:
+            telemetry = PageTelemetry(url)
+            if not self.browser:
+                with telemetry.phase('launch'):
+                    playwright = await async_playwright().start()
+                    self.browser = await playwright.chromium.launch(headless=True)
+                    self.context = await self.browser.new_context()
+            
+            page = await self.context.new_page()
+            await telemetry.attach(self.context, page)
+            with telemetry.phase('navigation'):
+                await page.goto(url, wait_until='networkidle')
+            
+            if wait_selector:
+                with telemetry.phase('selector_wait'):
+                    try:
+                        await page.wait_for_selector(wait_selector, timeout=10000, state='attached')
+                    except Exception as e:
+                        telemetry.selector_timeouts += 1
+                        print(f"Warning: Timeout waiting for selector '{wait_selector}'")
+            else:
+                # 페이지가 완전히 로드될 때까지 대기
+                with telemetry.phase('sleep'):
+                    await page.wait_for_timeout(3000)
+            
+            with telemetry.phase('content'):
+                content = await page.content()
+            await telemetry.collect(page)
+            await page.close()
+            stage.add_bytes(len(content.encode('utf-8')))
+            stage.extra['playwright'] = telemetry.to_dict()
         
         return content
     
+    def parse_stage(self):
+        """parse 단계 기록 (HTML 파싱부터 모델 추출까지 감싸서 사용)"""
+        return get_metrics().stage('parse', provider=self.provider_name)
+    
     def parse_html(self, html: str) -> BeautifulSoup:
         """HTML 파싱"""
         return BeautifulSoup(html, 'html.parser')
@@ -23,34 +23,36 @@ class XAIWebScraper(WebScraperBase):
         
         # 페이지 가져오기
         html = await self.fetch_html(self.models_url, use_playwright=True)
-        soup = self.parse_html(html)
-        
-        # 모델 섹션 찾기
-        model_sections = soup.find_all(['section', 'div'], class_=re.compile('model|feature'))
-        
-        for section in model_sections:
-            if self.is_model_section(section):
-                model_data = await self.extract_model_from_section(section)
-                if model_data:
-                    models.append(model_data)
-        
-        # 테이블 형태의 정보도 확인
-        tables = soup.find_all('table')
-        for table in tables:
-            if self.is_model_table(table):
-                table_models = await self.extract_models_from_table(table)
-                models.extend(table_models)
-        
-        # 카드 형태의 정보 확인
-        cards = soup.find_all(['div', 'article'], class_=re.compile('card|box'))
-        for card in cards:
-            if self.is_model_card(card):
-                model_data = await self.extract_model_from_card(card)
-                if model_data:
-                    models.append(model_data)
-        
-        # 중복 제거
-        models = self.deduplicate_models(models)
+        # 파싱과 추출을 parse 단계로 기록
+        with self.parse_stage():
+            soup = self.parse_html(html)
+        
+            # 모델 섹션 찾기
+            model_sections = soup.find_all(['section', 'div'], class_=re.compile('model|feature'))
+        
+            for section in model_sections:
+                if self.is_model_section(section):
+                    model_data = await self.extract_model_from_section(section)
+                    if model_data:
+                        models.append(model_data)
+        
+            # 테이블 형태의 정보도 확인
+            tables = soup.find_all('table')
+            for table in tables:
+                if self.is_model_table(table):
+                    table_models = await self.extract_models_from_table(table)
+                    models.extend(table_models)
+        
+            # 카드 형태의 정보 확인
+            cards = soup.find_all(['div', 'article'], class_=re.compile('card|box'))
+            for card in cards:
+                if self.is_model_card(card):
+                    model_data = await self.extract_model_from_card(card)
+                    if model_data:
+                        models.append(model_data)
+        
+            # 중복 제거
+            models = self.deduplicate_models(models)
         
         # 기본 모델이 없으면 하드코딩된 데이터 추가
         if not models:
@@ -1,18 +1,33 @@
 #!/usr/bin/env python3
-import json
+import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Optional
+from utils.json_codec import load_json
+from utils.json_stream import StreamingJSONWriter
+from indexes.search_index import write_search_index
+from indexes.facet_index import write_facet_index
+from history.snapshot_store import HistoryStore
+from history.records import SNAPSHOT_SCHEMA_VERSION, sorted_records
+from history.chart_series import write_chart_series
+from history.catalog_events import CatalogEventStore
+from history.history_db import HistoryDatabase
+from utils.run_metrics import get_metrics
+from utils.profiling import add_profile_argument, enable as enable_profiling
 
 class DataProcessor:
-    def __init__(self):
-        self.base_dir = Path(__file__).parent.parent
+    def __init__(self, base_dir: Optional[Path] = None):
+        # base_dir: data/ 를 포함하는 루트 (합성 데이터 트리 등, 기본: 저장소 루트)
+        self.base_dir = Path(base_dir or Path(__file__).parent.parent)
         self.data_dir = self.base_dir / "data/models"
         self.output_file = self.base_dir / "data/consolidated.json"
         self.history_dir = self.base_dir / "data/history"
+        self.search_index_file = self.base_dir / "data/indexes/search.json"
+        self.facet_index_file = self.base_dir / "data/indexes/facets.json"
+        self.charts_dir = self.base_dir / "data/charts"
         
-    def consolidate_data(self) -> Dict[str, Any]:
-        """모든 제공업체 데이터를 통합"""
+    def load_provider_data(self) -> Dict[str, Any]:
+        """모든 제공업체 데이터를 로드 (중복 제거 전 모델 목록 포함)"""
         consolidated = {
             'last_updated': datetime.now().isoformat(),
             'providers': {},
@@ -31,8 +46,7 @@ class DataProcessor:
             if json_file.stem in excluded_providers:
                 continue
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    provider_data = json.load(f)
+                provider_data = load_json(json_file)
                 
                 provider_name = provider_data.get('provider', json_file.stem)
                 provider_info = provider_data.get('provider_info', {})
@@ -79,6 +93,12 @@ class DataProcessor:
                 print(f"Error loading {json_file}: {e}")
                 continue
         
+        return consolidated
+    
+    def consolidate_data(self) -> Dict[str, Any]:
+        """모든 제공업체 데이터를 통합"""
+        consolidated = self.load_provider_data()
+        
         # 모델 중복 제거 (같은 모델이 여러 제공업체에서 제공되는 경우)
         consolidated['models'] = self.deduplicate_models(consolidated['models'])
         
@@ -92,6 +112,10 @@ class DataProcessor:
     
     def deduplicate_models(self, models: List[Dict]) -> List[Dict]:
         """중복 모델 제거 및 다중 제공업체 추적"""
+        return list(self.iter_deduplicated_models(models))
+    
+    def iter_deduplicated_models(self, models: List[Dict]) -> Iterator[Dict]:
+        """중복 제거된 모델을 하나씩 생성 (스트리밍 출력용)"""
         # 모델 이름과 주요 파라미터로 그룹화
         model_groups = {}
         
@@ -144,11 +168,10 @@ class DataProcessor:
             model_groups[group_key].append(model)
         
         # 각 그룹에서 대표 모델 선택 및 다중 제공업체 추적
-        deduped = []
         for group_key, group_models in model_groups.items():
             if len(group_models) == 1:
                 # 단일 제공업체
-                deduped.append(group_models[0])
+                yield group_models[0]
             else:
                 # 다중 제공업체 - 가장 상세한 정보를 가진 모델을 선택하고
                 # 다른 제공업체 정보를 추가
@@ -161,7 +184,7 @@ class DataProcessor:
                 
                 # 다른 제공업체 정보 수집
                 available_providers = [m['provider'] for m in group_models]
-                primary_model['available_providers'] = list(set(available_providers))
+                primary_model['available_providers'] = sorted(set(available_providers))
                 
                 # 제공업체별 가격 정보 저장 (가격이 다를 경우)
                 provider_pricing = {}
@@ -177,9 +200,7 @@ class DataProcessor:
                 if len(provider_pricing) > 1:
                     primary_model['provider_pricing'] = provider_pricing
                 
-                deduped.append(primary_model)
-        
-        return deduped
+                yield primary_model
     
     def calculate_statistics(self, models: List[Dict]) -> Dict[str, Any]:
         """데이터 통계 계산"""
@@ -326,48 +347,79 @@ class DataProcessor:
     def save_history_snapshot(self, data: Dict[str, Any]):
         """일별 히스토리 스냅샷 저장"""
         today = datetime.now().strftime("%Y-%m-%d")
-        history_file = self.history_dir / f"{today}.json"
+        store = HistoryStore(self.history_dir)
         
-        self.history_dir.mkdir(parents=True, exist_ok=True)
+        # 시계열 소비자가 쓰는 가격 레코드만 담은 버전 있는 간소화 스냅샷
+        records = sorted_records(data['models'])
         
-        # 히스토리용 간소화된 데이터
-        history_data = {
-            'date': today,
-            'timestamp': datetime.now().isoformat(),
-            'statistics': data['statistics'],
-            'provider_count': len(data['providers']),
-            'model_count': len(data['models']),
-            'price_snapshot': [
-                {
-                    'unique_id': model.get('unique_id'),
-                    'id': model['id'],
-                    'name': model['name'],
-                    'provider': model['provider'],
-                    'input_price': model.get('pricing', {}).get('input', 0) or model.get('input_price', 0),
-                    'output_price': model.get('pricing', {}).get('output', 0) or model.get('output_price', 0),
-                    'context_window': model.get('context_window', 0),
-                    'status': model.get('status', 'ga')
-                }
-                for model in data['models']
-            ]
-        }
+        # date/timestamp는 index.json에, 나머지는 내용 해시 blob으로 저장
+        fields = {'date': today, 'timestamp': datetime.now().isoformat()}
+        with store.open_snapshot(today, fields) as writer:
+            writer.write_field('schema_version', SNAPSHOT_SCHEMA_VERSION)
+            writer.write_array('price_snapshot', records)
+    
+    def write_consolidated(self, consolidated: Dict[str, Any]) -> Dict[str, Any]:
+        """중복 제거 결과를 생성되는 대로 consolidated.json에 스트리밍 기록
         
-        with open(history_file, 'w', encoding='utf-8') as f:
-            json.dump(history_data, f, indent=2, ensure_ascii=False)
+        통계와 카테고리는 모델 배열 뒤에 기록되며, 파일은 임시 파일에 쓴 뒤 원자적으로 교체됩니다.
+        색인/히스토리 단계가 전체 모델 목록을 쓰므로 목록은 그대로 메모리에 유지됩니다.
+        스트리밍으로 줄어드는 것은 직렬화된 JSON 문자열 전체 사본뿐이며, 최대 메모리는 모델 목록 크기에 비례합니다.
+        """
+        raw_models = consolidated['models']
+        models = []
+        
+        def emit_models():
+            for model in self.iter_deduplicated_models(raw_models):
+                models.append(model)
+                yield model
+        
+        with StreamingJSONWriter(self.output_file) as writer:
+            writer.write_field('last_updated', consolidated['last_updated'])
+            writer.write_field('providers', consolidated['providers'])
+            writer.write_array('models', emit_models())
+            
+            consolidated['models'] = models
+            consolidated['statistics'] = self.calculate_statistics(models)
+            consolidated['categories'] = self.categorize_models(models)
+            
+            writer.write_field('statistics', consolidated['statistics'])
+            writer.write_field('metadata', consolidated['metadata'])
+            writer.write_field('categories', consolidated['categories'])
+        
+        return consolidated
     
     def run(self):
         """데이터 처리 실행"""
         print("📊 Starting data consolidation...")
         
-        # 데이터 통합
-        consolidated = self.consolidate_data()
+        metrics = get_metrics()
         
-        # 통합 데이터 저장
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(consolidated, f, indent=2, ensure_ascii=False)
+        # 데이터 로드 후 통합 데이터 스트리밍 저장
+        with metrics.stage('consolidate') as stage:
+            consolidated = self.write_consolidated(self.load_provider_data())
+            stage.add_models(len(consolidated['models']))
         
-        # 히스토리 스냅샷 저장
-        self.save_history_snapshot(consolidated)
+        with metrics.stage('index'):
+            # 검색 역색인 생성 (변경되지 않은 제공업체는 이전 색인 재사용)
+            search_index = write_search_index(consolidated['models'], self.search_index_file)
+            
+            # 필터링용 패싯 비트셋 / 카운트 큐브 생성
+            facet_index = write_facet_index(consolidated['models'], self.facet_index_file)
+        
+        with metrics.stage('history'):
+            # 히스토리 스냅샷 저장
+            self.save_history_snapshot(consolidated)
+            
+            # 모델·필드 단위 카탈로그 이벤트 기록 (consolidated.json은 최신 상태의 뷰)
+            catalog_events = CatalogEventStore(self.history_dir).ingest(consolidated['models'])
+            
+            # SQLite 히스토리 DB는 커밋하지 않으므로, 로컬에 만들어 둔 경우에만 오늘 스냅샷까지 증분 적재
+            history_db = HistoryDatabase(self.history_dir)
+            history_db_stats = history_db.sync() if history_db.db_path.exists() else None
+        
+        # 가격 추이 차트용 30/90/365일 사전 집계 시계열
+        with metrics.stage('charts'):
+            chart_series = write_chart_series(self.history_dir, self.charts_dir)
         
         # 요약 출력
         stats = consolidated['statistics']
@@ -379,7 +431,21 @@ class DataProcessor:
         print(f"   - Price range: ${stats['price_range']['min']} - ${stats['price_range']['max']}")
         print(f"   - Models with >100K context: {stats['context_windows']['over_100k']}")
         print(f"   - Models with >1M context: {stats['context_windows']['over_1m']}")
+        print(f"   - Search index: {len(search_index['tokens'])} tokens, "
+              f"{len(search_index['reused_providers'])} providers reused")
+        print(f"   - Facet cube: {len(facet_index['cube']['cells'])} cells")
+        print(f"   - Chart series: {', '.join(f'{days}d' for days in chart_series)} windows")
+        print(f"   - Catalogue events: {catalog_events}")
+        if history_db_stats:
+            print(f"   - History DB: {history_db_stats['inserted']} dates inserted, "
+                  f"{history_db_stats['replaced']} replaced ({history_db_stats['dates']} dates total)")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Consolidate provider data")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    if args.profile:
+        enable_profiling(args.profile)
+    
     processor = DataProcessor()
     processor.run()
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+메모리 매핑 히스토리 배열 조회 API
+TimeSeriesStore가 만든 .npy 배열을 numpy.load(mmap_mode='r')로 열어 복사 없이 뷰를 반환합니다.
+
+- 여는 시점에는 meta.json(날짜 축)만 읽습니다.
+- 배열은 필드별로 처음 접근할 때 매핑되며, 실제로 읽은 페이지만 메모리에 올라옵니다.
+- unique_id -> ordinal 사전은 모델 조회가 처음 필요할 때 models.json에서 만듭니다.
+
+날짜 범위와 연속된 모델 범위는 뷰(복사 없음)이고, 흩어진 모델 목록은 numpy fancy indexing이므로 복사본입니다.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 JSON 기반 조회만 사용
+    np = None
+
+from history.timeseries import TimeSeriesStore, FIELDS
+
+
+class HistoryArrays:
+    """날짜 × 모델 가격 배열의 읽기 전용 뷰"""
+
+    def __init__(self, store: TimeSeriesStore):
+        self.store = store
+        self.dates = store.dates()
+        self._arrays = {}
+
+    @classmethod
+    def open(cls, history_dir: Optional[Path] = None) -> Optional['HistoryArrays']:
+        """배열 저장소 열기 (numpy가 없거나 배열이 아직 없으면 None)"""
+        if np is None:
+            return None
+        store = TimeSeriesStore(history_dir)
+        if not store.meta_file.exists():
+            return None
+        return cls(store)
+
+    # ---- axes ----
+
+    @property
+    def unique_ids(self) -> List[str]:
+        return self.store.load_models()
+
+    def ordinal(self, unique_id: str) -> Optional[int]:
+        return self.store.ordinals().get(unique_id)
+
+    def __contains__(self, date: str) -> bool:
+        position = bisect_left(self.dates, date)
+        return position < len(self.dates) and self.dates[position] == date
+
+    def row_index(self, date: str) -> int:
+        position = bisect_left(self.dates, date)
+        if position == len(self.dates) or self.dates[position] != date:
+            raise KeyError(date)
+        return position
+
+    def date_slice(self, start: Optional[str] = None, end: Optional[str] = None) -> slice:
+        """[start, end] 날짜 범위에 해당하는 행 slice"""
+        lo = bisect_left(self.dates, start) if start else 0
+        hi = bisect_right(self.dates, end) if end else len(self.dates)
+        return slice(lo, hi)
+
+    def is_current(self, date: str, source_digest: str) -> bool:
+        """해당 날짜 행이 원본 스냅샷과 같은 내용으로 만들어졌는지 확인"""
+        if date not in self:
+            return False
+        return self.store.load_meta()['sources'][self.row_index(date)] == source_digest
+
+    # ---- arrays ----
+
+    def array(self, field: str = 'input_price') -> 'np.ndarray':
+        """필드 전체 배열 (memmap, 처음 접근 시 매핑)"""
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field: {field}")
+        if field not in self._arrays:
+            mapped = np.load(self.store.array_path(field), mmap_mode='r')
+            # meta.json보다 배열이 길면(동기화 도중) 메타 기준으로 자름
+            self._arrays[field] = mapped[:len(self.dates)]
+        return self._arrays[field]
+
+    def _model_selector(self, models: Optional[Sequence[str]]) -> Union[slice, List[int]]:
+        if models is None:
+            return slice(None)
+        ordinals = [self.ordinal(uid) for uid in models]
+        missing = [uid for uid, ordinal in zip(models, ordinals) if ordinal is None]
+        if missing:
+            raise KeyError(f"Unknown models: {', '.join(missing[:5])}")
+        # 연속된 ordinal이면 slice로 표현해 뷰를 유지
+        if ordinals and ordinals == list(range(ordinals[0], ordinals[0] + len(ordinals))):
+            return slice(ordinals[0], ordinals[0] + len(ordinals))
+        return ordinals
+
+    def window(self, field: str = 'input_price', start: Optional[str] = None,
+               end: Optional[str] = None, models: Optional[Sequence[str]] = None) -> 'np.ndarray':
+        """날짜 범위 × 모델 부분집합 배열"""
+        return self.array(field)[self.date_slice(start, end), self._model_selector(models)]
+
+    def model(self, unique_id: str, field: str = 'input_price') -> 'np.ndarray':
+        """모델 하나의 전체 이력 (strided 뷰)"""
+        ordinal = self.ordinal(unique_id)
+        if ordinal is None:
+            raise KeyError(unique_id)
+        return self.array(field)[:, ordinal]
+
+    def row(self, date: str, field: str = 'input_price') -> 'np.ndarray':
+        """날짜 하나의 모든 모델 값 (연속 뷰)"""
+        return self.array(field)[self.row_index(date)]
+
+    def prices_on(self, date: str) -> 'PriceRowView':
+        """날짜의 모델별 입력/출력 가격 매핑"""
+        return PriceRowView(self, self.row_index(date))
+
+
+class PriceRowView(Mapping):
+    """하루치 가격 행을 unique_id -> {'unique_id', 'input_price', 'output_price'} 매핑으로 노출
+
+    값은 조회 시점에 배열에서 읽으므로 전체 스냅샷을 파이썬 객체로 만들지 않습니다.
+    행에는 이 세 필드만 있고 records.price_record의 나머지 필드(id, name, provider, context_window, status)는 없으므로
+    가격 비교(PriceMonitor.compare_prices)에만 쓰고, 전체 레코드가 필요한 곳(레코드 해시, PriceIndex 초기화)에는
+    스냅샷을 읽어야 합니다.
+    """
+
+    def __init__(self, arrays: HistoryArrays, row: int):
+        self.arrays = arrays
+        self.date = arrays.dates[row]
+        self.input = arrays.array('input_price')[row]
+        self.output = arrays.array('output_price')[row]
+
+    def __getitem__(self, unique_id: str) -> Dict[str, Any]:
+        ordinal = self.arrays.ordinal(unique_id)
+        if ordinal is None or np.isnan(self.input[ordinal]):
+            raise KeyError(unique_id)
+        return {
+            'unique_id': unique_id,
+            'input_price': float(self.input[ordinal]),
+            'output_price': float(self.output[ordinal])
+        }
+
+    def __contains__(self, unique_id: object) -> bool:
+        ordinal = self.arrays.ordinal(unique_id)
+        return ordinal is not None and not np.isnan(self.input[ordinal])
+
+    def __iter__(self) -> Iterator[str]:
+        unique_ids = self.arrays.unique_ids
+        for ordinal in np.flatnonzero(~np.isnan(self.input)):
+            yield unique_ids[ordinal]
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self.input)))
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+히스토리 병렬 백필 / 재생성
+data/history의 날짜를 고정 크기 청크로 나눠 ProcessPoolExecutor 작업자가 청크별 파생 데이터
+(시계열 배열 블록, SQLite DB)까지 만들고, 부모 프로세스는 이를 날짜순으로 이어 붙이기만 합니다.
+
+대상 (--targets):
+    snapshots   - 이전 형식 스냅샷을 현재 스키마로 변환 (snapshot_store.py convert와 같은 결과)
+    timeseries  - 가격 시계열 배열 (data/history/timeseries/)
+    db          - SQLite 히스토리 DB (data/history/history.db)
+
+- 청크 구성은 날짜 목록과 청크 크기만으로 정해지고, 결과는 완료 순서와 무관하게 날짜순으로 합쳐지므로
+  작업자 수에 관계없이 결과가 같습니다.
+- 청크별 파생 데이터는 data/history/.backfill/<청크>/에 기록되어(스냅샷 본문은 담지 않음),
+  중단 후 다시 실행하면 원본이 바뀌지 않은 청크를 건너뜁니다.
+  모든 대상이 완료되면 체크포인트를 삭제합니다.
+
+사용법:
+    python scripts/history/backfill.py [--workers 4] [--chunk-size 32] [--targets snapshots,timeseries,db]
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.json_codec import load_json, dump_json
+from history.snapshot_store import HistoryStore, TOP_LEVEL_FIELDS
+from history.records import is_current_schema, to_snapshot_body
+from history.timeseries import TimeSeriesStore, price_row
+from history.history_db import HistoryDatabase
+
+DEFAULT_CHUNK_SIZE = 32
+TARGETS = ('snapshots', 'timeseries', 'db')
+
+
+def chunk_dates(dates: Sequence[str], chunk_size: int) -> List[List[str]]:
+    return [list(dates[i:i + chunk_size]) for i in range(0, len(dates), chunk_size)]
+
+
+def process_chunk(history_dir: str, dates: List[str], output_dir: str, targets: Sequence[str]) -> Dict[str, Any]:
+    """작업자: 청크의 스냅샷을 읽어 대상별 파생 데이터를 output_dir에 기록
+
+    - snapshots: 변환이 필요한 날짜의 blob을 저장소에 쓰고 (날짜, blob 해시, 메타 필드)만 결과에 남김
+    - timeseries: 청크 날짜만 담은 시계열 배열 (output_dir/timeseries/)
+    - db: 청크 날짜만 담은 SQLite DB (output_dir/history.db)
+
+    결과(output_dir/chunk.json, 마지막에 기록): dates, sources(원본 식별자), converted, targets
+    """
+    store = HistoryStore(Path(history_dir))
+    entries = store.load_index()['snapshots']
+    output = Path(output_dir)
+    shutil.rmtree(output, ignore_errors=True)
+    output.mkdir(parents=True)
+
+    result = {'dates': [], 'sources': [], 'converted': [], 'targets': list(targets)}
+    rows = []
+    db = HistoryDatabase(store.history_dir, output / "history.db") if 'db' in targets else None
+    conn = db.connect(indexes=False) if db else None
+    try:
+        for date in dates:
+            snapshot = store.load(date)
+            if snapshot is None:
+                continue
+            source = store.source_digest(date)
+            result['dates'].append(date)
+            result['sources'].append(source)
+
+            entry = entries.get(date)
+            if 'snapshots' in targets and not (entry and is_current_schema(snapshot)):
+                fields = entry.get('fields', {}) if entry else {
+                    key: snapshot[key] for key in TOP_LEVEL_FIELDS if key in snapshot
+                }
+                digest = store.put(date, {**fields, **to_snapshot_body(snapshot)}, save=False)
+                result['converted'].append([date, digest, entries[date]['fields']])
+            if 'timeseries' in targets:
+                rows.append((date, source, price_row(snapshot)))
+            if conn is not None:
+                db.insert_snapshot(conn, date, source, snapshot)
+        if conn is not None:
+            # 청크 전체가 한 트랜잭션 (중단되면 chunk.json이 없으므로 다시 처리)
+            conn.commit()
+    finally:
+        if conn is not None:
+            conn.close()
+
+    if 'timeseries' in targets:
+        TimeSeriesStore(output).append(rows)
+    dump_json(result, output / "chunk.json", indent=False, atomic=True)
+    return result
+
+
+class Backfill:
+    """청크 단위 병렬 파생 데이터 생성 + 결정적 병합 + 체크포인트"""
+
+    def __init__(self, history_dir: Optional[Path] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 workers: Optional[int] = None):
+        self.store = HistoryStore(history_dir)
+        self.history_dir = self.store.history_dir
+        self.checkpoint_dir = self.history_dir / ".backfill"
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+
+    def _checkpoint_path(self, dates: List[str]) -> Path:
+        key = hashlib.sha256('\n'.join(dates).encode('utf-8')).hexdigest()[:16]
+        return self.checkpoint_dir / f"{dates[0]}_{key}"
+
+    def _load_checkpoint(self, dates: List[str], sources: Dict[str, str],
+                         targets: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """원본이 바뀌지 않았고 필요한 대상을 모두 만든 청크의 저장된 결과"""
+        path = self._checkpoint_path(dates) / "chunk.json"
+        if not path.exists():
+            return None
+        result = load_json(path)
+        if not set(targets) <= set(result['targets']):
+            return None
+        if any(sources.get(date) != source for date, source in zip(result['dates'], result['sources'])):
+            return None
+        # 그 사이 gc로 지워진 변환 blob이 있으면 다시 처리
+        if any(not self.store.blob_path(digest).exists() for _, digest, _ in result['converted']):
+            return None
+        return result
+
+    def collect(self, targets: Sequence[str] = TARGETS) -> List[Tuple[Path, Dict[str, Any]]]:
+        """모든 청크의 (출력 디렉터리, 결과)를 날짜순으로 반환 (필요한 청크만 병렬 처리)"""
+        dates = self.store.dates()
+        sources = {date: self.store.source_digest(date) for date in dates}
+        chunks = chunk_dates(dates, self.chunk_size)
+        results = [None] * len(chunks)
+
+        pending = []
+        for position, chunk in enumerate(chunks):
+            results[position] = self._load_checkpoint(chunk, sources, targets)
+            if results[position] is None:
+                pending.append(position)
+
+        print(f"⏳ {len(chunks)} chunks ({len(dates)} dates), {len(chunks) - len(pending)} resumed, "
+              f"{len(pending)} to process with {self.workers} workers")
+
+        if pending:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            start = time.perf_counter()
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(process_chunk, str(self.history_dir), chunks[position],
+                                    str(self._checkpoint_path(chunks[position])), list(targets)): position
+                    for position in pending
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    position = futures[future]
+                    results[position] = future.result()
+                    print(f"   [{done}/{len(pending)}] {chunks[position][0]}..{chunks[position][-1]} "
+                          f"({time.perf_counter() - start:.1f}s)")
+        return [(self._checkpoint_path(chunk), result) for chunk, result in zip(chunks, results)]
+
+    def run(self, targets: Sequence[str] = TARGETS) -> Dict[str, Any]:
+        """청크 결과를 날짜순으로 이어 붙여 대상별 파생 데이터 생성"""
+        chunks = self.collect(targets)
+        stats = {}
+
+        if 'snapshots' in targets:
+            converted = [entry for _, result in chunks for entry in result['converted']]
+            for date, digest, fields in converted:
+                self.store.record(date, digest, fields, save=False)
+            if converted:
+                self.store.save_index()
+                for date, path in self.store.legacy_files().items():
+                    if date in self.store.load_index()['snapshots']:
+                        path.unlink()
+                self.store.gc()
+            stats['snapshots'] = len(converted)
+
+        if 'timeseries' in targets:
+            stats['timeseries'] = TimeSeriesStore(self.history_dir).merge(
+                [TimeSeriesStore(path) for path, _ in chunks], self.store
+            )
+        if 'db' in targets:
+            stats['db'] = HistoryDatabase(self.history_dir).merge(
+                [path / "history.db" for path, _ in chunks], self.store
+            )
+
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel history backfill")
+    parser.add_argument('--history-dir', type=Path, default=None)
+    parser.add_argument('--workers', type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="청크당 날짜 수")
+    parser.add_argument('--targets', default=','.join(TARGETS),
+                        help=f"생성 대상 (쉼표 구분: {', '.join(TARGETS)})")
+    args = parser.parse_args()
+
+    targets = [target.strip() for target in args.targets.split(',') if target.strip()]
+    unknown = set(targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"Unknown targets: {', '.join(sorted(unknown))}")
+
+    start = time.perf_counter()
+    stats = Backfill(args.history_dir, args.chunk_size, args.workers).run(targets)
+    print(f"✅ Backfill complete in {time.perf_counter() - start:.1f}s")
+    if 'snapshots' in stats:
+        print(f"   - Snapshots converted: {stats['snapshots']}")
+    if 'timeseries' in stats:
+        print(f"   - Time series: {stats['timeseries']['dates']} days × {stats['timeseries']['models']} models")
+    if 'db' in stats:
+        print(f"   - History DB: {stats['db']['dates']} dates ({stats['db']['records']} records loaded)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
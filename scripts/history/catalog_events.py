@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+이벤트 소싱 모델 카탈로그
+통합된 모델 목록을 직전 상태와 비교해 모델·필드 단위 add/update/remove 이벤트로 기록하고,
+임의 시각의 카탈로그를 가장 가까운 체크포인트 + 그 이후 이벤트로 복원합니다.
+
+data/history/catalog/
+    manifest.json              - 마지막 순번/시각, 세그먼트 목록, 체크포인트 목록
+    segment-000001.jsonl       - 이벤트 한 줄에 하나 (SEGMENT_BYTES를 넘으면 다음 세그먼트)
+    checkpoints/<순번>.json     - 해당 순번까지 반영된 전체 상태
+
+이벤트:
+    {"seq": 12, "timestamp": "...", "op": "add", "unique_id": "...", "set": {<필드>: <값>, ...}}
+    {"seq": 13, "timestamp": "...", "op": "update", "unique_id": "...", "set": {...}, "unset": [<필드>, ...]}
+    {"seq": 14, "timestamp": "...", "op": "remove", "unique_id": "..."}
+
+- 크롤링 시각(last_updated)은 이벤트로 기록하지 않습니다.
+- 시각은 단조 증가해야 하며, 한 번의 ingest는 세그먼트 기록 후 manifest 교체로 확정됩니다.
+  manifest에 없는 세그먼트 끝부분과 manifest보다 새 세그먼트 파일(중단된 ingest)은 다음 열기 때 잘라내거나 지웁니다.
+- 체크포인트는 마지막 체크포인트 이후 이벤트가 checkpoint_events개 이상 쌓이면 만들며,
+  각 체크포인트는 다음 이벤트의 세그먼트/오프셋을 기록해 복원 시 그 위치부터 읽습니다.
+  따라서 복원 비용은 체크포인트 이후 이벤트 수에 비례합니다.
+
+최신 상태(materialize())와 consolidated.json은 모델 집합과 각 모델의 필드 값이 같습니다. 다만
+- 모델은 unique_id 순이고 (consolidated.json은 처리 순서), unique_id가 겹치면 마지막 모델만 남으며,
+- 모델 안의 모든 last_updated 필드가 없고, 최상위 last_updated 대신 as_of(마지막 ingest 시각)가 들어갑니다.
+
+사용법:
+    python scripts/history/catalog_events.py ingest [data/consolidated.json]
+    python scripts/history/catalog_events.py at 2025-10-14T00:00:00 [--output catalog.json]
+    python scripts/history/catalog_events.py events [--since ...] [--until ...] [--model unique_id]
+    python scripts/history/catalog_events.py stats
+"""
+
+import argparse
+import os
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.json_codec import load_json, dump_json, dumps, loads
+from history.snapshot_store import strip_volatile
+from history.records import model_unique_id
+
+MANIFEST_VERSION = 1
+SEGMENT_BYTES = 4 * 1024 * 1024
+DEFAULT_CHECKPOINT_EVENTS = 1000
+SEGMENT_PATTERN = re.compile(r'segment-(\d+)\.jsonl$')
+
+
+def segment_name(number: int) -> str:
+    return f"segment-{number:06d}.jsonl"
+
+
+def diff_model(previous: Optional[Dict[str, Any]], current: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """모델 하나의 이전/현재 상태 차이를 이벤트 본문으로 (차이가 없으면 None)"""
+    if previous is None and current is None:
+        return None
+    if previous is None:
+        return {'op': 'add', 'set': current}
+    if current is None:
+        return {'op': 'remove'}
+
+    changed = {field: value for field, value in current.items()
+               if field not in previous or previous[field] != value}
+    unset = [field for field in previous if field not in current]
+    if not changed and not unset:
+        return None
+    event = {'op': 'update', 'set': changed}
+    if unset:
+        event['unset'] = unset
+    return event
+
+
+def apply_event(state: Dict[str, Dict[str, Any]], event: Dict[str, Any]):
+    """이벤트 하나를 상태(unique_id -> 모델)에 반영"""
+    unique_id = event['unique_id']
+    if event['op'] == 'add':
+        state[unique_id] = dict(event['set'])
+    elif event['op'] == 'remove':
+        state.pop(unique_id, None)
+    else:
+        model = state.setdefault(unique_id, {})
+        model.update(event.get('set', {}))
+        for field in event.get('unset', []):
+            model.pop(field, None)
+
+
+class CatalogEventStore:
+    """모델 카탈로그 이벤트 로그 + 체크포인트"""
+
+    def __init__(self, history_dir: Optional[Path] = None,
+                 checkpoint_events: int = DEFAULT_CHECKPOINT_EVENTS, segment_bytes: int = SEGMENT_BYTES):
+        base_dir = Path(__file__).parent.parent.parent
+        history_dir = Path(history_dir) if history_dir else base_dir / "data/history"
+        self.catalog_dir = history_dir / "catalog"
+        self.checkpoints_dir = self.catalog_dir / "checkpoints"
+        self.manifest_file = self.catalog_dir / "manifest.json"
+        self.checkpoint_events = checkpoint_events
+        self.segment_bytes = segment_bytes
+        self.manifest = self._load_manifest()
+        self._truncate_uncommitted()
+        self._head = None
+
+    # ---- manifest ----
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if self.manifest_file.exists():
+            manifest = load_json(self.manifest_file)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+        return {'version': MANIFEST_VERSION, 'seq': 0, 'timestamp': None, 'segments': [], 'checkpoints': []}
+
+    def _save_manifest(self):
+        self.catalog_dir.mkdir(parents=True, exist_ok=True)
+        dump_json(self.manifest, self.manifest_file, atomic=True)
+
+    def _truncate_uncommitted(self):
+        """manifest에 기록되지 않은 세그먼트 끝부분과 새 세그먼트 파일 제거 (중단된 ingest)"""
+        segments = self.manifest['segments']
+        for segment in segments[-1:]:
+            path = self.catalog_dir / segment_name(segment['number'])
+            if path.exists() and path.stat().st_size > segment['bytes']:
+                with open(path, 'r+b') as f:
+                    f.truncate(segment['bytes'])
+
+        # 새 세그먼트를 쓰다 manifest 저장 전에 중단되면 manifest에 없는 세그먼트가 남음
+        last = segments[-1]['number'] if segments else 0
+        if self.catalog_dir.exists():
+            for path in self.catalog_dir.glob("segment-*.jsonl"):
+                match = SEGMENT_PATTERN.match(path.name)
+                if match and int(match.group(1)) > last:
+                    path.unlink()
+
+    # ---- 읽기 ----
+
+    def _read_from(self, segment_number: int, offset: int) -> Iterator[Dict[str, Any]]:
+        """세그먼트/오프셋부터 확정된 이벤트를 순서대로 읽기"""
+        for segment in self.manifest['segments']:
+            if segment['number'] < segment_number:
+                continue
+            start = offset if segment['number'] == segment_number else 0
+            if start >= segment['bytes']:
+                continue
+            with open(self.catalog_dir / segment_name(segment['number']), 'rb') as f:
+                f.seek(start)
+                remaining = segment['bytes'] - start
+                for line in f:
+                    if remaining <= 0:
+                        break
+                    remaining -= len(line)
+                    yield loads(line)
+
+    def _checkpoint_before(self, timestamp: Optional[str], inclusive: bool = True) -> Optional[Dict[str, Any]]:
+        """timestamp 이전(inclusive면 포함) 마지막 체크포인트 (없으면 None = 빈 상태)"""
+        checkpoints = self.manifest['checkpoints']
+        if timestamp is None:
+            return checkpoints[-1] if checkpoints else None
+        search = bisect_right if inclusive else bisect_left
+        position = search(checkpoints, timestamp, key=itemgetter('timestamp'))
+        return checkpoints[position - 1] if position else None
+
+    def _load_checkpoint(self, checkpoint: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        if checkpoint is None:
+            return {}
+        return load_json(self.checkpoints_dir / f"{checkpoint['seq']:010d}.json")['models']
+
+    def state_at(self, timestamp: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """timestamp 시점의 상태 (unique_id -> 모델), None이면 최신 상태"""
+        checkpoint = self._checkpoint_before(timestamp)
+        state = self._load_checkpoint(checkpoint)
+        segment, offset = (checkpoint['segment'], checkpoint['offset']) if checkpoint else (1, 0)
+        for event in self._read_from(segment, offset):
+            if timestamp is not None and event['timestamp'] > timestamp:
+                break
+            apply_event(state, event)
+        return state
+
+    def materialize(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """timestamp 시점의 카탈로그 ({as_of, models: unique_id 순 모델 목록})"""
+        state = self.state_at(timestamp)
+        return {
+            'as_of': timestamp or self.manifest['timestamp'],
+            'models': [state[unique_id] for unique_id in sorted(state)]
+        }
+
+    def events(self, since: Optional[str] = None, until: Optional[str] = None,
+               unique_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """[since, until] 기간의 이벤트 (since 이후 체크포인트부터 읽음)"""
+        # since와 같은 시각의 이벤트가 체크포인트 앞에 있을 수 있으므로 그보다 이전 체크포인트부터 읽음
+        checkpoint = self._checkpoint_before(since, inclusive=False) if since else None
+        segment, offset = (checkpoint['segment'], checkpoint['offset']) if checkpoint else (1, 0)
+        for event in self._read_from(segment, offset):
+            if until and event['timestamp'] > until + '\uffff':
+                break
+            if since and event['timestamp'] < since:
+                continue
+            if unique_id is None or event['unique_id'] == unique_id:
+                yield event
+
+    # ---- 기록 ----
+
+    def ingest(self, models: List[Dict[str, Any]], timestamp: Optional[str] = None) -> int:
+        """현재 모델 목록을 최신 상태와 비교해 이벤트 기록, 기록한 이벤트 수 반환"""
+        timestamp = timestamp or datetime.now().isoformat()
+        if self.manifest['timestamp'] and timestamp < self.manifest['timestamp']:
+            raise ValueError(f"Timestamp {timestamp} is older than the last event ({self.manifest['timestamp']})")
+
+        if self._head is None:
+            self._head = self.state_at()
+        current = {model_unique_id(model): strip_volatile(model, top_level=False) for model in models}
+
+        events = []
+        seq = self.manifest['seq']
+        for unique_id in sorted(set(self._head) | set(current)):
+            body = diff_model(self._head.get(unique_id), current.get(unique_id))
+            if body is not None:
+                seq += 1
+                events.append({'seq': seq, 'timestamp': timestamp, 'op': body['op'],
+                               'unique_id': unique_id, **{k: v for k, v in body.items() if k != 'op'}})
+        if not events:
+            return 0
+
+        self._append(events)
+        for event in events:
+            apply_event(self._head, event)
+        self.manifest['seq'] = seq
+        self.manifest['timestamp'] = timestamp
+
+        last_checkpoint = self.manifest['checkpoints'][-1]['seq'] if self.manifest['checkpoints'] else 0
+        if seq - last_checkpoint >= self.checkpoint_events:
+            self._write_checkpoint()
+        self._save_manifest()
+        return len(events)
+
+    def _append(self, events: List[Dict[str, Any]]):
+        self.catalog_dir.mkdir(parents=True, exist_ok=True)
+        segments = self.manifest['segments']
+        if not segments or segments[-1]['bytes'] >= self.segment_bytes:
+            number = segments[-1]['number'] + 1 if segments else 1
+            segments.append({'number': number, 'bytes': 0, 'count': 0,
+                             'first_seq': events[0]['seq']})
+
+        segment = segments[-1]
+        with open(self.catalog_dir / segment_name(segment['number']), 'ab') as f:
+            for event in events:
+                line = dumps(event, indent=False) + b'\n'
+                f.write(line)
+                segment['bytes'] += len(line)
+                segment['count'] += 1
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_checkpoint(self):
+        """현재 상태를 체크포인트로 저장 (다음 이벤트 위치 기록)"""
+        self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
+        segment = self.manifest['segments'][-1]
+        checkpoint = {
+            'seq': self.manifest['seq'],
+            'timestamp': self.manifest['timestamp'],
+            'segment': segment['number'],
+            'offset': segment['bytes']
+        }
+        dump_json({**checkpoint, 'models': self._head},
+                  self.checkpoints_dir / f"{checkpoint['seq']:010d}.json", indent=False, atomic=True)
+        self.manifest['checkpoints'].append(checkpoint)
+
+    def checkpoint(self):
+        """마지막 체크포인트 이후 이벤트가 있으면 강제로 체크포인트 생성"""
+        checkpoints = self.manifest['checkpoints']
+        if self.manifest['seq'] == (checkpoints[-1]['seq'] if checkpoints else 0):
+            return
+        if self._head is None:
+            self._head = self.state_at()
+        self._write_checkpoint()
+        self._save_manifest()
+
+    def stats(self) -> Dict[str, Any]:
+        segments = self.manifest['segments']
+        checkpoints = self.manifest['checkpoints']
+        return {
+            'events': self.manifest['seq'],
+            'segments': len(segments),
+            'bytes': sum(segment['bytes'] for segment in segments),
+            'checkpoints': len(checkpoints),
+            'events_since_checkpoint': self.manifest['seq'] - (checkpoints[-1]['seq'] if checkpoints else 0),
+            'timestamp': self.manifest['timestamp']
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event-sourced model catalogue")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest = subparsers.add_parser('ingest', help='Record events for a consolidated file')
+    ingest.add_argument('file', nargs='?', type=Path)
+    ingest.add_argument('--timestamp', help='Event timestamp (default: now)')
+
+    at = subparsers.add_parser('at', help='Rebuild the catalogue at a timestamp')
+    at.add_argument('timestamp')
+    at.add_argument('--output', type=Path, help='Write the catalogue to a JSON file')
+
+    events = subparsers.add_parser('events', help='List events in a period')
+    events.add_argument('--since')
+    events.add_argument('--until')
+    events.add_argument('--model', help='unique_id')
+
+    subparsers.add_parser('checkpoint', help='Write a checkpoint now')
+    subparsers.add_parser('stats', help='Show store statistics')
+
+    args = parser.parse_args()
+    store = CatalogEventStore()
+
+    if args.command == 'ingest':
+        path = args.file or Path(__file__).parent.parent.parent / "data/consolidated.json"
+        count = store.ingest(load_json(path).get('models', []), args.timestamp)
+        print(f"✅ Recorded {count} catalogue events")
+
+    elif args.command == 'at':
+        catalog = store.materialize(args.timestamp)
+        if args.output:
+            dump_json(catalog, args.output)
+            print(f"✅ Wrote {len(catalog['models'])} models as of {args.timestamp} to {args.output}")
+        else:
+            print(f"📚 {len(catalog['models'])} models as of {args.timestamp}")
+            for model in catalog['models']:
+                pricing = model.get('pricing', {})
+                print(f"  {model_unique_id(model)}: input ${pricing.get('input', 0)}, output ${pricing.get('output', 0)}")
+
+    elif args.command == 'events':
+        count = 0
+        for event in store.events(args.since, args.until, args.model):
+            fields = ', '.join(list(event.get('set', {})) + [f"-{field}" for field in event.get('unset', [])])
+            print(f"{event['timestamp']}  #{event['seq']} {event['op']:<6} {event['unique_id']}  {fields}")
+            count += 1
+        print(f"📊 {count} events")
+
+    elif args.command == 'checkpoint':
+        store.checkpoint()
+        print(f"✅ Checkpoint at event #{store.manifest['seq']}")
+
+    elif args.command == 'stats':
+        stats = store.stats()
+        print(f"📊 {stats['events']} events in {stats['segments']} segments ({stats['bytes'] / 1024:.1f}KB), "
+              f"{stats['checkpoints']} checkpoints, {stats['events_since_checkpoint']} events since last checkpoint, "
+              f"last at {stats['timestamp'] or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+차트용 사전 집계 시계열 생성
+히스토리 스냅샷에서 가격 추이 차트가 쓰는 값(날짜별 입력/출력 가격)만 뽑아
+최근 30/90/365일 구간별, 프로바이더별로 파일을 나눠 만듭니다.
+
+data/charts/<days>/index.json          - 프로바이더 집계
+    dates      - 구간 내 스냅샷 날짜 (오름차순)
+    providers  - provider -> {models, input_avg, output_avg} (유료 모델 평균 가격, 없는 날은 null)
+data/charts/<days>/<provider>.json     - 프로바이더의 모델별 시계열
+    dates      - index.json과 같은 날짜 축
+    models     - unique_id -> {id, name, provider, input, output} (dates와 같은 길이, 없는 날은 null)
+
+대시보드는 집계 파일과 표시할 모델의 프로바이더 파일만 요청하므로
+날짜별 스냅샷이나 전체 모델 시계열을 내려받지 않습니다.
+
+사용법:
+    python scripts/history/chart_series.py [--output-dir data/charts]
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.json_codec import dump_json
+from history.records import iter_price_records
+from history.reader import open_history
+
+SERIES_VERSION = 2
+WINDOWS = (30, 90, 365)
+
+
+def _average(values: List[float]) -> Optional[float]:
+    return round(sum(values) / len(values), 6) if values else None
+
+
+def collect_rows(history_dir: Optional[Path] = None, days: int = max(WINDOWS)) -> List[Dict[str, Any]]:
+    """마지막 스냅샷 기준 days일 구간의 날짜별 가격 레코드 (날짜 오름차순)"""
+    history = open_history(history_dir)
+    dates = history.dates()
+    if not dates:
+        return []
+    end = datetime.strptime(dates[-1], "%Y-%m-%d")
+    start = (end - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+
+    rows = []
+    for date, snapshot in history.iter_snapshots(start=start):
+        records = {}
+        for record in iter_price_records(snapshot):
+            records[record['unique_id']] = record
+        rows.append({'date': date, 'records': records})
+    return rows
+
+
+def build_series(rows: Sequence[Dict[str, Any]], days: int) -> Dict[str, Any]:
+    """날짜별 레코드에서 구간 하나의 차트 시계열 생성"""
+    if rows:
+        end = datetime.strptime(rows[-1]['date'], "%Y-%m-%d")
+        start = (end - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+        rows = [row for row in rows if row['date'] >= start]
+    dates = [row['date'] for row in rows]
+
+    models = {}
+    providers = {}
+    for position, row in enumerate(rows):
+        by_provider = {}
+        for unique_id, record in row['records'].items():
+            series = models.get(unique_id)
+            if series is None:
+                series = models[unique_id] = {
+                    'id': record['id'],
+                    'name': record['name'],
+                    'provider': record['provider'],
+                    'input': [None] * len(rows),
+                    'output': [None] * len(rows)
+                }
+            else:
+                # 이름이 바뀐 경우 최신 값으로 표시
+                series['name'] = record['name']
+            series['input'][position] = record['input_price']
+            series['output'][position] = record['output_price']
+
+            paid = by_provider.setdefault(record['provider'], {'count': 0, 'input': [], 'output': []})
+            paid['count'] += 1
+            if record['input_price'] > 0 or record['output_price'] > 0:
+                paid['input'].append(record['input_price'])
+                paid['output'].append(record['output_price'])
+
+        for provider, paid in by_provider.items():
+            series = providers.get(provider)
+            if series is None:
+                series = providers[provider] = {
+                    'models': [0] * len(rows),
+                    'input_avg': [None] * len(rows),
+                    'output_avg': [None] * len(rows)
+                }
+            series['models'][position] = paid['count']
+            series['input_avg'][position] = _average(paid['input'])
+            series['output_avg'][position] = _average(paid['output'])
+
+    return {
+        'version': SERIES_VERSION,
+        'generated_at': datetime.now().isoformat(),
+        'window': days,
+        'start': dates[0] if dates else None,
+        'end': dates[-1] if dates else None,
+        'dates': dates,
+        'models': {uid: models[uid] for uid in sorted(models)},
+        'providers': {name: providers[name] for name in sorted(providers)}
+    }
+
+
+def split_series(series: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """구간 시계열을 (프로바이더 집계, provider -> 모델 시계열)로 나눔"""
+    header = {key: series[key] for key in ('version', 'generated_at', 'window', 'start', 'end', 'dates')}
+    by_provider = {}
+    for unique_id, model in series['models'].items():
+        by_provider.setdefault(model['provider'], {})[unique_id] = model
+
+    index = {**header, 'providers': series['providers']}
+    files = {
+        provider: {**header, 'provider': provider, 'models': models}
+        for provider, models in by_provider.items()
+    }
+    return index, files
+
+
+def write_chart_series(history_dir: Optional[Path] = None, output_dir: Optional[Path] = None,
+                       windows: Sequence[int] = WINDOWS) -> Dict[int, Dict[str, Any]]:
+    """구간별 차트 시계열 파일 저장 (가장 긴 구간만 한 번 읽음, 없어진 프로바이더 파일은 삭제)"""
+    base_dir = Path(__file__).parent.parent.parent
+    output_dir = Path(output_dir or base_dir / "data/charts")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    rows = collect_rows(history_dir, max(windows))
+
+    results = {}
+    for days in windows:
+        series = build_series(rows, days)
+        index, files = split_series(series)
+        window_dir = output_dir / str(days)
+        window_dir.mkdir(parents=True, exist_ok=True)
+        for provider, content in files.items():
+            dump_json(content, window_dir / f"{provider}.json", indent=False, atomic=True)
+        dump_json(index, window_dir / "index.json", indent=False, atomic=True)
+        for path in window_dir.glob("*.json"):
+            if path.stem != 'index' and path.stem not in files:
+                path.unlink()
+        results[days] = series
+
+    # 이전 형식의 구간 통합 파일
+    for path in output_dir.glob("series-*.json"):
+        path.unlink()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-aggregated chart series")
+    parser.add_argument('--history-dir', type=Path, default=None)
+    parser.add_argument('--output-dir', type=Path, default=None)
+    args = parser.parse_args()
+
+    results = write_chart_series(args.history_dir, args.output_dir)
+    for days, series in results.items():
+        print(f"✅ Chart series {days}d: {len(series['dates'])} days, "
+              f"{len(series['models'])} models, {len(series['providers'])} providers")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+히스토리 보존 정책 / 다운샘플링 압축
+최근 N일은 일별 스냅샷을 유지하고, 그보다 오래된 기간은 주별 또는 월별 집계 스냅샷 하나로 합칩니다.
+
+집계 스냅샷은 일반 스냅샷과 같은 저장소(index.json + blobs/)에 기간의 마지막 날짜로 저장되며,
+price_snapshot 레코드에 기간 내 마지막 가격과 함께 최소/최대 가격, 처음/마지막 관측일을 담습니다.
+
+    {"schema_version": 2, "resolution": "weekly", "period_start": ..., "period_end": ..., "days": 7,
+     "price_snapshot": [{"unique_id": ..., "input_price": <last>, "input_price_min": ...,
+                         "input_price_max": ..., "first_seen": ..., "last_seen": ..., ...}]}
+
+따라서 히스토리를 읽는 쪽(델타, 시계열, DB, 차트)은 해상도와 무관하게 같은 방식으로 읽습니다.
+
+- 기준일은 실행 시각이 아니라 저장소의 마지막 날짜이므로 같은 입력에서는 항상 같은 결과가 나옵니다.
+- 최소/최대/마지막 값과 관측일은 다시 합쳐도 값이 같으므로, 여러 번 나눠 압축해도 한 번에 압축한 결과와 같습니다.
+- 주 단위 구간은 월 경계에서 잘리므로 주별 집계는 나중에 월별 집계로 그대로 합쳐집니다.
+
+사용법:
+    python scripts/history/compaction.py [--daily-days 90] [--weekly-days 365] [--dry-run]
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from history.snapshot_store import HistoryStore
+from history.records import SNAPSHOT_SCHEMA_VERSION, iter_price_records
+
+DEFAULT_DAILY_DAYS = 90
+DEFAULT_WEEKLY_DAYS = 365
+
+RESOLUTIONS = ('daily', 'weekly', 'monthly')
+PRICE_FIELDS = ('input_price', 'output_price')
+# 기간 내 마지막 관측 값을 유지하는 필드
+LAST_FIELDS = ('id', 'name', 'provider', 'context_window', 'status')
+
+
+def _parse(date: str) -> datetime:
+    return datetime.strptime(date, "%Y-%m-%d")
+
+
+def bucket_start(date: str, resolution: str) -> str:
+    """날짜가 속한 집계 구간의 시작일 (주 구간은 월 경계에서 자름)"""
+    day = _parse(date)
+    month_start = day.replace(day=1)
+    if resolution == 'monthly':
+        return month_start.strftime("%Y-%m-%d")
+    if resolution == 'weekly':
+        monday = day - timedelta(days=day.weekday())
+        return max(monday, month_start).strftime("%Y-%m-%d")
+    return date
+
+
+def bucket_end(date: str, resolution: str) -> str:
+    """날짜가 속한 집계 구간의 (명목상) 마지막 날"""
+    day = _parse(date)
+    next_month = (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    month_end = next_month - timedelta(days=1)
+    if resolution == 'monthly':
+        return month_end.strftime("%Y-%m-%d")
+    if resolution == 'weekly':
+        sunday = day + timedelta(days=6 - day.weekday())
+        return min(sunday, month_end).strftime("%Y-%m-%d")
+    return date
+
+
+def target_resolution(date: str, reference: str, daily_days: int, weekly_days: int) -> str:
+    """보존 해상도 (구간 전체가 기준 기간보다 오래되었을 때만 더 거친 해상도로)
+
+    같은 구간의 날짜와 그 구간의 집계는 항상 같은 해상도로 분류되므로
+    압축을 여러 번 나눠 실행해도 한 번에 실행한 결과와 같습니다.
+    """
+    reference_day = _parse(reference)
+    if (reference_day - _parse(bucket_end(date, 'monthly'))).days >= weekly_days:
+        return 'monthly'
+    if (reference_day - _parse(bucket_end(date, 'weekly'))).days >= daily_days:
+        return 'weekly'
+    return 'daily'
+
+
+def to_period(date: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """스냅샷(일별 또는 집계)을 합칠 수 있는 기간 단위로 변환"""
+    if snapshot.get('resolution') in RESOLUTIONS[1:]:
+        return {
+            'resolution': snapshot['resolution'],
+            'period_start': snapshot['period_start'],
+            'period_end': snapshot['period_end'],
+            'days': snapshot['days'],
+            'records': {record['unique_id']: dict(record) for record in snapshot['price_snapshot']}
+        }
+
+    records = {}
+    for record in iter_price_records(snapshot):
+        record = dict(record)
+        for field in PRICE_FIELDS:
+            record[f'{field}_min'] = record[field]
+            record[f'{field}_max'] = record[field]
+        record['first_seen'] = date
+        record['last_seen'] = date
+        records[record['unique_id']] = record
+    return {'resolution': 'daily', 'period_start': date, 'period_end': date, 'days': 1, 'records': records}
+
+
+def merge_periods(periods: List[Dict[str, Any]], resolution: str) -> Dict[str, Any]:
+    """기간 단위들을 하나의 집계로 합침 (기간 순서대로 적용)"""
+    periods = sorted(periods, key=lambda period: period['period_start'])
+    merged = {}
+    for period in periods:
+        for unique_id, record in period['records'].items():
+            current = merged.get(unique_id)
+            if current is None:
+                merged[unique_id] = dict(record)
+                continue
+            for field in PRICE_FIELDS:
+                current[f'{field}_min'] = min(current[f'{field}_min'], record[f'{field}_min'])
+                current[f'{field}_max'] = max(current[f'{field}_max'], record[f'{field}_max'])
+            current['first_seen'] = min(current['first_seen'], record['first_seen'])
+            if record['last_seen'] >= current['last_seen']:
+                current['last_seen'] = record['last_seen']
+                for field in PRICE_FIELDS + LAST_FIELDS + ('unique_id',):
+                    current[field] = record[field]
+
+    return {
+        'schema_version': SNAPSHOT_SCHEMA_VERSION,
+        'resolution': resolution,
+        'period_start': periods[0]['period_start'],
+        'period_end': max(period['period_end'] for period in periods),
+        'days': sum(period['days'] for period in periods),
+        'price_snapshot': [merged[unique_id] for unique_id in sorted(merged)]
+    }
+
+
+def plan_compaction(store: HistoryStore, daily_days: int = DEFAULT_DAILY_DAYS,
+                    weekly_days: int = DEFAULT_WEEKLY_DAYS) -> Dict[Tuple[str, str], List[str]]:
+    """(해상도, 구간 시작일) -> 합칠 저장 날짜 목록 (이미 목표 상태인 구간 제외)"""
+    dates = store.dates()
+    if not dates:
+        return {}
+    reference = dates[-1]
+
+    groups = {}
+    current = {}
+    for date in dates:
+        snapshot = store.load(date)
+        resolution = snapshot.get('resolution', 'daily')
+        start = snapshot.get('period_start', date)
+        # 이미 집계된 구간은 더 세밀한 해상도로 되돌리지 않음
+        target = max(resolution, target_resolution(start, reference, daily_days, weekly_days),
+                     key=RESOLUTIONS.index)
+        if target == 'daily':
+            continue
+        key = (target, bucket_start(start, target))
+        groups.setdefault(key, []).append(date)
+        current.setdefault(key, []).append(resolution)
+
+    return {
+        key: members for key, members in groups.items()
+        if not (len(members) == 1 and current[key][0] == key[0])
+    }
+
+
+def compact(store: HistoryStore, daily_days: int = DEFAULT_DAILY_DAYS,
+            weekly_days: int = DEFAULT_WEEKLY_DAYS, dry_run: bool = False) -> Dict[str, int]:
+    """보존 정책에 따라 오래된 스냅샷을 집계 스냅샷으로 교체"""
+    if daily_days > weekly_days:
+        raise ValueError("daily_days must not exceed weekly_days")
+
+    plan = plan_compaction(store, daily_days, weekly_days)
+    stats = {'dates_before': len(store.dates()), 'groups': len(plan),
+             'merged': sum(len(members) for members in plan.values())}
+    if dry_run:
+        stats['dates_after'] = stats['dates_before'] - stats['merged'] + stats['groups']
+        return stats
+
+    for (resolution, _), members in sorted(plan.items()):
+        aggregate = merge_periods([to_period(date, store.load(date)) for date in members], resolution)
+        for date in members:
+            store.remove(date, save=False)
+        store.put(aggregate['period_end'], {'date': aggregate['period_end'], **aggregate}, save=False)
+
+    store.save_index()
+    stats['blobs_removed'] = store.gc()
+    stats['dates_after'] = len(store.dates())
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="History retention / downsampling compaction")
+    parser.add_argument('--history-dir', type=Path, default=None)
+    parser.add_argument('--daily-days', type=int, default=DEFAULT_DAILY_DAYS,
+                        help=f"일별 해상도를 유지할 기간 (기본: {DEFAULT_DAILY_DAYS}일)")
+    parser.add_argument('--weekly-days', type=int, default=DEFAULT_WEEKLY_DAYS,
+                        help=f"주별 집계를 유지할 기간, 이후는 월별 (기본: {DEFAULT_WEEKLY_DAYS}일)")
+    parser.add_argument('--dry-run', action='store_true', help="결과만 출력")
+    args = parser.parse_args()
+
+    stats = compact(HistoryStore(args.history_dir), args.daily_days, args.weekly_days, args.dry_run)
+    print(f"✅ {'Planned' if args.dry_run else 'Compacted'} {stats['merged']} snapshots into "
+          f"{stats['groups']} aggregates: {stats['dates_before']} → {stats['dates_after']} dates")
+    if not args.dry_run:
+        print(f"   - Removed {stats['blobs_removed']} unreferenced blobs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+델타 인코딩 히스토리
+N일마다 전체 스냅샷(keyframe)을 저장하고, 그 사이의 날짜는 unique_id 기준 모델 단위 패치만 저장합니다.
+
+data/history/deltas/
+    manifest.json          - 날짜별 항목 (keyframe/patch, 원본 해시, 이전 형식 파일이면 크기/수정 시각)
+    keyframes/<date>.json  - 전체 스냅샷 (모델은 unique_id -> 레코드)
+    patches/<date>.json    - 직전 날짜 대비 변경분
+
+특정 날짜 복원 비용은 가장 가까운 keyframe 이후 적용하는 패치 수에 비례합니다.
+원본은 HistoryStore(blob 저장소/이전 형식 파일)이며 `sync`로 증분 갱신합니다.
+과거 날짜가 추가되거나 바뀌면 그 날짜 앞의 keyframe부터 다시 인코딩합니다.
+
+사용법:
+    python scripts/history/delta_store.py sync [--interval 30]
+    python scripts/history/delta_store.py show 2025-10-14
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.json_codec import load_json, dump_json
+from history.snapshot_store import HistoryStore, strip_volatile
+from history.records import model_unique_id
+
+MANIFEST_VERSION = 1
+DEFAULT_KEYFRAME_INTERVAL = 30
+MODEL_KEYS = ('models', 'price_snapshot')
+
+
+def model_key(snapshot: Dict[str, Any]) -> Optional[str]:
+    """스냅샷에서 모델 목록이 들어있는 키 ('models' 또는 'price_snapshot')"""
+    for key in MODEL_KEYS:
+        if key in snapshot:
+            return key
+    return None
+
+
+def explode(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """스냅샷을 (최상위 필드, unique_id -> 모델, 순서) 형태로 분해"""
+    key = model_key(snapshot)
+    models = snapshot.get(key, []) if key else []
+    return {
+        'key_order': list(snapshot.keys()),
+        'models_key': key,
+        'fields': {k: v for k, v in snapshot.items() if k != key},
+        'order': [model_unique_id(model) for model in models],
+        'models': {model_unique_id(model): model for model in models}
+    }
+
+
+def implode(state: Dict[str, Any]) -> Dict[str, Any]:
+    """분해된 상태를 원래 스냅샷 형태로 복원"""
+    snapshot = {}
+    for key in state['key_order']:
+        if key == state['models_key']:
+            snapshot[key] = [state['models'][uid] for uid in state['order']]
+        elif key in state['fields']:
+            snapshot[key] = state['fields'][key]
+    return snapshot
+
+
+def diff_states(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """두 상태 사이의 패치 생성"""
+    patch = {}
+
+    if previous['key_order'] != current['key_order']:
+        patch['key_order'] = current['key_order']
+
+    fields = {k: v for k, v in current['fields'].items() if previous['fields'].get(k) != v or k not in previous['fields']}
+    if fields:
+        patch['fields'] = fields
+    removed_fields = [k for k in previous['fields'] if k not in current['fields']]
+    if removed_fields:
+        patch['removed_fields'] = removed_fields
+
+    prev_models = previous['models']
+    added, changed, deleted_keys = {}, {}, {}
+    for uid, model in current['models'].items():
+        old = prev_models.get(uid)
+        if old is None:
+            added[uid] = model
+            continue
+        if old == model:
+            continue
+        delta = {k: v for k, v in model.items() if k not in old or old[k] != v}
+        if delta:
+            changed[uid] = delta
+        missing = [k for k in old if k not in model]
+        if missing:
+            deleted_keys[uid] = missing
+
+    removed = [uid for uid in prev_models if uid not in current['models']]
+    if added:
+        patch['added'] = added
+    if changed:
+        patch['changed'] = changed
+    if deleted_keys:
+        patch['deleted_keys'] = deleted_keys
+    if removed:
+        patch['removed'] = removed
+    if previous['order'] != current['order']:
+        patch['order'] = current['order']
+    return patch
+
+
+def apply_patch(state: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """상태에 패치를 적용 (state를 직접 수정하고 반환)"""
+    if 'key_order' in patch:
+        state['key_order'] = patch['key_order']
+    state['fields'].update(patch.get('fields', {}))
+    for key in patch.get('removed_fields', []):
+        state['fields'].pop(key, None)
+
+    models = state['models']
+    for uid in patch.get('removed', []):
+        models.pop(uid, None)
+    for uid, model in patch.get('added', {}).items():
+        models[uid] = model
+    for uid, delta in patch.get('changed', {}).items():
+        # 패치 적용 시 keyframe 원본이 바뀌지 않도록 모델 단위로 복사
+        updated = dict(models[uid])
+        updated.update(delta)
+        for key in patch.get('deleted_keys', {}).get(uid, []):
+            updated.pop(key, None)
+        models[uid] = updated
+    for uid, keys in patch.get('deleted_keys', {}).items():
+        if uid not in patch.get('changed', {}):
+            models[uid] = {k: v for k, v in models[uid].items() if k not in keys}
+    if 'order' in patch:
+        state['order'] = patch['order']
+    return state
+
+
+class DeltaHistory:
+    """keyframe + 일별 패치로 저장된 히스토리"""
+
+    def __init__(self, history_dir: Optional[Path] = None, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        self.history_dir = Path(history_dir or Path(__file__).parent.parent.parent / "data/history")
+        self.delta_dir = self.history_dir / "deltas"
+        self.manifest_file = self.delta_dir / "manifest.json"
+        self.keyframe_interval = keyframe_interval
+        self._manifest = None
+
+    # ---- manifest ----
+
+    def load_manifest(self) -> Dict[str, Any]:
+        if self._manifest is None:
+            if self.manifest_file.exists():
+                self._manifest = load_json(self.manifest_file)
+            else:
+                self._manifest = {
+                    'version': MANIFEST_VERSION,
+                    'keyframe_interval': self.keyframe_interval,
+                    'entries': []
+                }
+        return self._manifest
+
+    def save_manifest(self):
+        self.delta_dir.mkdir(parents=True, exist_ok=True)
+        dump_json(self.load_manifest(), self.manifest_file, atomic=True)
+
+    def exists(self) -> bool:
+        return self.manifest_file.exists()
+
+    def entries(self) -> List[Dict[str, Any]]:
+        return self.load_manifest()['entries']
+
+    def dates(self) -> List[str]:
+        return [entry['date'] for entry in self.entries()]
+
+    def has(self, date: str) -> bool:
+        return any(entry['date'] == date for entry in self.entries())
+
+    def latest(self, before: Optional[str] = None) -> Optional[str]:
+        dates = [d for d in self.dates() if before is None or d < before]
+        return dates[-1] if dates else None
+
+    def is_current(self, store: HistoryStore) -> bool:
+        """원본 저장소와 날짜·내용이 같은지 (이전 형식 파일은 해시 대신 크기/수정 시각 비교)"""
+        entries = self.entries()
+        if [entry['date'] for entry in entries] != store.dates():
+            return False
+        for entry in entries:
+            stamp = store.legacy_stamp(entry['date'])
+            if stamp is None:
+                if entry['source'] != store.source_digest(entry['date']):
+                    return False
+            elif entry.get('stamp') != stamp:
+                return False
+        return True
+
+    def _entry_path(self, entry: Dict[str, Any]) -> Path:
+        folder = 'keyframes' if entry['kind'] == 'keyframe' else 'patches'
+        return self.delta_dir / folder / f"{entry['date']}.json"
+
+    # ---- read ----
+
+    def _position(self, date: str) -> int:
+        for position, entry in enumerate(self.entries()):
+            if entry['date'] == date:
+                return position
+        raise KeyError(date)
+
+    def materialize_state(self, date: str) -> Dict[str, Any]:
+        """날짜의 분해된 상태 복원 (가장 가까운 이전 keyframe + 패치)"""
+        entries = self.entries()
+        target = self._position(date)
+        start = target
+        while entries[start]['kind'] != 'keyframe':
+            start -= 1
+
+        state = load_json(self._entry_path(entries[start]))
+        for entry in entries[start + 1:target + 1]:
+            apply_patch(state, load_json(self._entry_path(entry)))
+        return state
+
+    def load(self, date: str) -> Optional[Dict[str, Any]]:
+        """날짜의 스냅샷 복원 (없으면 None)"""
+        if not self.has(date):
+            return None
+        return implode(self.materialize_state(date))
+
+    def iter_snapshots(self, start: Optional[str] = None,
+                       end: Optional[str] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """기간 내 스냅샷을 순서대로 복원 (패치를 누적 적용하므로 날짜당 패치 1회 비용)"""
+        state = None
+        previous_position = None
+        for position, entry in enumerate(self.entries()):
+            date = entry['date']
+            if end and date > end:
+                break
+            if start and date < start:
+                continue
+            if state is None or entry['kind'] == 'keyframe' or previous_position != position - 1:
+                state = self.materialize_state(date)
+            else:
+                apply_patch(state, load_json(self._entry_path(entry)))
+            previous_position = position
+            yield date, implode(state)
+
+    # ---- write ----
+
+    def _truncate(self, position: int):
+        """position 이후 항목 삭제"""
+        entries = self.entries()
+        for entry in entries[position:]:
+            self._entry_path(entry).unlink(missing_ok=True)
+        del entries[position:]
+
+    def append(self, date: str, snapshot: Dict[str, Any], source: str = '',
+               previous_state: Optional[Dict[str, Any]] = None,
+               stamp: Optional[List[int]] = None) -> Dict[str, Any]:
+        """마지막 날짜 다음에 스냅샷 추가 후 분해된 상태 반환"""
+        entries = self.entries()
+        if entries and entries[-1]['date'] >= date:
+            raise ValueError(f"{date} is not after last encoded date {entries[-1]['date']}")
+
+        # 최상위 필드는 유지하고 중첩된 크롤링 시각만 제거
+        state = explode({key: strip_volatile(value, top_level=False) for key, value in snapshot.items()})
+        last_keyframe = max((i for i, e in enumerate(entries) if e['kind'] == 'keyframe'), default=None)
+
+        keyframe = (
+            not entries
+            or last_keyframe is None
+            or len(entries) - last_keyframe >= self.load_manifest()['keyframe_interval']
+        )
+        if not keyframe:
+            if previous_state is None:
+                previous_state = self.materialize_state(entries[-1]['date'])
+            keyframe = previous_state['models_key'] != state['models_key']
+
+        entry = {'date': date, 'kind': 'keyframe' if keyframe else 'patch', 'source': source}
+        if stamp:
+            entry['stamp'] = stamp
+        path = self._entry_path(entry)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        dump_json(state if keyframe else diff_states(previous_state, state), path, indent=False)
+        entries.append(entry)
+        return state
+
+    def sync(self, store: HistoryStore) -> Dict[str, int]:
+        """HistoryStore와 비교하여 새로 추가되거나 바뀐 날짜 앞의 keyframe부터 다시 인코딩"""
+        entries = self.entries()
+        encoded = {entry['date']: entry for entry in entries}
+        dates = store.dates()
+        stamps = {date: store.legacy_stamp(date) for date in dates}
+        sources = {}
+        for date in dates:
+            # 이전 형식 파일은 크기/수정 시각이 같으면 다시 해시하지 않음
+            entry = encoded.get(date)
+            if stamps[date] and entry and entry.get('stamp') == stamps[date]:
+                sources[date] = entry['source']
+            else:
+                sources[date] = store.source_digest(date)
+
+        # 날짜(중간에 추가/삭제된 날짜 포함)나 원본이 달라진 첫 위치 찾기
+        position = 0
+        while (position < min(len(entries), len(dates))
+               and entries[position]['date'] == dates[position]
+               and entries[position]['source'] == sources[dates[position]]):
+            position += 1
+        # 내용이 같은 이전 형식 파일은 크기/수정 시각만 갱신 (open_history가 해시 없이 비교)
+        for entry in entries[:position]:
+            if stamps[entry['date']] and entry.get('stamp') != stamps[entry['date']]:
+                entry['stamp'] = stamps[entry['date']]
+        # 패치는 직전 날짜 기준이므로 그 앞의 keyframe부터 다시 인코딩
+        if position < len(entries):
+            while position > 0 and entries[position]['kind'] != 'keyframe':
+                position -= 1
+
+        rewritten = len(entries) - position
+        self._truncate(position)
+
+        state = None
+        appended = 0
+        for date in dates[position:]:
+            snapshot = store.load(date)
+            if snapshot is None:
+                continue
+            # 방금 인코딩한 상태를 다음 날짜의 비교 기준으로 재사용
+            state = self.append(date, snapshot, source=sources[date], previous_state=state,
+                                stamp=stamps[date])
+            appended += 1
+
+        self.save_manifest()
+        return {'rewritten': rewritten, 'appended': appended, 'total': len(self.entries())}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delta-encoded history")
+    parser.add_argument('--history-dir', type=Path, default=None)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    sync_parser = subparsers.add_parser('sync', help="히스토리 저장소와 동기화")
+    sync_parser.add_argument('--interval', type=int, default=DEFAULT_KEYFRAME_INTERVAL,
+                             help="keyframe 간격 (새로 만드는 경우에만 적용)")
+
+    show_parser = subparsers.add_parser('show', help="날짜의 스냅샷 요약 출력")
+    show_parser.add_argument('date')
+
+    args = parser.parse_args()
+
+    if args.command == 'sync':
+        deltas = DeltaHistory(args.history_dir, keyframe_interval=args.interval)
+        stats = deltas.sync(HistoryStore(args.history_dir))
+        print(f"✅ Delta history synced: {stats['appended']} appended "
+              f"({stats['rewritten']} rewritten), {stats['total']} dates")
+    elif args.command == 'show':
+        snapshot = DeltaHistory(args.history_dir).load(args.date)
+        if snapshot is None:
+            print(f"❌ No snapshot for {args.date}")
+            return 1
+        key = model_key(snapshot)
+        print(f"📅 {args.date}: {len(snapshot.get(key, []))} models ({key})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
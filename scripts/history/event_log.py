@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+가격 변경 이벤트 로그
+PriceMonitor가 감지한 가격 변경을 세그먼트 단위 추가 전용(append-only) JSONL 로그에 기록하고,
+모델/제공업체별 오프셋 색인으로 스냅샷을 다시 비교하지 않고 조회합니다.
+
+data/history/events/
+    segment-000001.jsonl       - 이벤트 한 줄에 하나 (SEGMENT_BYTES를 넘으면 다음 세그먼트)
+    manifest.json              - 세그먼트 목록 (번호, 색인된 바이트 수, 이벤트 수)
+    index/models-00.json       - unique_id -> [[시각, 세그먼트, 오프셋, 길이], ...] (키 해시로 INDEX_SHARDS개로 분할)
+    index/providers-00.json    - 제공업체 -> 같은 형식
+
+색인 샤드는 필요할 때만 읽고, 추가 시에는 바뀐 샤드만 다시 씁니다.
+이벤트는 세그먼트에 먼저 쓰고 샤드, 마지막으로 manifest를 원자적으로 교체합니다.
+manifest 저장 전에 중단되면 manifest보다 긴 세그먼트 끝부분과 manifest에 없는 새 세그먼트를
+다음 열기 때 다시 읽어 복구합니다 (이미 샤드에 들어간 항목은 중복 추가하지 않음).
+manifest가 없으면 (이전 버전의 index.json 포함) 모든 세그먼트를 다시 읽어 색인을 만듭니다.
+
+조회 비용:
+    last_change(unique_id)               - 샤드 하나 읽기 + 색인 마지막 항목 한 줄 읽기
+    model_changes / provider_changes     - 샤드 하나 읽기 + 기간 경계를 이분 탐색한 뒤 해당 이벤트만 읽기
+
+사용법:
+    python scripts/history/event_log.py last openai/gpt-4o
+    python scripts/history/event_log.py model openai/gpt-4o [--since 2025-07-01] [--until 2025-09-30]
+    python scripts/history/event_log.py provider openai [--since 2025-07-01] [--until 2025-09-30]
+    python scripts/history/event_log.py stats
+"""
+
+import argparse
+import os
+import re
+import sys
+import zlib
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.json_codec import load_json, dump_json, dumps, loads
+
+INDEX_VERSION = 2
+SEGMENT_BYTES = 4 * 1024 * 1024
+INDEX_SHARDS = 64
+INDEX_KINDS = ('models', 'providers')
+SEGMENT_PATTERN = re.compile(r'segment-(\d+)\.jsonl$')
+
+# 색인 항목의 위치
+TIMESTAMP, SEGMENT, OFFSET, LENGTH = range(4)
+
+
+def segment_name(number: int) -> str:
+    return f"segment-{number:06d}.jsonl"
+
+
+def shard_of(key: str) -> int:
+    return zlib.crc32(key.encode('utf-8')) % INDEX_SHARDS
+
+
+def change_event(change: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
+    """PriceMonitor.compare_prices 변경 항목을 이벤트로 변환"""
+    event = {
+        'timestamp': timestamp,
+        'unique_id': change.get('unique_id') or f"{change['provider']}/{change['model_id']}",
+        'model_id': change['model_id'],
+        'name': change['name'],
+        'provider': change['provider'],
+        'type': change.get('type', 'changed'),
+        'input_price': {key: value for key, value in change['input_price'].items() if key in ('old', 'new')},
+        'output_price': {key: value for key, value in change['output_price'].items() if key in ('old', 'new')}
+    }
+    if 'confidence' in change:
+        event['confidence'] = change['confidence']
+        event['suppressed'] = change.get('suppressed', False)
+    return event
+
+
+class EventLog:
+    """세그먼트 JSONL 이벤트 로그 + 모델/제공업체 오프셋 색인 (샤드 단위 지연 로드)"""
+
+    def __init__(self, history_dir: Optional[Path] = None, segment_bytes: int = SEGMENT_BYTES):
+        base_dir = Path(__file__).parent.parent.parent
+        history_dir = Path(history_dir) if history_dir else base_dir / "data/history"
+        self.events_dir = history_dir / "events"
+        self.manifest_file = self.events_dir / "manifest.json"
+        self.shard_dir = self.events_dir / "index"
+        self.segment_bytes = segment_bytes
+        self._shards = {}
+        self._dirty = set()
+        self.manifest = self._load_manifest()
+        self._recover()
+
+    # ---- 색인 ----
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if self.manifest_file.exists():
+            manifest = load_json(self.manifest_file)
+            if manifest.get('version') == INDEX_VERSION:
+                return manifest
+        # 없거나 이전 버전이면 샤드(와 이전 버전의 index.json)를 비우고 세그먼트를 처음부터 다시 색인
+        if self.shard_dir.exists():
+            for path in self.shard_dir.glob("*.json"):
+                path.unlink()
+        legacy = self.events_dir / "index.json"
+        if legacy.exists():
+            legacy.unlink()
+        return {'version': INDEX_VERSION, 'segments': []}
+
+    def _shard(self, kind: str, number: int) -> Dict[str, List[List[Any]]]:
+        key = (kind, number)
+        if key not in self._shards:
+            path = self.shard_dir / f"{kind}-{number:02d}.json"
+            self._shards[key] = load_json(path) if path.exists() else {}
+        return self._shards[key]
+
+    def _postings(self, kind: str, key: str) -> List[List[Any]]:
+        return self._shard(kind, shard_of(key)).get(key, [])
+
+    def _save_index(self):
+        """바뀐 샤드를 쓴 뒤 manifest 교체 (manifest 교체가 커밋 지점)"""
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        for kind, number in sorted(self._dirty):
+            dump_json(self._shards[(kind, number)], self.shard_dir / f"{kind}-{number:02d}.json",
+                      indent=False, atomic=True)
+        self._dirty.clear()
+        dump_json(self.manifest, self.manifest_file, indent=False, atomic=True)
+
+    def _add_to_index(self, event: Dict[str, Any], segment: int, offset: int, length: int,
+                      recovering: bool = False):
+        entry = [event['timestamp'], segment, offset, length]
+        for kind, key in (('models', event['unique_id']), ('providers', event['provider'])):
+            number = shard_of(key)
+            postings = self._shard(kind, number).setdefault(key, [])
+            # 복구 중에는 manifest 저장 전에 샤드에 들어간 항목을 건너뜀
+            if recovering and any(p[SEGMENT] == segment and p[OFFSET] == offset for p in postings):
+                continue
+            # 대부분 시각 순으로 추가되므로 끝에 붙이고, 과거 시각이면 정렬 위치에 삽입
+            if postings and postings[-1][TIMESTAMP] > entry[TIMESTAMP]:
+                postings.insert(bisect_right(postings, entry[TIMESTAMP], key=itemgetter(TIMESTAMP)), entry)
+            else:
+                postings.append(entry)
+            self._dirty.add((kind, number))
+
+    def _segment_files(self) -> Dict[int, Path]:
+        if not self.events_dir.exists():
+            return {}
+        files = {}
+        for path in self.events_dir.glob("segment-*.jsonl"):
+            match = SEGMENT_PATTERN.match(path.name)
+            if match:
+                files[int(match.group(1))] = path
+        return files
+
+    def _recover(self):
+        """manifest에 반영되지 않은 세그먼트 끝부분과 새 세그먼트를 다시 색인하고 잘린 줄은 잘라냄"""
+        segments = self.manifest['segments']
+        known = {segment['number']: segment for segment in segments}
+        last = segments[-1]['number'] if segments else 0
+        # manifest가 없었으면 샤드도 비어 있으므로 중복 확인이 필요 없음
+        recovering = bool(segments)
+        changed = False
+
+        for number, path in sorted(self._segment_files().items()):
+            segment = known.get(number)
+            if segment is None:
+                if number < last:
+                    continue  # manifest보다 오래된 번호는 다른 경로로 생긴 파일
+                segment = {'number': number, 'bytes': 0, 'count': 0}
+                segments.append(segment)
+                changed = True
+            if path.stat().st_size == segment['bytes']:
+                continue
+
+            with open(path, 'rb') as f:
+                f.seek(segment['bytes'])
+                offset = segment['bytes']
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # 쓰는 도중 중단된 마지막 줄
+                    self._add_to_index(loads(line), number, offset, len(line), recovering)
+                    offset += len(line)
+                    segment['count'] += 1
+                segment['bytes'] = offset
+                # 잘린 줄은 다음 추가 전에 잘라냄
+                f.seek(0, os.SEEK_END)
+                truncate = f.tell() != offset
+            if truncate:
+                with open(path, 'r+b') as f:
+                    f.truncate(offset)
+            changed = True
+
+        if changed:
+            self._save_index()
+
+    # ---- 기록 ----
+
+    def append(self, events: List[Dict[str, Any]]) -> int:
+        """이벤트 추가 (세그먼트 기록 후 색인 저장), 추가한 개수 반환"""
+        if not events:
+            return 0
+        self.events_dir.mkdir(parents=True, exist_ok=True)
+        segments = self.manifest['segments']
+        if not segments or segments[-1]['bytes'] >= self.segment_bytes:
+            number = segments[-1]['number'] + 1 if segments else 1
+            segments.append({'number': number, 'bytes': 0, 'count': 0})
+
+        segment = segments[-1]
+        path = self.events_dir / segment_name(segment['number'])
+        with open(path, 'ab') as f:
+            for event in events:
+                line = dumps(event, indent=False) + b'\n'
+                f.write(line)
+                self._add_to_index(event, segment['number'], segment['bytes'], len(line))
+                segment['bytes'] += len(line)
+                segment['count'] += 1
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._save_index()
+        return len(events)
+
+    def append_changes(self, changes: List[Dict[str, Any]], timestamp: Optional[str] = None) -> int:
+        """PriceMonitor 변경 목록을 이벤트로 추가"""
+        timestamp = timestamp or datetime.now().isoformat()
+        return self.append([change_event(change, timestamp) for change in changes])
+
+    # ---- 조회 ----
+
+    def _read(self, entries: List[List[Any]]) -> List[Dict[str, Any]]:
+        """색인 항목의 이벤트 읽기 (세그먼트별로 파일을 한 번만 엶)"""
+        events = []
+        handles = {}
+        try:
+            for entry in entries:
+                handle = handles.get(entry[SEGMENT])
+                if handle is None:
+                    handle = handles[entry[SEGMENT]] = open(self.events_dir / segment_name(entry[SEGMENT]), 'rb')
+                handle.seek(entry[OFFSET])
+                events.append(loads(handle.read(entry[LENGTH])))
+        finally:
+            for handle in handles.values():
+                handle.close()
+        return events
+
+    @staticmethod
+    def _between(postings: List[List[Any]], since: Optional[str], until: Optional[str]) -> List[List[Any]]:
+        """[since, until] 기간의 색인 항목 (날짜만 주면 그 날 전체 포함)"""
+        key = itemgetter(TIMESTAMP)
+        lo = bisect_left(postings, since, key=key) if since else 0
+        hi = bisect_right(postings, until + '\uffff', key=key) if until else len(postings)
+        return postings[lo:hi]
+
+    def last_change(self, unique_id: str) -> Optional[Dict[str, Any]]:
+        postings = self._postings('models', unique_id)
+        return self._read(postings[-1:])[0] if postings else None
+
+    def model_changes(self, unique_id: str, since: Optional[str] = None,
+                      until: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self._read(self._between(self._postings('models', unique_id), since, until))
+
+    def provider_changes(self, provider: str, since: Optional[str] = None,
+                         until: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self._read(self._between(self._postings('providers', provider), since, until))
+
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        """기록 순서대로 모든 이벤트"""
+        for segment in self.manifest['segments']:
+            with open(self.events_dir / segment_name(segment['number']), 'rb') as f:
+                remaining = segment['bytes']
+                for line in f:
+                    if remaining <= 0:
+                        break
+                    remaining -= len(line)
+                    yield loads(line)
+
+    def stats(self) -> Dict[str, Any]:
+        """세그먼트 통계 (모델/제공업체 수는 모든 샤드를 읽음)"""
+        segments = self.manifest['segments']
+        stats = {
+            'segments': len(segments),
+            'events': sum(segment['count'] for segment in segments),
+            'bytes': sum(segment['bytes'] for segment in segments)
+        }
+        for kind in INDEX_KINDS:
+            stats[kind] = sum(len(self._shard(kind, number)) for number in range(INDEX_SHARDS))
+        return stats
+
+
+def format_event(event: Dict[str, Any]) -> str:
+    line = f"{event['timestamp']}  {event['unique_id']}"
+    if event['type'] == 'new':
+        line += f"  new: input ${event['input_price']['new']}, output ${event['output_price']['new']}"
+    else:
+        line += (f"  input ${event['input_price']['old']} → ${event['input_price']['new']}, "
+                 f"output ${event['output_price']['old']} → ${event['output_price']['new']}")
+    if event.get('suppressed'):
+        line += f"  (suppressed, confidence {event['confidence']:.2f})"
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Price change event log")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    last = subparsers.add_parser('last', help='Last change of a model')
+    last.add_argument('unique_id')
+
+    for name, target in (('model', 'unique_id'), ('provider', 'provider')):
+        query = subparsers.add_parser(name, help=f'Changes of a {name} in a period')
+        query.add_argument(target)
+        query.add_argument('--since', help='Start date/time (inclusive)')
+        query.add_argument('--until', help='End date/time (inclusive)')
+
+    subparsers.add_parser('stats', help='Show log statistics')
+
+    args = parser.parse_args()
+    log = EventLog()
+
+    if args.command == 'last':
+        event = log.last_change(args.unique_id)
+        if event is None:
+            print(f"❌ No changes recorded for {args.unique_id}")
+            sys.exit(1)
+        print(format_event(event))
+
+    elif args.command in ('model', 'provider'):
+        if args.command == 'model':
+            events = log.model_changes(args.unique_id, args.since, args.until)
+        else:
+            events = log.provider_changes(args.provider, args.since, args.until)
+        for event in events:
+            print(format_event(event))
+        print(f"📊 {len(events)} events")
+
+    elif args.command == 'stats':
+        stats = log.stats()
+        print(f"📊 {stats['events']} events in {stats['segments']} segments ({stats['bytes'] / 1024:.1f}KB), "
+              f"{stats['models']} models, {stats['providers']} providers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+git 객체 기반 장중(intraday) 히스토리 추출
+워크플로우는 6시간마다 data/를 커밋하지만 data/history에는 하루 하나의 스냅샷만 남습니다.
+이 도구는 data/consolidated.json과 data/models/*.json이 바뀐 모든 커밋을 따라가며
+각 시점의 내용을 git cat-file --batch 프로세스 하나로 읽어 data/history/intraday/에 저장합니다.
+
+data/history/intraday/
+    index.json, blobs/     - HistoryStore 형식 (키: 커밋 시각 UTC 'YYYY-MM-DDTHH:MM:SSZ')
+    extract_state.json     - 마지막으로 처리한 커밋과 그 시점의 파일별 blob id
+
+- 스냅샷 본문은 history/records.py의 현재 스키마이며, index.json 필드에 date/timestamp/commit을 기록합니다.
+- 커밋 시점에 consolidated.json이 있으면 그 내용을, 없으면 제공업체 파일(openrouter 제외)의 모델을 사용합니다.
+- 다음 실행은 마지막 커밋 이후만 처리합니다. 히스토리가 다시 쓰여 마지막 커밋을 찾을 수 없으면 처음부터 다시 추출합니다.
+
+사용법:
+    python scripts/history/git_extractor.py extract [--repo .] [--full]
+    python scripts/history/git_extractor.py list
+"""
+
+import argparse
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.json_codec import load_json, dump_json, loads
+from history.snapshot_store import HistoryStore
+from history.records import SNAPSHOT_SCHEMA_VERSION, sorted_records, to_snapshot_body
+
+STATE_VERSION = 1
+CONSOLIDATED_PATH = 'data/consolidated.json'
+MODELS_DIR = 'data/models'
+EXCLUDED_PROVIDERS = ('openrouter',)
+NULL_OID = '0' * 40
+COMMIT_MARKER = '\x00'
+
+
+class GitObjectReader:
+    """git cat-file --batch 프로세스 하나로 blob 내용을 순차 조회"""
+
+    def __init__(self, repo: Path):
+        self.process = subprocess.Popen(
+            ['git', '-C', str(repo), 'cat-file', '--batch'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+
+    def read(self, oid: str) -> Optional[bytes]:
+        """객체 내용 (없으면 None)"""
+        self.process.stdin.write(f"{oid}\n".encode('ascii'))
+        self.process.stdin.flush()
+        header = self.process.stdout.readline().decode('ascii').split()
+        if len(header) < 3 or header[1] == 'missing':
+            return None
+        content = self.process.stdout.read(int(header[2]))
+        self.process.stdout.read(1)  # 내용 뒤 개행
+        return content
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+
+    def __enter__(self) -> 'GitObjectReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(['git', '-C', str(repo), *args], check=True,
+                          capture_output=True, text=True).stdout
+
+
+def is_tracked_path(path: str) -> bool:
+    return path == CONSOLIDATED_PATH or (path.startswith(f"{MODELS_DIR}/") and path.endswith('.json'))
+
+
+def tree_files(repo: Path, commit: str) -> Dict[str, str]:
+    """커밋 시점의 추적 대상 파일 -> blob id"""
+    files = {}
+    for line in git(repo, 'ls-tree', '-r', commit, '--', CONSOLIDATED_PATH, MODELS_DIR).splitlines():
+        meta, path = line.split('\t', 1)
+        _, kind, oid = meta.split()
+        if kind == 'blob' and is_tracked_path(path):
+            files[path] = oid
+    return files
+
+
+def iter_commits(repo: Path, revision_range: str) -> Iterator[Tuple[str, str, Dict[str, str]]]:
+    """(커밋, 커밋 시각, 바뀐 파일 -> 새 blob id) 를 오래된 순으로 생성 (git log 프로세스 하나)"""
+    process = subprocess.Popen(
+        ['git', '-C', str(repo), 'log', '--reverse', '--first-parent', '--diff-merges=first-parent',
+         '--raw', '--no-abbrev', '--no-renames', '--format=%x00%H %cI',
+         revision_range, '--', CONSOLIDATED_PATH, MODELS_DIR],
+        stdout=subprocess.PIPE, text=True
+    )
+    commit = None
+    for line in process.stdout:
+        line = line.rstrip('\n')
+        if line.startswith(COMMIT_MARKER):
+            if commit:
+                yield commit
+            sha, committed = line[1:].split(' ', 1)
+            commit = (sha, committed, {})
+        elif line.startswith(':') and commit:
+            meta, path = line.split('\t', 1)
+            new_oid = meta.split()[3]
+            if is_tracked_path(path):
+                commit[2][path] = new_oid
+    if commit:
+        yield commit
+    if process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, 'git log')
+
+
+def utc_key(committed: str) -> str:
+    """커밋 시각(ISO 8601) -> 저장 키 (UTC, 초 단위)"""
+    moment = datetime.fromisoformat(committed).astimezone(timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class IntradayExtractor:
+    """git 히스토리의 data/ 버전을 장중 스냅샷으로 저장"""
+
+    def __init__(self, repo: Optional[Path] = None, history_dir: Optional[Path] = None):
+        self.repo = Path(repo or Path(__file__).parent.parent.parent)
+        history_dir = Path(history_dir or self.repo / "data/history")
+        self.store = HistoryStore(history_dir / "intraday")
+        self.state_file = self.store.history_dir / "extract_state.json"
+
+    def load_state(self) -> Dict[str, Any]:
+        if self.state_file.exists():
+            return load_json(self.state_file)
+        return {'version': STATE_VERSION, 'last_commit': None, 'files': {}}
+
+    def save_state(self, state: Dict[str, Any]):
+        self.store.history_dir.mkdir(parents=True, exist_ok=True)
+        dump_json(state, self.state_file, atomic=True)
+
+    def _resume_point(self, state: Dict[str, Any], full: bool) -> Tuple[str, Dict[str, str]]:
+        """처리할 커밋 범위와 시작 시점 파일 상태"""
+        last = state.get('last_commit')
+        if full or not last:
+            return 'HEAD', {}
+        reachable = subprocess.run(
+            ['git', '-C', str(self.repo), 'merge-base', '--is-ancestor', last, 'HEAD'],
+            capture_output=True
+        ).returncode == 0
+        if not reachable:
+            print(f"⚠️  Last processed commit {last[:12]} is not in HEAD history, re-extracting from the start")
+            return 'HEAD', {}
+        return f"{last}..HEAD", dict(state.get('files') or tree_files(self.repo, last))
+
+    def _snapshot_body(self, reader: GitObjectReader, files: Dict[str, str],
+                       cache: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """커밋 시점 파일 상태에서 스냅샷 본문 생성 (blob 단위로 파싱 결과 재사용)"""
+        def parse(oid: str) -> Optional[Dict[str, Any]]:
+            if oid not in cache:
+                content = reader.read(oid)
+                try:
+                    cache[oid] = loads(content) if content else None
+                except ValueError:
+                    cache[oid] = None
+            return cache[oid]
+
+        if CONSOLIDATED_PATH in files:
+            consolidated = parse(files[CONSOLIDATED_PATH])
+            if consolidated:
+                return to_snapshot_body(consolidated)
+
+        models = []
+        for path, oid in sorted(files.items()):
+            if path == CONSOLIDATED_PATH or Path(path).stem in EXCLUDED_PROVIDERS:
+                continue
+            provider_data = parse(oid) or {}
+            provider = provider_data.get('provider', Path(path).stem)
+            for model in provider_data.get('models', []):
+                models.append({'provider': provider, **model})
+        if not models:
+            return None
+        return {'schema_version': SNAPSHOT_SCHEMA_VERSION, 'price_snapshot': sorted_records(models)}
+
+    def extract(self, full: bool = False) -> Dict[str, int]:
+        """마지막 처리 커밋 이후의 변경을 장중 스냅샷으로 저장"""
+        state = self.load_state()
+        revision_range, files = self._resume_point(state, full)
+        stats = {'commits': 0, 'snapshots': 0, 'blobs_read': 0}
+        cache = {}
+
+        with GitObjectReader(self.repo) as reader:
+            for sha, committed, changes in iter_commits(self.repo, revision_range):
+                stats['commits'] += 1
+                for path, oid in changes.items():
+                    if oid == NULL_OID:
+                        files.pop(path, None)
+                    else:
+                        files[path] = oid
+                # 파싱 캐시는 현재 파일 상태에서 참조하는 blob만 유지
+                live = set(files.values())
+                for oid in [oid for oid in cache if oid not in live]:
+                    del cache[oid]
+
+                before = len(cache)
+                body = self._snapshot_body(reader, files, cache)
+                stats['blobs_read'] += len(cache) - before
+                state['last_commit'] = sha
+                if body is None:
+                    continue
+                key = utc_key(committed)
+                self.store.put(key, body, save=False,
+                               fields={'date': key[:10], 'timestamp': key, 'commit': sha})
+                stats['snapshots'] += 1
+
+        state['files'] = files
+        if stats['commits']:
+            self.store.save_index()
+            self.save_state(state)
+        stats['total'] = len(self.store.load_index()['snapshots'])
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Git-object-backed intraday history extraction")
+    parser.add_argument('--repo', type=Path, default=None, help="git 저장소 경로 (기본: 프로젝트 루트)")
+    parser.add_argument('--history-dir', type=Path, default=None)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    extract_parser = subparsers.add_parser('extract', help="마지막 처리 커밋 이후 변경 추출")
+    extract_parser.add_argument('--full', action='store_true', help="처음부터 다시 추출")
+    subparsers.add_parser('list', help="저장된 장중 스냅샷 목록")
+    args = parser.parse_args()
+
+    extractor = IntradayExtractor(args.repo, args.history_dir)
+    if args.command == 'extract':
+        stats = extractor.extract(full=args.full)
+        print(f"✅ Processed {stats['commits']} commits: {stats['snapshots']} intraday snapshots "
+              f"({stats['blobs_read']} git blobs read), {stats['total']} total")
+    elif args.command == 'list':
+        snapshots = extractor.store.load_index()['snapshots']
+        for key, entry in snapshots.items():
+            print(f"{key}  {entry['fields'].get('commit', '')[:12]}  {entry['blob'][:12]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+SQLite 히스토리 데이터베이스
+data/history 스냅샷의 모델별 가격 레코드를 data/history/history.db에 적재하고 조회합니다.
+
+테이블:
+    snapshots(date, source, models)  - 적재된 날짜와 원본 식별자
+    prices(unique_id, date, ...)     - (unique_id, date) 기본 키, (provider, date) 인덱스
+
+날짜별 원본 식별자(source_digest)를 비교하므로 여러 번 실행해도 결과가 같고,
+새 날짜나 내용이 바뀐 날짜만 다시 적재합니다.
+
+사용법:
+    python scripts/history/history_db.py sync
+    python scripts/history/history_db.py prices anthropic/claude-3-5-sonnet-20241022 --since 2025-07-01
+    python scripts/history/history_db.py changes --days 7 [--provider openai]
+    python scripts/history/history_db.py provider anthropic [--date 2026-01-01]
+"""
+
+import argparse
+import sqlite3
+import sys
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from history.snapshot_store import HistoryStore
+from history.records import iter_price_records
+from history.reader import open_history
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    date TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    models INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS prices (
+    unique_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    id TEXT,
+    name TEXT,
+    provider TEXT,
+    input_price REAL,
+    output_price REAL,
+    context_window INTEGER,
+    status TEXT,
+    PRIMARY KEY (unique_id, date)
+) WITHOUT ROWID;
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_prices_provider_date ON prices (provider, date);
+CREATE INDEX IF NOT EXISTS idx_prices_date ON prices (date);
+"""
+
+RECORD_COLUMNS = ('unique_id', 'date', 'id', 'name', 'provider',
+                  'input_price', 'output_price', 'context_window', 'status')
+
+# 날짜별로 직전 적재일 가격과 비교 (가격이 있던 모델만)
+CHANGES_QUERY = """
+SELECT unique_id, name, provider, date, prev_date,
+       prev_input, input_price, prev_output, output_price
+FROM (
+    SELECT unique_id, name, provider, date, input_price, output_price,
+           LAG(date) OVER w AS prev_date,
+           LAG(input_price) OVER w AS prev_input,
+           LAG(output_price) OVER w AS prev_output
+    FROM prices
+    WHERE date >= ? {provider_filter}
+    WINDOW w AS (PARTITION BY unique_id ORDER BY date)
+)
+WHERE date > ? AND prev_date IS NOT NULL
+  AND (input_price != prev_input OR output_price != prev_output)
+ORDER BY date, provider, unique_id
+"""
+
+
+class HistoryDatabase:
+    """히스토리 스냅샷을 적재한 SQLite 데이터베이스"""
+
+    def __init__(self, history_dir: Optional[Path] = None, db_path: Optional[Path] = None):
+        self.history_dir = Path(history_dir or Path(__file__).parent.parent.parent / "data/history")
+        self.db_path = Path(db_path or self.history_dir / "history.db")
+
+    def connect(self, indexes: bool = True) -> sqlite3.Connection:
+        """indexes=False: 조회용 보조 인덱스 없이 생성 (백필 작업자의 청크 DB)"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # 스키마가 바뀌면 파생 데이터이므로 다시 적재
+            conn.executescript("DROP TABLE IF EXISTS prices; DROP TABLE IF EXISTS snapshots;")
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        conn.executescript(SCHEMA)
+        if indexes:
+            conn.executescript(INDEXES)
+        return conn
+
+    # ---- ingest ----
+
+    def sync(self, store: Optional[HistoryStore] = None) -> Dict[str, int]:
+        """히스토리 저장소와 비교하여 바뀐 날짜만 다시 적재"""
+        store = store or HistoryStore(self.history_dir)
+        sources = {date: store.source_digest(date) for date in store.dates()}
+        history = open_history(store.history_dir)
+
+        with closing(self.connect()) as conn:
+            loaded, stats = self._remove_stale(conn, sources)
+            for date, source in sorted(sources.items()):
+                if loaded.get(date) == source:
+                    continue
+                snapshot = history.load(date)
+                if snapshot is None:
+                    continue
+                # 날짜 하나가 한 트랜잭션: 중간에 중단되어도 반쯤 적재된 날짜가 남지 않음
+                with conn:
+                    self._clear_date(conn, date, loaded, stats)
+                    stats['records'] += self.insert_snapshot(conn, date, source, snapshot)
+
+            stats['dates'] = conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+        return stats
+
+    def merge(self, chunk_paths: Sequence[Path], store: Optional[HistoryStore] = None) -> Dict[str, int]:
+        """날짜 구간별로 따로 만든 DB(백필 작업자 결과)를 ATTACH하여 순서대로 합침
+
+        sync와 같은 날짜만 다시 적재하되, 스냅샷을 읽지 않고 청크 DB의 행을 SQL로 그대로 복사합니다.
+        """
+        store = store or HistoryStore(self.history_dir)
+        sources = {date: store.source_digest(date) for date in store.dates()}
+        columns = ', '.join(RECORD_COLUMNS)
+
+        with closing(self.connect()) as conn:
+            loaded, stats = self._remove_stale(conn, sources)
+            for path in chunk_paths:
+                conn.execute("ATTACH DATABASE ? AS chunk", (str(path),))
+                try:
+                    dates = [
+                        row['date'] for row in conn.execute("SELECT date FROM chunk.snapshots ORDER BY date")
+                        if row['date'] in sources and loaded.get(row['date']) != sources[row['date']]
+                    ]
+                    if not dates:
+                        continue
+                    marks = ', '.join('?' * len(dates))
+                    # 청크 하나가 한 트랜잭션, 기본 키 순서로 복사해야 B-tree 삽입이 순차적
+                    with conn:
+                        for date in dates:
+                            self._clear_date(conn, date, loaded, stats)
+                        stats['records'] += conn.execute(
+                            f"INSERT INTO prices ({columns}) SELECT {columns} FROM chunk.prices "
+                            f"WHERE date IN ({marks}) ORDER BY unique_id, date",
+                            dates
+                        ).rowcount
+                        conn.executemany(
+                            "INSERT INTO snapshots (date, source, models) "
+                            "SELECT date, ?, models FROM chunk.snapshots WHERE date = ?",
+                            [(sources[date], date) for date in dates]
+                        )
+                finally:
+                    conn.execute("DETACH DATABASE chunk")
+
+            stats['dates'] = conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+        return stats
+
+    def _remove_stale(self, conn: sqlite3.Connection,
+                      sources: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, int]]:
+        """저장소에 없는 날짜를 지우고 (적재된 날짜 -> 원본 식별자, 통계) 반환"""
+        stats = {'inserted': 0, 'replaced': 0, 'removed': 0, 'records': 0}
+        loaded = {row['date']: row['source'] for row in conn.execute("SELECT date, source FROM snapshots")}
+        with conn:
+            for date in sorted(set(loaded) - set(sources)):
+                self._delete_date(conn, date)
+                stats['removed'] += 1
+        return loaded, stats
+
+    def _clear_date(self, conn: sqlite3.Connection, date: str, loaded: Dict[str, str], stats: Dict[str, int]):
+        if date in loaded:
+            self._delete_date(conn, date)
+            stats['replaced'] += 1
+        else:
+            stats['inserted'] += 1
+
+    def _delete_date(self, conn: sqlite3.Connection, date: str):
+        conn.execute("DELETE FROM prices WHERE date = ?", (date,))
+        conn.execute("DELETE FROM snapshots WHERE date = ?", (date,))
+
+    def insert_snapshot(self, conn: sqlite3.Connection, date: str, source: str,
+                        snapshot: Dict[str, Any]) -> int:
+        """스냅샷 하나의 레코드를 비교 없이 적재하고 레코드 수 반환 (트랜잭션은 호출자가 관리)"""
+        rows = {}
+        for record in iter_price_records(snapshot):
+            # 같은 날 중복 unique_id는 마지막 레코드 기준
+            rows[record['unique_id']] = tuple(
+                date if column == 'date' else record.get(column) for column in RECORD_COLUMNS
+            )
+        conn.executemany(
+            f"INSERT INTO prices ({', '.join(RECORD_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(RECORD_COLUMNS))})",
+            rows.values()
+        )
+        conn.execute("INSERT INTO snapshots (date, source, models) VALUES (?, ?, ?)",
+                     (date, source, len(rows)))
+        return len(rows)
+
+    # ---- queries ----
+
+    def price_history(self, unique_id: str, since: Optional[str] = None,
+                      until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """모델 하나의 날짜별 가격"""
+        with closing(self.connect()) as conn:
+            rows = conn.execute(
+                "SELECT date, input_price, output_price, context_window, status FROM prices "
+                "WHERE unique_id = ? AND date >= ? AND date <= ? ORDER BY date",
+                (unique_id, since or '', until or '9999-12-31')
+            )
+            return [dict(row) for row in rows]
+
+    def price_changes(self, since: str, provider: Optional[str] = None) -> List[Dict[str, Any]]:
+        """since 이후 날짜에 직전 적재일 대비 가격이 바뀐 모델"""
+        with closing(self.connect()) as conn:
+            # 기준일 직전 적재일부터 읽어야 since 당일 변경도 비교 가능
+            row = conn.execute("SELECT MAX(date) FROM snapshots WHERE date <= ?", (since,)).fetchone()
+            start = row[0] or since
+            params = [start]
+            provider_filter = ''
+            if provider:
+                provider_filter = 'AND provider = ?'
+                params.append(provider)
+            params.append(start)
+            rows = conn.execute(CHANGES_QUERY.format(provider_filter=provider_filter), params)
+            return [dict(row) for row in rows]
+
+    def provider_models(self, provider: str, date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """프로바이더의 특정 날짜(기본: 최신) 모델 가격"""
+        with closing(self.connect()) as conn:
+            if date is None:
+                row = conn.execute("SELECT MAX(date) FROM prices WHERE provider = ?", (provider,)).fetchone()
+                date = row[0]
+            rows = conn.execute(
+                "SELECT unique_id, name, input_price, output_price, context_window, status FROM prices "
+                "WHERE provider = ? AND date = ? ORDER BY unique_id",
+                (provider, date)
+            )
+            return [dict(row) for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite history database")
+    parser.add_argument('--history-dir', type=Path, default=None)
+    parser.add_argument('--db', type=Path, default=None, help="데이터베이스 경로 (기본: data/history/history.db)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('sync', help="히스토리를 데이터베이스에 증분 적재")
+    prices_parser = subparsers.add_parser('prices', help="모델 가격 이력")
+    prices_parser.add_argument('unique_id')
+    prices_parser.add_argument('--since')
+    prices_parser.add_argument('--until')
+    changes_parser = subparsers.add_parser('changes', help="최근 가격 변경 모델")
+    changes_parser.add_argument('--days', type=int, default=7)
+    changes_parser.add_argument('--since', help="기준일 (지정 시 --days 무시)")
+    changes_parser.add_argument('--provider')
+    provider_parser = subparsers.add_parser('provider', help="프로바이더 모델 가격")
+    provider_parser.add_argument('provider')
+    provider_parser.add_argument('--date')
+    args = parser.parse_args()
+
+    db = HistoryDatabase(args.history_dir, args.db)
+    if args.command == 'sync':
+        stats = db.sync()
+        print(f"✅ History DB synced: {stats['inserted']} dates inserted, {stats['replaced']} replaced, "
+              f"{stats['removed']} removed ({stats['records']} records), {stats['dates']} dates total")
+    elif args.command == 'prices':
+        rows = db.price_history(args.unique_id, args.since, args.until)
+        if not rows:
+            print(f"❌ No history for {args.unique_id}")
+            return 1
+        for row in rows:
+            print(f"{row['date']}  input ${row['input_price']}  output ${row['output_price']}")
+    elif args.command == 'changes':
+        since = args.since or (datetime.now() - timedelta(days=args.days)).strftime("%Y-%m-%d")
+        rows = db.price_changes(since, args.provider)
+        print(f"💰 {len(rows)} price changes since {since}")
+        for row in rows:
+            print(f"{row['date']}  {row['unique_id']}: "
+                  f"${row['prev_input']} → ${row['input_price']} (input), "
+                  f"${row['prev_output']} → ${row['output_price']} (output)")
+    elif args.command == 'provider':
+        rows = db.provider_models(args.provider, args.date)
+        if not rows:
+            print(f"❌ No models for {args.provider}")
+            return 1
+        for row in rows:
+            print(f"{row['unique_id']:<50} ${row['input_price']:<10} ${row['output_price']:<10} "
+                  f"{row['context_window']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+마지막으로 본 가격 색인
+PriceMonitor가 매 실행마다 직전 스냅샷 전체를 다시 읽어 비교하지 않도록,
+모델별 마지막 가격과 레코드 해시를 data/history/price_index.json에 유지합니다.
+
+색인 구조:
+    version       - 색인 형식 버전
+    as_of         - 색인이 반영한 마지막 데이터 날짜
+    source_digest - 마지막으로 반영한 consolidated.json의 내용 해시 (같으면 파싱 생략)
+                    last_updated 타임스탬프는 매 실행마다 바뀌므로 제외하고 해시합니다.
+    models        - unique_id -> [입력 가격, 출력 가격, 레코드 해시, 마지막 가격 변경 시각(, 제외 기록)]
+                    제외 기록: [제외된 레코드 해시, 관측 일수, 마지막 관측 날짜]
+
+실행 시 현재 레코드의 해시가 색인과 다른 모델만 비교 대상으로 돌려주고,
+해당 항목만 갱신하므로 비교 비용은 변경된 모델 수에 비례합니다.
+
+잘못 읽은 값으로 보여 제외(suppressed)된 변경은 가격을 반영하지 않고 그 레코드 해시만 기록합니다.
+같은 값이 다시 들어오면 관측 일수만 늘리고 비교 대상에서 빼므로 한 번만 보고/기록됩니다.
+같은 값이 CONFIRM_AFTER_DAYS일 동안 계속 관측되면 실제 가격으로 보고 다시 비교 대상으로 돌려주며
+(confirmed), 가격이 원래대로 돌아오면 기록이 지워지고, 다른 값으로 바뀌면 다시 비교합니다.
+제외 기록이 남아 있는 동안에는 관측 일수를 세기 위해 is_current가 항상 False입니다.
+
+사용법:
+    python scripts/history/price_index.py show [unique_id]
+    python scripts/history/price_index.py rebuild [--date 2025-10-14]
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.json_codec import load_json, dump_json
+from history.records import RECORD_FIELDS, iter_price_records
+
+INDEX_VERSION = 1
+
+# 실행마다 바뀌는 타임스탬프 필드 (파일 내용 비교에서 제외)
+VOLATILE_FIELD = re.compile(rb'"last_updated"\s*:\s*"[^"]*"')
+
+# 제외된 값이 이 일수 동안 계속 관측되면 실제 가격으로 반영
+CONFIRM_AFTER_DAYS = 3
+
+# models 항목의 위치
+INPUT, OUTPUT, HASH, CHANGED_AT, SUPPRESSED = range(5)
+
+
+def record_hash(record: Dict[str, Any]) -> str:
+    """가격 레코드 해시 (RECORD_FIELDS 값 기준)"""
+    text = '\x1f'.join(str(record.get(field, '')) for field in RECORD_FIELDS)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def content_digest(path: Path) -> str:
+    """last_updated 값을 제외한 파일 내용의 sha256 (파싱하지 않음)"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(VOLATILE_FIELD.sub(b'', f.read())).hexdigest()
+
+
+class PriceIndex:
+    """unique_id -> 마지막으로 본 입력/출력 가격"""
+
+    def __init__(self, history_dir: Optional[Path] = None):
+        base_dir = Path(__file__).parent.parent.parent
+        self.history_dir = Path(history_dir) if history_dir else base_dir / "data/history"
+        self.index_file = self.history_dir / "price_index.json"
+        self.as_of = None
+        self.source_digest = None
+        self.models = {}
+        # 이번 실행에서 CONFIRM_AFTER_DAYS를 채워 다시 비교 대상이 된 제외 값의 unique_id
+        self.confirmed = set()
+        self._dirty = False
+        if self.index_file.exists():
+            data = load_json(self.index_file)
+            if data.get('version') == INDEX_VERSION:
+                self.as_of = data.get('as_of')
+                self.source_digest = data.get('source_digest')
+                self.models = data.get('models', {})
+
+    # ---- PriceMonitor.compare_prices의 이전 데이터 인터페이스 ----
+
+    @property
+    def date(self) -> Optional[str]:
+        return self.as_of
+
+    def __contains__(self, unique_id: object) -> bool:
+        return unique_id in self.models
+
+    def __getitem__(self, unique_id: str) -> Dict[str, Any]:
+        entry = self.models[unique_id]
+        return {'unique_id': unique_id, 'input_price': entry[INPUT], 'output_price': entry[OUTPUT]}
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.models)
+
+    # ---- 변경 감지 ----
+
+    def is_empty(self) -> bool:
+        return not self.models
+
+    def is_current(self, source_file: Path) -> bool:
+        """source_file이 마지막으로 반영한 파일과 타임스탬프 외 내용이 같은지 확인 (제외 기록이 있으면 False)"""
+        if any(len(entry) > SUPPRESSED for entry in self.models.values()):
+            return False
+        return (bool(self.source_digest) and Path(source_file).exists()
+                and content_digest(source_file) == self.source_digest)
+
+    def changed_records(self, current: Dict[str, Any], as_of: Optional[str] = None) -> List[Dict[str, Any]]:
+        """레코드 해시가 색인과 다른 (또는 색인에 없는) 현재 모델의 가격 레코드
+
+        이미 제외된 값과 같은 레코드는 관측 일수(as_of 기준, 기본: 오늘)만 늘리고 돌려주지 않으며,
+        CONFIRM_AFTER_DAYS일을 채우면 다시 돌려주고 confirmed에 추가합니다.
+        원래 값으로 돌아온 모델의 제외 기록은 지웁니다.
+        """
+        as_of = as_of or datetime.now().strftime("%Y-%m-%d")
+        changed = []
+        for record in iter_price_records(current):
+            entry = self.models.get(record['unique_id'])
+            if entry is None:
+                changed.append(record)
+                continue
+            digest = record_hash(record)
+            suppressed = entry[SUPPRESSED] if len(entry) > SUPPRESSED else None
+            if digest == entry[HASH]:
+                if suppressed:
+                    del entry[SUPPRESSED:]
+                    self._dirty = True
+            elif suppressed and digest == suppressed[0]:
+                if suppressed[2] != as_of:
+                    suppressed[1] += 1
+                    suppressed[2] = as_of
+                    self._dirty = True
+                if suppressed[1] >= CONFIRM_AFTER_DAYS:
+                    self.confirmed.add(record['unique_id'])
+                    changed.append(record)
+            else:
+                changed.append(record)
+        return changed
+
+    def update(self, records: List[Dict[str, Any]], as_of: Optional[str] = None,
+               source_digest: Optional[str] = None, timestamp: Optional[str] = None):
+        """레코드의 가격/해시 반영 (가격이 바뀐 항목만 변경 시각 갱신)"""
+        timestamp = timestamp or datetime.now().isoformat()
+        for record in records:
+            entry = self.models.get(record['unique_id'])
+            prices = [record['input_price'], record['output_price']]
+            if entry is None or entry[INPUT:HASH] != prices:
+                changed_at = timestamp
+            else:
+                changed_at = entry[CHANGED_AT]
+            self.models[record['unique_id']] = prices + [record_hash(record), changed_at]
+            self._dirty = True
+
+        if as_of and as_of != self.as_of:
+            self.as_of = as_of
+            self._dirty = True
+        if source_digest and source_digest != self.source_digest:
+            self.source_digest = source_digest
+            self._dirty = True
+
+    def suppress(self, records: List[Dict[str, Any]], as_of: Optional[str] = None):
+        """제외된 변경의 레코드 해시 기록 (가격은 이전 값 유지, 같은 값이면 관측 일수 유지)"""
+        as_of = as_of or datetime.now().strftime("%Y-%m-%d")
+        for record in records:
+            entry = self.models.get(record['unique_id'])
+            if entry is None:
+                continue
+            digest = record_hash(record)
+            if len(entry) > SUPPRESSED and entry[SUPPRESSED][0] == digest:
+                continue
+            self.models[record['unique_id']] = entry[:SUPPRESSED] + [[digest, 1, as_of]]
+            self._dirty = True
+
+    def last_changed(self, unique_id: str) -> Optional[str]:
+        entry = self.models.get(unique_id)
+        return entry[CHANGED_AT] if entry else None
+
+    def save(self, force: bool = False):
+        """변경이 있을 때만 원자적으로 저장"""
+        if not (self._dirty or force):
+            return
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        dump_json({
+            'version': INDEX_VERSION,
+            'as_of': self.as_of,
+            'source_digest': self.source_digest,
+            'models': {unique_id: self.models[unique_id] for unique_id in sorted(self.models)}
+        }, self.index_file, indent=False, atomic=True)
+        self._dirty = False
+
+    def rebuild(self, records: Iterable[Dict[str, Any]], as_of: Optional[str] = None):
+        """가격 레코드로 색인 초기화 (변경 시각은 as_of 기준)"""
+        self.models = {}
+        self.source_digest = None
+        self.update(list(records), as_of=as_of, timestamp=as_of)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Last-seen price index")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    show = subparsers.add_parser('show', help='Show index summary or one model entry')
+    show.add_argument('unique_id', nargs='?')
+
+    rebuild = subparsers.add_parser('rebuild', help='Rebuild the index from a history snapshot')
+    rebuild.add_argument('--date', help='Snapshot date (default: latest)')
+
+    args = parser.parse_args()
+    index = PriceIndex()
+
+    if args.command == 'show':
+        if args.unique_id:
+            if args.unique_id not in index:
+                print(f"❌ Not indexed: {args.unique_id}")
+                sys.exit(1)
+            entry = index[args.unique_id]
+            print(f"{args.unique_id}: input ${entry['input_price']}, output ${entry['output_price']}, "
+                  f"last changed {index.last_changed(args.unique_id)}")
+        else:
+            print(f"📇 {len(index)} models, as of {index.as_of or '-'}")
+
+    elif args.command == 'rebuild':
+        from history.reader import open_history
+        history = open_history(index.history_dir)
+        date = args.date or history.latest()
+        if not date or not history.has(date):
+            print("❌ No history snapshot to rebuild from")
+            sys.exit(1)
+        index.rebuild(iter_price_records(history.load(date)), as_of=date)
+        index.save(force=True)
+        print(f"✅ Rebuilt price index from {date}: {len(index)} models")
+
+
+if __name__ == "__main__":
+    main()
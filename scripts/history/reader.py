@@ -0,0 +1,24 @@
+"""
+히스토리 조회 진입점
+사용 가능한 가장 효율적인 저장 형식을 골라 공통 인터페이스(dates, has, latest, load, iter_snapshots)로 반환합니다.
+"""
+
+from pathlib import Path
+from typing import Optional, Union
+
+from history.snapshot_store import HistoryStore
+from history.delta_store import DeltaHistory
+
+
+def open_history(history_dir: Optional[Path] = None) -> Union[DeltaHistory, HistoryStore]:
+    """델타 히스토리가 원본 저장소와 같은 날짜·내용이면 델타를, 아니면 원본 저장소를 반환
+
+    압축(compaction)으로 일별 스냅샷이 집계로 바뀐 뒤 델타가 아직 동기화되지 않았다면
+    원본 식별자가 달라지므로 원본 저장소를 읽습니다.
+    비교는 index.json의 blob 해시와 이전 형식 파일의 크기/수정 시각만 사용하며 파일을 해시하지 않습니다.
+    """
+    store = HistoryStore(history_dir)
+    deltas = DeltaHistory(store.history_dir)
+    if deltas.exists() and deltas.is_current(store):
+        return deltas
+    return store
@@ -0,0 +1,76 @@
+"""
+히스토리 스냅샷 공통 레코드 / 스키마
+스냅샷 형식(consolidated 전체 'models' / 간소화 'price_snapshot')과 무관하게 가격 레코드를 꺼내고,
+파이프라인이 기록하는 버전 있는 간소화 스냅샷 본문을 만듭니다.
+
+스냅샷 스키마 (schema_version 2):
+    {"schema_version": 2, "price_snapshot": [<가격 레코드>, ...]}   - unique_id 순 정렬
+
+날짜/기록 시각은 HistoryStore가 index.json에 따로 기록합니다.
+schema_version이 없는 스냅샷은 이전 형식(consolidated 전체 복사본 또는 통계가 포함된 간소화 형식)입니다.
+"""
+
+from typing import Dict, List, Any, Iterable, Iterator
+
+SNAPSHOT_SCHEMA_VERSION = 2
+
+# 가격 레코드 필드 (시계열 소비자가 사용하는 값만)
+RECORD_FIELDS = ('unique_id', 'id', 'name', 'provider',
+                 'input_price', 'output_price', 'context_window', 'status')
+
+
+def model_unique_id(model: Dict[str, Any]) -> str:
+    """unique_id (없으면 provider/id)"""
+    return model.get('unique_id') or f"{model.get('provider', '')}/{model.get('id', '')}"
+
+
+def price_record(model: Dict[str, Any]) -> Dict[str, Any]:
+    """consolidated 모델 또는 price_snapshot 항목을 가격 레코드로 변환"""
+    pricing = model.get('pricing') or {}
+    return {
+        'unique_id': model_unique_id(model),
+        'id': model.get('id', ''),
+        'name': model.get('name', ''),
+        'provider': model.get('provider', ''),
+        'input_price': pricing.get('input', 0) or model.get('input_price', 0) or 0,
+        'output_price': pricing.get('output', 0) or model.get('output_price', 0) or 0,
+        'context_window': model.get('context_window', 0) or 0,
+        'status': model.get('status', 'ga')
+    }
+
+
+def iter_price_records(snapshot: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """스냅샷의 모델별 가격 레코드 생성
+
+    레코드: unique_id, id, name, provider, input_price, output_price, context_window, status
+    """
+    if not snapshot:
+        return
+
+    models = snapshot['price_snapshot'] if 'price_snapshot' in snapshot else snapshot.get('models', [])
+    for model in models:
+        yield price_record(model)
+
+
+def sorted_records(models: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """모델 목록을 unique_id 순 가격 레코드로 변환 (같은 unique_id는 마지막 항목 기준)"""
+    records = {}
+    for model in models:
+        record = price_record(model)
+        records[record['unique_id']] = record
+    return [records[unique_id] for unique_id in sorted(records)]
+
+
+def is_current_schema(snapshot: Dict[str, Any]) -> bool:
+    return snapshot.get('schema_version') == SNAPSHOT_SCHEMA_VERSION
+
+
+def to_snapshot_body(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """어떤 형식의 스냅샷이든 현재 스키마의 본문으로 변환
+
+    압축(compaction)된 집계 스냅샷은 레코드에 최소/최대 가격 등이 있으므로 버전만 붙입니다.
+    """
+    if 'resolution' in snapshot:
+        return {**snapshot, 'schema_version': SNAPSHOT_SCHEMA_VERSION}
+    models = snapshot['price_snapshot'] if 'price_snapshot' in snapshot else snapshot.get('models', [])
+    return {'schema_version': SNAPSHOT_SCHEMA_VERSION, 'price_snapshot': sorted_records(models)}
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+내용 주소 기반(content-addressed) 히스토리 저장소
+
+data/history/
+    index.json                 - 날짜 -> blob 해시 + 날짜별 메타 필드
+    blobs/<해시 앞 2자리>/<sha256>.json - 스냅샷 본문 (동일 내용은 한 번만 저장)
+
+일별 스냅샷은 크롤링 시각(last_updated 등)만 다르고 내용은 같은 경우가 대부분이므로,
+시각 필드를 본문에서 분리해 index.json에 날짜별로 기록하고 나머지를 해시로 저장합니다.
+중첩된 last_updated(모델/제공업체별 크롤링 시각)는 보존하지 않습니다.
+
+이전 형식의 data/history/YYYY-MM-DD.json 파일도 그대로 읽을 수 있으며,
+convert 명령으로 history/records.py의 현재 스냅샷 스키마로 변환할 수 있습니다.
+
+사용법:
+    python scripts/history/snapshot_store.py put data/consolidated.json --date 2025-10-14
+    python scripts/history/snapshot_store.py migrate [--keep] [--dry-run]
+    python scripts/history/snapshot_store.py convert [--dry-run]
+    python scripts/history/snapshot_store.py show 2025-10-14
+    python scripts/history/snapshot_store.py stats
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.json_codec import load_json, dump_json, dumps, loads
+from utils.json_stream import StreamingJSONWriter
+from history.records import SNAPSHOT_SCHEMA_VERSION, is_current_schema, to_snapshot_body
+
+INDEX_VERSION = 1
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# 본문에서 분리하여 index.json에 날짜별로 기록하는 최상위 필드
+TOP_LEVEL_FIELDS = ('date', 'timestamp', 'last_updated')
+# 해시 계산 시 모든 깊이에서 제외하는 크롤링 시각 필드
+NESTED_VOLATILE_FIELDS = ('last_updated',)
+
+
+def strip_volatile(data: Any, top_level: bool = True) -> Any:
+    """크롤링 시각 필드를 제거한 스냅샷 본문 반환"""
+    if isinstance(data, dict):
+        return {
+            key: strip_volatile(value, top_level=False)
+            for key, value in data.items()
+            if key not in NESTED_VOLATILE_FIELDS and not (top_level and key in TOP_LEVEL_FIELDS)
+        }
+    if isinstance(data, list):
+        return [strip_volatile(item, top_level=False) for item in data]
+    return data
+
+
+def encode_blob(content: Any) -> bytes:
+    """blob 직렬화 (백엔드와 무관하게 동일한 바이트가 나오도록 canonical 압축 형식)"""
+    return dumps(content, indent=False, canonical=True)
+
+
+def file_sha256(path: Path) -> str:
+    """파일 SHA-256 (청크 단위로 읽음)"""
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class HistoryStore:
+    """날짜별 스냅샷을 해시 blob으로 저장/조회"""
+
+    def __init__(self, history_dir: Optional[Path] = None):
+        self.history_dir = Path(history_dir or Path(__file__).parent.parent.parent / "data/history")
+        self.index_file = self.history_dir / "index.json"
+        self.blobs_dir = self.history_dir / "blobs"
+        self._index = None
+        self._blob_cache = (None, None)
+
+    # ---- index ----
+
+    def load_index(self) -> Dict[str, Any]:
+        """index.json 로드 (없으면 빈 색인)"""
+        if self._index is None:
+            if self.index_file.exists():
+                self._index = load_json(self.index_file)
+            else:
+                self._index = {'version': INDEX_VERSION, 'snapshots': {}}
+        return self._index
+
+    def save_index(self):
+        """index.json 원자적 저장 (날짜순 정렬)"""
+        index = self.load_index()
+        index['snapshots'] = dict(sorted(index['snapshots'].items()))
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        dump_json(index, self.index_file, atomic=True)
+
+    def legacy_files(self) -> Dict[str, Path]:
+        """이전 형식의 날짜별 파일 목록"""
+        if not self.history_dir.exists():
+            return {}
+        return {
+            path.stem: path for path in self.history_dir.glob("*.json")
+            if DATE_PATTERN.match(path.stem)
+        }
+
+    def dates(self) -> List[str]:
+        """저장된 모든 날짜 (오름차순)"""
+        return sorted(set(self.load_index()['snapshots']) | set(self.legacy_files()))
+
+    def has(self, date: str) -> bool:
+        return date in self.load_index()['snapshots'] or (self.history_dir / f"{date}.json").exists()
+
+    def latest(self, before: Optional[str] = None) -> Optional[str]:
+        """가장 최근 날짜 (before가 주어지면 그 이전 날짜 중에서)"""
+        dates = [d for d in self.dates() if before is None or d < before]
+        return dates[-1] if dates else None
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blobs_dir / digest[:2] / f"{digest}.json"
+
+    def resolve(self, date: str) -> Optional[Path]:
+        """날짜의 스냅샷 파일 경로 (blob 또는 이전 형식 파일)"""
+        entry = self.load_index()['snapshots'].get(date)
+        if entry:
+            return self.blob_path(entry['blob'])
+        legacy = self.history_dir / f"{date}.json"
+        return legacy if legacy.exists() else None
+
+    def source_digest(self, date: str) -> str:
+        """스냅샷 식별자 (파생 저장소의 증분 갱신 판단용)
+
+        blob 해시와 날짜별 메타 필드, 또는 이전 형식 파일의 해시입니다.
+        """
+        entry = self.load_index()['snapshots'].get(date)
+        if entry:
+            fields = ''.join(f"{k}={entry.get('fields', {}).get(k)}" for k in TOP_LEVEL_FIELDS)
+            return hashlib.sha256(f"{entry['blob']}|{fields}".encode('utf-8')).hexdigest()
+        legacy = self.history_dir / f"{date}.json"
+        return file_sha256(legacy) if legacy.exists() else ''
+
+    def legacy_stamp(self, date: str) -> Optional[List[int]]:
+        """이전 형식 파일의 [크기, 수정 시각(ns)] (blob으로 저장된 날짜거나 파일이 없으면 None)
+
+        파생 저장소가 파일을 해시하지 않고 바뀌었는지 확인할 때 씁니다.
+        """
+        if date in self.load_index()['snapshots']:
+            return None
+        legacy = self.history_dir / f"{date}.json"
+        if not legacy.exists():
+            return None
+        stat = legacy.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    # ---- write ----
+
+    def _store_blob(self, payload: bytes) -> str:
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self.blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 백필 작업자가 같은 blob을 동시에 쓸 수 있으므로 임시 파일은 프로세스별로 분리
+            tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        return digest
+
+    def record(self, date: str, digest: str, fields: Dict[str, Any], save: bool = True):
+        """이미 저장된 blob을 날짜의 스냅샷으로 기록"""
+        snapshots = self.load_index()['snapshots']
+        previous = snapshots.get(date, {}).get('blob')
+        snapshots[date] = {'blob': digest, 'fields': fields}
+        if save:
+            self.save_index()
+            # 같은 날짜를 덮어써서 더 이상 참조되지 않는 blob 정리
+            if previous and previous != digest and previous not in self.referenced_blobs():
+                self.blob_path(previous).unlink(missing_ok=True)
+
+    def put(self, date: str, data: Dict[str, Any], save: bool = True,
+            fields: Optional[Dict[str, Any]] = None) -> str:
+        """스냅샷 저장 후 blob 해시 반환 (fields: index.json에 함께 기록할 추가 메타 필드)"""
+        fields = {**{key: data[key] for key in TOP_LEVEL_FIELDS if key in data}, **(fields or {})}
+        digest = self._store_blob(encode_blob(strip_volatile(data)))
+        self.record(date, digest, fields, save=save)
+        return digest
+
+    def remove(self, date: str, save: bool = True):
+        """날짜의 스냅샷 삭제 (blob은 gc에서 정리)"""
+        self.load_index()['snapshots'].pop(date, None)
+        (self.history_dir / f"{date}.json").unlink(missing_ok=True)
+        if save:
+            self.save_index()
+
+    def put_file(self, date: str, path: Path, save: bool = True) -> str:
+        """JSON 파일을 스냅샷으로 저장"""
+        return self.put(date, load_json(path), save=save)
+
+    @contextmanager
+    def open_snapshot(self, date: str, fields: Dict[str, Any]) -> Iterator[StreamingJSONWriter]:
+        """스냅샷 본문을 스트리밍으로 기록 (fields는 index.json에 기록할 최상위 메타 필드)
+
+        본문은 blob 형식(canonical 압축)으로 임시 파일에 기록된 뒤 해시 경로로 이동합니다.
+        """
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        incoming = self.blobs_dir / f".incoming-{date}.json"
+        with StreamingJSONWriter(incoming, indent=False, canonical=True) as writer:
+            yield writer
+
+        digest = file_sha256(incoming)
+        path = self.blob_path(digest)
+        if path.exists():
+            incoming.unlink()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(incoming, path)
+        self.record(date, digest, dict(fields))
+
+    # ---- read ----
+
+    def _load_blob(self, digest: str) -> Dict[str, Any]:
+        # 연속된 날짜가 같은 blob을 가리키는 경우가 많으므로 직전 blob을 재사용
+        cached_digest, cached = self._blob_cache
+        if cached_digest != digest:
+            cached = loads(self.blob_path(digest).read_bytes())
+            self._blob_cache = (digest, cached)
+        return cached
+
+    def load(self, date: str) -> Optional[Dict[str, Any]]:
+        """날짜의 스냅샷 반환 (없으면 None)
+
+        반환값은 캐시된 blob을 공유할 수 있으므로 수정하지 않아야 합니다.
+        """
+        entry = self.load_index()['snapshots'].get(date)
+        if entry:
+            return {**entry.get('fields', {}), **self._load_blob(entry['blob'])}
+        legacy = self.history_dir / f"{date}.json"
+        if legacy.exists():
+            return load_json(legacy)
+        return None
+
+    def iter_snapshots(self, start: Optional[str] = None,
+                       end: Optional[str] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """기간 내 (날짜, 스냅샷)을 날짜순으로 생성 (start, end 포함)"""
+        for date in self.dates():
+            if (start and date < start) or (end and date > end):
+                continue
+            snapshot = self.load(date)
+            if snapshot is not None:
+                yield date, snapshot
+
+    # ---- maintenance ----
+
+    def migrate(self, keep: bool = False, dry_run: bool = False) -> Dict[str, int]:
+        """이전 형식의 날짜별 파일을 blob 저장소로 이전"""
+        stats = {'files': 0, 'blobs_before': len(self.referenced_blobs()),
+                 'bytes_before': 0, 'bytes_after': 0}
+        legacy = self.legacy_files()
+
+        for date, path in sorted(legacy.items()):
+            stats['files'] += 1
+            stats['bytes_before'] += path.stat().st_size
+            data = load_json(path)
+            if dry_run:
+                payload = encode_blob(strip_volatile(data))
+                self.record(date, hashlib.sha256(payload).hexdigest(), {}, save=False)
+                continue
+            self.put(date, data, save=False)
+
+        blobs = self.referenced_blobs()
+        stats['blobs'] = len(blobs)
+        if dry_run:
+            self._index = None
+            return stats
+
+        self.save_index()
+        if not keep:
+            for path in legacy.values():
+                path.unlink()
+        stats['bytes_after'] = sum(self.blob_path(d).stat().st_size for d in blobs)
+        stats['bytes_after'] += self.index_file.stat().st_size
+        return stats
+
+    def convert(self, dry_run: bool = False) -> Dict[str, int]:
+        """이전 형식 스냅샷(consolidated 복사본, 통계 포함 간소화 형식)을 현재 스키마로 변환
+
+        index.json의 날짜별 메타 필드(date/timestamp/last_updated)는 유지하고,
+        이전 형식의 날짜별 파일은 blob으로 옮긴 뒤 삭제합니다.
+        """
+        stats = {'dates': 0, 'converted': 0, 'blobs_before': len(self.referenced_blobs())}
+        legacy = self.legacy_files()
+
+        for date in self.dates():
+            stats['dates'] += 1
+            entry = self.load_index()['snapshots'].get(date)
+            snapshot = self.load(date)
+            if is_current_schema(snapshot) and entry:
+                continue
+            stats['converted'] += 1
+            if dry_run:
+                continue
+            fields = entry.get('fields', {}) if entry else {
+                key: snapshot[key] for key in TOP_LEVEL_FIELDS if key in snapshot
+            }
+            self.put(date, {**fields, **to_snapshot_body(snapshot)}, save=False)
+
+        if dry_run:
+            return stats
+
+        self.save_index()
+        for date, path in legacy.items():
+            if date in self.load_index()['snapshots']:
+                path.unlink()
+        stats['blobs_removed'] = self.gc()
+        stats['blobs'] = len(self.referenced_blobs())
+        return stats
+
+    def referenced_blobs(self) -> set:
+        return {entry['blob'] for entry in self.load_index()['snapshots'].values()}
+
+    def gc(self) -> int:
+        """index.json에서 참조하지 않는 blob 삭제"""
+        referenced = self.referenced_blobs()
+        removed = 0
+        for path in self.blobs_dir.glob("*/*.json"):
+            if path.stem not in referenced:
+                path.unlink()
+                removed += 1
+        return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed history store")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    put_parser = subparsers.add_parser('put', help="스냅샷 파일 저장")
+    put_parser.add_argument('file', type=Path)
+    put_parser.add_argument('--date', default=datetime.now().strftime("%Y-%m-%d"))
+
+    migrate_parser = subparsers.add_parser('migrate', help="이전 형식 파일을 blob 저장소로 이전")
+    migrate_parser.add_argument('--keep', action='store_true', help="원본 파일 유지")
+    migrate_parser.add_argument('--dry-run', action='store_true', help="결과만 출력")
+
+    show_parser = subparsers.add_parser('show', help="날짜의 스냅샷 경로 출력")
+    show_parser.add_argument('date')
+
+    convert_parser = subparsers.add_parser('convert', help="이전 형식 스냅샷을 현재 스키마로 변환")
+    convert_parser.add_argument('--dry-run', action='store_true', help="결과만 출력")
+
+    subparsers.add_parser('stats', help="저장소 통계")
+    subparsers.add_parser('gc', help="참조되지 않는 blob 삭제")
+
+    parser.add_argument('--history-dir', type=Path, default=None)
+    args = parser.parse_args()
+
+    store = HistoryStore(args.history_dir)
+
+    if args.command == 'put':
+        digest = store.put_file(args.date, args.file)
+        print(f"✅ {args.date} -> {digest[:12]}")
+    elif args.command == 'migrate':
+        stats = store.migrate(keep=args.keep, dry_run=args.dry_run)
+        print(f"✅ Migrated {stats['files']} files into {stats['blobs']} blobs")
+        if not args.dry_run:
+            print(f"   - Size: {stats['bytes_before']:,} → {stats['bytes_after']:,} bytes")
+    elif args.command == 'convert':
+        stats = store.convert(dry_run=args.dry_run)
+        print(f"✅ {'Would convert' if args.dry_run else 'Converted'} {stats['converted']} of "
+              f"{stats['dates']} snapshots to schema v{SNAPSHOT_SCHEMA_VERSION}")
+        if not args.dry_run:
+            print(f"   - Blobs: {stats['blobs_before']} → {stats['blobs']} "
+                  f"({stats['blobs_removed']} removed)")
+    elif args.command == 'show':
+        path = store.resolve(args.date)
+        if path is None:
+            print(f"❌ No snapshot for {args.date}")
+            return 1
+        print(path)
+    elif args.command == 'stats':
+        dates = store.dates()
+        blobs = store.referenced_blobs()
+        size = sum(store.blob_path(d).stat().st_size for d in blobs if store.blob_path(d).exists())
+        print(f"📦 {len(dates)} dates, {len(blobs)} blobs ({size:,} bytes), "
+              f"{len(store.legacy_files())} legacy files")
+    elif args.command == 'gc':
+        print(f"🧹 Removed {store.gc()} unreferenced blobs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
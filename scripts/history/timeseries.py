@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+컬럼형 가격 시계열 저장소
+data/history의 스냅샷에서 날짜 × 모델 ordinal 2차원 배열을 만들어 .npy 파일로 저장합니다.
+
+data/history/timeseries/
+    meta.json            - 날짜 축, 원본 식별자, 필드별 dtype/결측값
+    models.json          - 모델 ordinal 순서의 unique_id 목록
+    input_price.npy      - float64 (days, models), 모델이 없는 날은 NaN
+    output_price.npy     - float64 (days, models), 모델이 없는 날은 NaN
+    context_window.npy   - int32 (days, models), 모델이 없는 날은 -1
+
+행 단위(날짜) 저장이므로 새 날짜는 파일 끝에 추가되며, 새 모델이 생길 때만 배열 폭을 다시 씁니다.
+.npy 형식이라 numpy.load(mmap_mode='r')로 그대로 메모리 매핑할 수 있고,
+numpy 없이도 모델 하나의 전체 이력을 O(days)로 읽을 수 있습니다.
+
+사용법:
+    python scripts/history/timeseries.py sync
+    python scripts/history/timeseries.py show anthropic/claude-3-5-sonnet-20241022
+"""
+
+import argparse
+import ast
+import math
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Sequence, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.json_codec import load_json, dump_json
+from history.snapshot_store import HistoryStore
+from history.records import iter_price_records
+from history.reader import open_history
+
+STORE_VERSION = 1
+NPY_MAGIC = b'\x93NUMPY\x01\x00'
+NPY_HEADER_SIZE = 128  # 헤더 고정 길이 (행 추가 시 제자리에서 shape만 갱신)
+SYNC_CHUNK_DAYS = 32
+
+# 필드 이름 -> (npy dtype, array typecode, 결측값)
+FIELDS = {
+    'input_price': ('<f8', 'd', math.nan),
+    'output_price': ('<f8', 'd', math.nan),
+    'context_window': ('<i4', 'i', -1),
+}
+
+
+def write_npy_header(f, descr: str, shape: Tuple[int, int]):
+    """고정 길이 .npy v1.0 헤더 기록"""
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({shape[0]}, {shape[1]}), }}"
+    padding = NPY_HEADER_SIZE - len(NPY_MAGIC) - 2 - len(header) - 1
+    if padding < 0:
+        raise ValueError(f"Shape {shape} does not fit in the npy header")
+    f.seek(0)
+    f.write(NPY_MAGIC + struct.pack('<H', NPY_HEADER_SIZE - len(NPY_MAGIC) - 2))
+    f.write(header.encode('latin1') + b' ' * padding + b'\n')
+
+
+def read_npy_header(f) -> Tuple[str, Tuple[int, int], int]:
+    """.npy 헤더에서 (dtype, shape, 데이터 시작 오프셋) 읽기"""
+    f.seek(0)
+    magic = f.read(len(NPY_MAGIC))
+    if magic[:6] != NPY_MAGIC[:6]:
+        raise ValueError("Not an npy file")
+    (header_len,) = struct.unpack('<H', f.read(2))
+    header = ast.literal_eval(f.read(header_len).decode('latin1'))
+    return header['descr'], tuple(header['shape']), len(NPY_MAGIC) + 2 + header_len
+
+
+def price_row(snapshot: Dict[str, Any]) -> Dict[str, Tuple[float, float, int]]:
+    """스냅샷의 {unique_id: (input, output, context)} 행"""
+    row = {}
+    for record in iter_price_records(snapshot):
+        row[record['unique_id']] = (
+            float(record['input_price']),
+            float(record['output_price']),
+            int(record['context_window'])
+        )
+    return row
+
+
+def _to_little_endian(values: array) -> bytes:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class TimeSeriesStore:
+    """날짜 × 모델 가격 배열 저장소"""
+
+    def __init__(self, history_dir: Optional[Path] = None):
+        self.history_dir = Path(history_dir or Path(__file__).parent.parent.parent / "data/history")
+        self.series_dir = self.history_dir / "timeseries"
+        self.meta_file = self.series_dir / "meta.json"
+        self.models_file = self.series_dir / "models.json"
+        self._meta = None
+        self._models = None
+        self._ordinals = None
+
+    # ---- metadata ----
+
+    def load_meta(self) -> Dict[str, Any]:
+        if self._meta is None:
+            if self.meta_file.exists():
+                self._meta = load_json(self.meta_file)
+            else:
+                self._meta = {
+                    'version': STORE_VERSION,
+                    'dates': [],
+                    'sources': [],
+                    'fields': {name: {'dtype': spec[0], 'missing': None if math.isnan(spec[2]) else spec[2]}
+                               for name, spec in FIELDS.items()}
+                }
+        return self._meta
+
+    def load_models(self) -> List[str]:
+        if self._models is None:
+            self._models = load_json(self.models_file) if self.models_file.exists() else []
+        return self._models
+
+    def ordinals(self) -> Dict[str, int]:
+        """unique_id -> ordinal 사전 (처음 호출 시 생성)"""
+        if self._ordinals is None:
+            self._ordinals = {uid: i for i, uid in enumerate(self.load_models())}
+        return self._ordinals
+
+    def dates(self) -> List[str]:
+        return self.load_meta()['dates']
+
+    def array_path(self, field: str) -> Path:
+        return self.series_dir / f"{field}.npy"
+
+    def _save_meta(self):
+        self.series_dir.mkdir(parents=True, exist_ok=True)
+        dump_json(self.load_models(), self.models_file, indent=False, atomic=True)
+        dump_json(self.load_meta(), self.meta_file, atomic=True)
+
+    # ---- array maintenance ----
+
+    def _resize(self, rows: Optional[int], columns: int):
+        """모든 필드 배열을 (rows, columns)로 맞춤 (행은 잘라내기만, 열은 결측값으로 확장)
+
+        rows가 None이면 기존 행을 모두 유지합니다.
+        """
+        for field, (descr, typecode, missing) in FIELDS.items():
+            path = self.array_path(field)
+            itemsize = array(typecode).itemsize
+
+            if not path.exists():
+                with open(path, 'wb') as f:
+                    write_npy_header(f, descr, (0, columns))
+                continue
+
+            with open(path, 'r+b') as f:
+                _, (old_rows, old_columns), offset = read_npy_header(f)
+                keep_rows = old_rows if rows is None else min(rows, old_rows)
+
+                if old_columns == columns:
+                    f.truncate(offset + keep_rows * columns * itemsize)
+                    write_npy_header(f, descr, (keep_rows, columns))
+                    continue
+
+                # 열 확장: 행마다 결측값을 덧붙여 다시 기록
+                f.seek(offset)
+                old = array(typecode)
+                old.frombytes(f.read(keep_rows * old_columns * itemsize))
+                if sys.byteorder != 'little':
+                    old.byteswap()
+                padding = array(typecode, [missing]) * (columns - old_columns)
+                widened = array(typecode)
+                for row in range(keep_rows):
+                    widened.extend(old[row * old_columns:(row + 1) * old_columns])
+                    widened.extend(padding)
+                f.seek(offset)
+                f.write(_to_little_endian(widened))
+                f.truncate()
+                write_npy_header(f, descr, (keep_rows, columns))
+
+    def _read_array(self, field: str) -> Tuple[array, int]:
+        """필드 배열 전체와 열 수"""
+        typecode = FIELDS[field][1]
+        with open(self.array_path(field), 'rb') as f:
+            _, (rows, columns), offset = read_npy_header(f)
+            f.seek(offset)
+            values = array(typecode)
+            values.frombytes(f.read(rows * columns * values.itemsize))
+        if sys.byteorder != 'little':
+            values.byteswap()
+        return values, columns
+
+    def _append_block(self, field: str, block: array, rows: int):
+        """인코딩된 행 블록을 배열 끝에 추가"""
+        descr = FIELDS[field][0]
+        with open(self.array_path(field), 'r+b') as f:
+            _, (old_rows, columns), offset = read_npy_header(f)
+            f.seek(0, 2)
+            f.write(_to_little_endian(block))
+            write_npy_header(f, descr, (old_rows + rows, columns))
+
+    def _append_rows(self, rows: List[Dict[str, Tuple[float, float, int]]]):
+        """날짜별 {unique_id: (input, output, context)} 행을 배열 끝에 추가"""
+        ordinals = self.ordinals()
+        columns = len(ordinals)
+        for position, (field, (descr, typecode, missing)) in enumerate(FIELDS.items()):
+            block = array(typecode)
+            for row in rows:
+                values = array(typecode, [missing]) * columns
+                for uid, record in row.items():
+                    values[ordinals[uid]] = record[position]
+                block.extend(values)
+            self._append_block(field, block, len(rows))
+
+    def _register(self, unique_ids: Iterable[str]):
+        """처음 보는 모델에 ordinal을 붙이고 배열 폭을 맞춤"""
+        models = self.load_models()
+        ordinals = self.ordinals()
+        before = len(models)
+        for uid in unique_ids:
+            if uid not in ordinals:
+                ordinals[uid] = len(models)
+                models.append(uid)
+        if len(models) != before:
+            self._resize(None, len(models))
+
+    def _flush(self, rows: List[Dict[str, Tuple[float, float, int]]]):
+        self._register(uid for row in rows for uid in row)
+        self._append_rows(rows)
+
+    # ---- sync ----
+
+    def _rewind(self, store: HistoryStore) -> Tuple[List[str], Dict[str, str], int]:
+        """날짜(중간에 추가/삭제된 날짜 포함)나 원본이 저장소와 달라진 첫 행부터 잘라냄
+
+        반환: (저장소 날짜 목록, 날짜별 원본 식별자, 잘라낸 행 수)
+        """
+        meta = self.load_meta()
+        source_dates = store.dates()
+        sources = {date: store.source_digest(date) for date in source_dates}
+
+        position = 0
+        while (position < min(len(meta['dates']), len(source_dates))
+               and meta['dates'][position] == source_dates[position]
+               and meta['sources'][position] == sources[source_dates[position]]):
+            position += 1
+
+        rewritten = len(meta['dates']) - position
+        del meta['dates'][position:]
+        del meta['sources'][position:]
+        self.series_dir.mkdir(parents=True, exist_ok=True)
+        self._resize(position, len(self.load_models()))
+        return source_dates, sources, rewritten
+
+    def append(self, entries: Iterable[Tuple[str, str, Dict[str, Tuple[float, float, int]]]]) -> int:
+        """(날짜, 원본 식별자, 행)을 순서대로 추가하고 추가한 날짜 수 반환"""
+        meta = self.load_meta()
+        self.series_dir.mkdir(parents=True, exist_ok=True)
+        if not self.array_path(next(iter(FIELDS))).exists():
+            self._resize(None, len(self.load_models()))
+
+        pending = []
+        appended = 0
+        for date, source, row in entries:
+            pending.append(row)
+            meta['dates'].append(date)
+            meta['sources'].append(source)
+            appended += 1
+            if len(pending) >= SYNC_CHUNK_DAYS:
+                self._flush(pending)
+                pending = []
+
+        if pending:
+            self._flush(pending)
+        self._save_meta()
+        return appended
+
+    def sync(self, store: Optional[HistoryStore] = None) -> Dict[str, int]:
+        """히스토리 저장소와 비교하여 추가되거나 바뀐 첫 날짜부터 다시 만듦 (과거 날짜가 추가된 경우 포함)"""
+        store = store or HistoryStore(self.history_dir)
+        source_dates, sources, rewritten = self._rewind(store)
+
+        # 잘라낸 위치부터 저장소의 모든 날짜를 다시 추가
+        position = len(self.dates())
+        wanted = set(source_dates[position:])
+        entries = ()
+        if wanted:
+            entries = (
+                (date, sources[date], price_row(snapshot))
+                for date, snapshot in open_history(store.history_dir).iter_snapshots(start=source_dates[position])
+                if date in wanted
+            )
+        appended = self.append(entries)
+        return {'rewritten': rewritten, 'appended': appended,
+                'dates': len(self.dates()), 'models': len(self.load_models())}
+
+    def merge(self, chunks: Sequence['TimeSeriesStore'], store: Optional[HistoryStore] = None) -> Dict[str, int]:
+        """날짜 구간별로 따로 만든 시계열 저장소(백필 작업자 결과)를 순서대로 이어 붙임
+
+        sync와 같은 위치부터 다시 만들되, 스냅샷을 읽지 않고 청크 배열의 행을 ordinal만 바꿔 복사합니다.
+        """
+        store = store or HistoryStore(self.history_dir)
+        source_dates, sources, rewritten = self._rewind(store)
+        meta = self.load_meta()
+        wanted = set(source_dates[len(meta['dates']):])
+
+        appended = 0
+        for chunk in chunks:
+            chunk_dates = chunk.dates()
+            rows = [row for row, date in enumerate(chunk_dates) if date in wanted]
+            if not rows:
+                continue
+            self._register(chunk.load_models())
+            ordinals = self.ordinals()
+            columns = len(ordinals)
+            mapping = [ordinals[uid] for uid in chunk.load_models()]
+            # 청크의 모델 순서가 전체 ordinal 순서와 같으면 행을 그대로 복사
+            identity = mapping == list(range(len(mapping)))
+
+            for field, (descr, typecode, missing) in FIELDS.items():
+                values, chunk_columns = chunk._read_array(field)
+                padding = array(typecode, [missing]) * (columns - chunk_columns)
+                block = array(typecode)
+                for row in rows:
+                    chunk_row = values[row * chunk_columns:(row + 1) * chunk_columns]
+                    if identity:
+                        block.extend(chunk_row)
+                        block.extend(padding)
+                        continue
+                    remapped = array(typecode, [missing]) * columns
+                    for local, ordinal in enumerate(mapping):
+                        remapped[ordinal] = chunk_row[local]
+                    block.extend(remapped)
+                self._append_block(field, block, len(rows))
+
+            for row in rows:
+                meta['dates'].append(chunk_dates[row])
+                meta['sources'].append(sources[chunk_dates[row]])
+            appended += len(rows)
+
+        self._save_meta()
+        return {'rewritten': rewritten, 'appended': appended,
+                'dates': len(meta['dates']), 'models': len(self.load_models())}
+
+    # ---- read ----
+
+    def model_series(self, unique_id: str, field: str = 'input_price') -> List[Tuple[str, float]]:
+        """모델 하나의 (날짜, 값) 이력 (결측 날짜 제외, JSON 파싱 없이 O(days))"""
+        ordinal = self.ordinals().get(unique_id)
+        if ordinal is None:
+            return []
+
+        descr, typecode, missing = FIELDS[field]
+        fmt = '<' + typecode
+        itemsize = struct.calcsize(fmt)
+        dates = self.dates()
+        result = []
+        with open(self.array_path(field), 'rb') as f:
+            _, (rows, columns), offset = read_npy_header(f)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for row in range(min(rows, len(dates))):
+                    (value,) = struct.unpack_from(fmt, mapped, offset + (row * columns + ordinal) * itemsize)
+                    if value == value and value != missing:
+                        result.append((dates[row], value))
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar price time-series store")
+    parser.add_argument('--history-dir', type=Path, default=None)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('sync', help="히스토리에서 시계열 배열 증분 생성")
+    show_parser = subparsers.add_parser('show', help="모델 가격 이력 출력")
+    show_parser.add_argument('unique_id')
+    show_parser.add_argument('--field', default='input_price', choices=list(FIELDS))
+    args = parser.parse_args()
+
+    store = TimeSeriesStore(args.history_dir)
+    if args.command == 'sync':
+        stats = store.sync()
+        print(f"✅ Time series synced: {stats['appended']} days appended "
+              f"({stats['rewritten']} rewritten), {stats['dates']} days × {stats['models']} models")
+    elif args.command == 'show':
+        series = store.model_series(args.unique_id, args.field)
+        if not series:
+            print(f"❌ No history for {args.unique_id}")
+            return 1
+        for date, value in series:
+            print(f"{date}  {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+필터링용 패싯 색인
+DataProcessor가 생성하는 data/indexes/facets.json과 이를 사용하는 조회 헬퍼
+
+- facets: 패싯 값별 posting 비트셋 (bit i = consolidated.json models[i])
+          base64 인코딩된 little-endian 바이트열로 저장되어 대시보드에서도 그대로 사용합니다.
+- cube:   단일 값 차원(provider, status, context_bucket, pricing)과 modality의
+          조합별 모델 수. '*'는 해당 차원 전체 합계입니다.
+
+같은 패싯 안의 값은 OR, 서로 다른 패싯은 AND로 결합합니다.
+"""
+
+import base64
+from collections import Counter, defaultdict
+from datetime import datetime
+from itertools import product
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Union
+
+from utils.json_codec import load_json, dump_json
+
+INDEX_VERSION = 1
+ALL = '*'
+
+# 컨텍스트 윈도우 구간 (상한, 이름) - calculate_statistics의 100K/1M 기준과 맞춤
+CONTEXT_BUCKETS = [
+    (32000, 'under_32k'),
+    (100000, '32k_100k'),
+    (1000000, '100k_1m'),
+]
+CONTEXT_BUCKET_MAX = '1m_plus'
+CONTEXT_BUCKET_UNKNOWN = 'unknown'
+
+FACETS = ('provider', 'feature', 'modality', 'status', 'context_bucket', 'pricing')
+CUBE_DIMENSIONS = ('provider', 'status', 'context_bucket', 'pricing', 'modality')
+
+
+def context_bucket(context_window: int) -> str:
+    """컨텍스트 윈도우 크기를 구간 이름으로 변환"""
+    if not context_window or context_window <= 0:
+        return CONTEXT_BUCKET_UNKNOWN
+    for upper, name in CONTEXT_BUCKETS:
+        if context_window <= upper:
+            return name
+    return CONTEXT_BUCKET_MAX
+
+
+def model_facet_values(model: Dict) -> Dict[str, List[str]]:
+    """모델의 패싯별 값 목록"""
+    input_price = model.get('pricing', {}).get('input', 0) or model.get('input_price', 0)
+    return {
+        'provider': [model.get('provider', '')],
+        'feature': sorted(set(model.get('features', []))),
+        'modality': sorted(set(model.get('modalities', ['text']))),
+        'status': [model.get('status', 'ga')],
+        'context_bucket': [context_bucket(model.get('context_window', 0))],
+        'pricing': ['free' if input_price == 0 else 'paid']
+    }
+
+
+def decode_bitset(encoded: str) -> int:
+    """base64 문자열을 정수 비트셋으로 디코딩"""
+    return int.from_bytes(base64.b64decode(encoded), 'little')
+
+
+def iter_bits(bitset: int) -> Iterable[int]:
+    """비트셋에서 설정된 ordinal을 오름차순으로 생성"""
+    ordinal = 0
+    while bitset:
+        chunk = bitset & 0xFFFFFFFFFFFFFFFF
+        while chunk:
+            low = chunk & -chunk
+            yield ordinal + low.bit_length() - 1
+            chunk ^= low
+        bitset >>= 64
+        ordinal += 64
+
+
+def build_facet_cube(facet_values: List[Dict[str, List[str]]]) -> Dict[str, int]:
+    """CUBE_DIMENSIONS 조합별 모델 수 계산 ('*' 롤업 포함)
+
+    동일한 값 조합을 먼저 집계한 뒤 롤업을 전개하므로 비용은 고유 조합 수에 비례합니다.
+    """
+    combos = Counter(
+        tuple(tuple(values[dim]) for dim in CUBE_DIMENSIONS)
+        for values in facet_values
+    )
+
+    cells = Counter()
+    for combo, count in combos.items():
+        options = [values + (ALL,) for values in combo]
+        for cell in product(*options):
+            cells['|'.join(cell)] += count
+    return dict(sorted(cells.items()))
+
+
+def build_facet_index(models: List[Dict]) -> Dict[str, Any]:
+    """모델 목록으로 패싯 비트셋과 카운트 큐브 생성"""
+    size = len(models)
+    facet_values = [model_facet_values(model) for model in models]
+
+    # 값별 ordinal 비트를 바이트 배열에 설정한 뒤 한 번에 정수로 변환
+    buffers = {facet: defaultdict(lambda: bytearray((size + 7) // 8)) for facet in FACETS}
+    counts = {facet: Counter() for facet in FACETS}
+    for ordinal, values in enumerate(facet_values):
+        byte, bit = divmod(ordinal, 8)
+        for facet in FACETS:
+            for value in values[facet]:
+                buffers[facet][value][byte] |= 1 << bit
+                counts[facet][value] += 1
+
+    facets = {}
+    for facet in FACETS:
+        facets[facet] = {
+            value: {
+                'count': counts[facet][value],
+                'bits': base64.b64encode(bytes(buffer)).decode('ascii')
+            }
+            for value, buffer in sorted(buffers[facet].items())
+        }
+
+    return {
+        'version': INDEX_VERSION,
+        'generated_at': datetime.now().isoformat(),
+        'model_count': size,
+        'models': [model.get('unique_id', '') for model in models],
+        'facets': facets,
+        'cube': {
+            'dimensions': list(CUBE_DIMENSIONS),
+            'cells': build_facet_cube(facet_values)
+        }
+    }
+
+
+class FacetIndex:
+    """facets.json 기반 필터 조회 헬퍼
+
+    filters 예: {'provider': ['openai', 'anthropic'], 'feature': ['vision'], 'context_bucket': ['100k_1m']}
+    """
+
+    def __init__(self, index: Dict[str, Any]):
+        self.model_count = index['model_count']
+        self.models = index.get('models', [])
+        self.cube_dimensions = index['cube']['dimensions']
+        self.cube_cells = index['cube']['cells']
+        self.bitsets = {
+            facet: {value: decode_bitset(entry['bits']) for value, entry in values.items()}
+            for facet, values in index['facets'].items()
+        }
+        self.all_bits = (1 << self.model_count) - 1
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'FacetIndex':
+        """색인 파일 로드"""
+        return cls(load_json(path))
+
+    def mask(self, filters: Optional[Dict[str, List[str]]] = None, exclude: Optional[str] = None) -> int:
+        """필터 조건에 맞는 모델 비트셋 (exclude 패싯은 조건에서 제외)"""
+        result = self.all_bits
+        for facet, values in (filters or {}).items():
+            if facet == exclude or not values:
+                continue
+            facet_bits = self.bitsets.get(facet, {})
+            union = 0
+            for value in values:
+                union |= facet_bits.get(value, 0)
+            result &= union
+            if not result:
+                break
+        return result
+
+    def count(self, filters: Optional[Dict[str, List[str]]] = None) -> int:
+        """조건에 맞는 모델 수"""
+        return self.mask(filters).bit_count()
+
+    def select(self, filters: Optional[Dict[str, List[str]]] = None) -> List[int]:
+        """조건에 맞는 모델 ordinal 목록"""
+        return list(iter_bits(self.mask(filters)))
+
+    def select_ids(self, filters: Optional[Dict[str, List[str]]] = None) -> List[str]:
+        """조건에 맞는 모델 unique_id 목록"""
+        return [self.models[ordinal] for ordinal in iter_bits(self.mask(filters))]
+
+    def facet_counts(self, filters: Optional[Dict[str, List[str]]] = None) -> Dict[str, Dict[str, int]]:
+        """각 패싯 값 선택 시 결과 수 (해당 패싯 자신의 조건은 제외하고 계산)"""
+        result = {}
+        for facet, values in self.bitsets.items():
+            base = self.mask(filters, exclude=facet)
+            result[facet] = {value: (bits & base).bit_count() for value, bits in values.items()}
+        return result
+
+    def cube_count(self, **selection: str) -> int:
+        """큐브에서 직접 조회하는 조합별 모델 수 (지정하지 않은 차원은 '*')"""
+        unknown = set(selection) - set(self.cube_dimensions)
+        if unknown:
+            raise ValueError(f"Not a cube dimension: {', '.join(sorted(unknown))}")
+        key = '|'.join(selection.get(dim, ALL) for dim in self.cube_dimensions)
+        return self.cube_cells.get(key, 0)
+
+
+def write_facet_index(models: List[Dict], path: Union[str, Path]) -> Dict[str, Any]:
+    """패싯 색인 생성 후 저장"""
+    path = Path(path)
+    index = build_facet_index(models)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    dump_json(index, path, indent=False, atomic=True)
+    return index
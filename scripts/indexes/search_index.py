@@ -0,0 +1,252 @@
+"""
+모델 검색용 역색인
+DataProcessor가 통합 단계에서 생성하는 data/indexes/search.json과 이를 사용하는 조회 API
+
+색인 구조 (모델 ordinal = consolidated.json의 models 배열 순서):
+    models    - ordinal 순서의 unique_id 목록
+    providers - 제공업체별 검색 필드 지문 (증분 재빌드용)
+    tokens    - 정규화된 토큰 -> 정렬된 ordinal 목록
+    prefixes  - 더 긴 토큰의 접두사 (MIN_PREFIX_LEN ~ MAX_PREFIX_LEN) -> 그 접두사로 시작하는 모든 토큰의 ordinal 목록
+"""
+
+import hashlib
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, Union
+
+from utils.json_codec import load_json, dump_json
+
+INDEX_VERSION = 1
+MIN_PREFIX_LEN = 2
+MAX_PREFIX_LEN = 8
+BISECT_RATIO = 16
+SEARCH_FIELDS = ('name', 'id', 'description', 'features', 'use_cases')
+
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    """NFKC 정규화 + 소문자 변환"""
+    return unicodedata.normalize('NFKC', text).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """텍스트를 검색 토큰으로 분리 ('GPT-4o mini' -> ['gpt', '4o', 'mini'])"""
+    return [token for token in _TOKEN_PATTERN.findall(normalize_text(text)) if token != '_']
+
+
+def model_search_text(model: Dict) -> str:
+    """모델의 검색 대상 필드를 하나의 문자열로 결합"""
+    parts = []
+    for field in SEARCH_FIELDS:
+        value = model.get(field) or ''
+        if isinstance(value, list):
+            parts.extend(str(item) for item in value)
+        else:
+            parts.append(str(value))
+    return '\n'.join(parts)
+
+
+def model_tokens(model: Dict) -> Set[str]:
+    """모델의 고유 토큰 집합"""
+    return set(tokenize(model_search_text(model)))
+
+
+def provider_fingerprints(models: List[Dict], texts: Optional[List[str]] = None) -> Dict[str, str]:
+    """제공업체별 검색 필드 지문 계산 (변경 감지용)"""
+    hashers = {}
+    for position, model in enumerate(models):
+        provider = model.get('provider', '')
+        hasher = hashers.get(provider)
+        if hasher is None:
+            hasher = hashers[provider] = hashlib.sha1()
+        text = texts[position] if texts is not None else model_search_text(model)
+        hasher.update(model.get('unique_id', '').encode('utf-8'))
+        hasher.update(text.encode('utf-8'))
+        hasher.update(b'\0')
+    return {provider: hasher.hexdigest() for provider, hasher in sorted(hashers.items())}
+
+
+def _remap_postings(previous: Dict[str, Any], ordinal_map: Dict[int, int]) -> Dict[str, List[int]]:
+    """이전 색인의 토큰 ordinal을 새 ordinal로 변환 (재사용 대상 모델만)
+
+    unique_id가 중복된 이전 모델은 같은 새 ordinal로 모이므로 중복을 제거합니다.
+    """
+    postings = {}
+    for token, ordinals in previous.get('tokens', {}).items():
+        mapped = sorted({ordinal_map[ordinal] for ordinal in ordinals if ordinal in ordinal_map})
+        if mapped:
+            postings[token] = mapped
+    return postings
+
+
+def _build_prefix_postings(token_postings: Dict[str, List[int]]) -> Dict[str, List[int]]:
+    """토큰 posting을 접두사별로 합쳐 접두사 posting 생성
+
+    접두사가 그 자체로 토큰이면 해당 토큰의 posting도 포함하므로 조회 시 한 번의 lookup으로 충분합니다.
+    """
+    prefix_tokens = defaultdict(list)
+    for token in token_postings:
+        for length in range(MIN_PREFIX_LEN, min(len(token), MAX_PREFIX_LEN + 1)):
+            prefix_tokens[token[:length]].append(token)
+    for prefix, tokens in prefix_tokens.items():
+        if prefix in token_postings:
+            tokens.append(prefix)
+
+    prefix_postings = {}
+    for prefix, tokens in prefix_tokens.items():
+        if len(tokens) == 1:
+            prefix_postings[prefix] = token_postings[tokens[0]]
+        else:
+            prefix_postings[prefix] = sorted(set().union(*(token_postings[t] for t in tokens)))
+    return prefix_postings
+
+
+def build_search_index(models: List[Dict], previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """모델 목록으로 역색인 생성
+
+    previous가 주어지면 검색 필드 지문이 같은 제공업체 모델의 posting은 이전 색인에서 옮겨오고,
+    변경된 제공업체의 모델만 다시 토큰화합니다.
+    """
+    unique_ids = [model.get('unique_id', '') for model in models]
+    texts = [model_search_text(model) for model in models]
+    fingerprints = provider_fingerprints(models, texts)
+
+    unchanged = set()
+    if previous and previous.get('version') == INDEX_VERSION:
+        previous_fingerprints = previous.get('providers', {})
+        unchanged = {
+            provider for provider, fingerprint in fingerprints.items()
+            if previous_fingerprints.get(provider) == fingerprint
+        }
+
+    # 모든 제공업체가 그대로이고 순서도 같으면 이전 색인을 그대로 사용
+    if unchanged and len(unchanged) == len(fingerprints) and previous.get('models') == unique_ids:
+        return {
+            **previous,
+            'generated_at': datetime.now().isoformat(),
+            'reused_providers': sorted(unchanged)
+        }
+
+    new_ordinals = {}
+    for ordinal, model in enumerate(models):
+        if model.get('provider') in unchanged:
+            new_ordinals[unique_ids[ordinal]] = ordinal
+    ordinal_map = {
+        old: new_ordinals[unique_id]
+        for old, unique_id in enumerate(previous.get('models', []) if unchanged else [])
+        if unique_id in new_ordinals
+    }
+
+    token_postings = defaultdict(list, _remap_postings(previous, ordinal_map) if ordinal_map else {})
+    reused = set(ordinal_map.values())
+    for ordinal, text in enumerate(texts):
+        if ordinal in reused:
+            continue
+        for token in set(tokenize(text)):
+            token_postings[token].append(ordinal)
+
+    if ordinal_map:
+        for ordinals in token_postings.values():
+            ordinals.sort()
+
+    token_postings = dict(sorted(token_postings.items()))
+    return {
+        'version': INDEX_VERSION,
+        'generated_at': datetime.now().isoformat(),
+        'models': unique_ids,
+        'providers': fingerprints,
+        'reused_providers': sorted(unchanged),
+        'tokens': token_postings,
+        'prefixes': dict(sorted(_build_prefix_postings(token_postings).items()))
+    }
+
+
+def _intersect(postings: List[List[int]]) -> List[int]:
+    """정렬된 ordinal 목록들의 교집합
+
+    결과가 상대 목록보다 훨씬 작으면 이진 탐색, 비슷한 크기면 집합 연산을 사용합니다.
+    """
+    postings = sorted(postings, key=len)
+    result = postings[0]
+    for other in postings[1:]:
+        if not result:
+            break
+        size = len(other)
+        if len(result) * BISECT_RATIO < size:
+            filtered = []
+            for ordinal in result:
+                pos = bisect_left(other, ordinal)
+                if pos < size and other[pos] == ordinal:
+                    filtered.append(ordinal)
+            result = filtered
+        else:
+            result = sorted(set(result).intersection(other))
+    return result
+
+
+class SearchIndex:
+    """search.json 기반 모델 검색 API"""
+
+    def __init__(self, index: Dict[str, Any]):
+        self.models = index['models']
+        self.tokens = index['tokens']
+        self.prefixes = index['prefixes']
+        self._sorted_tokens = None
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'SearchIndex':
+        """색인 파일 로드"""
+        return cls(load_json(path))
+
+    def _prefix_postings(self, prefix: str) -> List[int]:
+        """접두사 일치 ordinal 목록"""
+        if len(prefix) <= MAX_PREFIX_LEN:
+            postings = self.prefixes.get(prefix)
+            return postings if postings is not None else self.tokens.get(prefix, [])
+
+        # 긴 접두사는 정렬된 토큰 목록에서 범위 탐색
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self.tokens)
+        matched = set()
+        pos = bisect_left(self._sorted_tokens, prefix)
+        while pos < len(self._sorted_tokens) and self._sorted_tokens[pos].startswith(prefix):
+            matched.update(self.tokens[self._sorted_tokens[pos]])
+            pos += 1
+        return sorted(matched)
+
+    def search_ordinals(self, query: str, prefix: bool = True) -> List[int]:
+        """모든 검색어를 포함하는 모델 ordinal 목록 (prefix=True면 각 검색어를 접두사로 일치)"""
+        terms = tokenize(query)
+        if not terms:
+            return list(range(len(self.models)))
+
+        lookup = self._prefix_postings if prefix else (lambda term: self.tokens.get(term, []))
+        return _intersect([lookup(term) for term in dict.fromkeys(terms)])
+
+    def search(self, query: str, limit: Optional[int] = None, prefix: bool = True) -> List[str]:
+        """검색어에 일치하는 unique_id 목록"""
+        ordinals = self.search_ordinals(query, prefix=prefix)
+        if limit is not None:
+            ordinals = ordinals[:limit]
+        return [self.models[ordinal] for ordinal in ordinals]
+
+
+def write_search_index(models: List[Dict], path: Union[str, Path]) -> Dict[str, Any]:
+    """기존 색인을 참고하여 증분 재빌드 후 저장"""
+    path = Path(path)
+    previous = None
+    if path.exists():
+        try:
+            previous = load_json(path)
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable search index {path}: {e}")
+
+    index = build_search_index(models, previous)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    dump_json(index, path, indent=False, atomic=True)
+    return index
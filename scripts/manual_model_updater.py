@@ -4,10 +4,10 @@
 manual_models.json의 최신 모델 정보를 기존 데이터와 통합합니다.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
+from utils.json_codec import load_json, dump_json
 
 class ManualModelUpdater:
     def __init__(self):
@@ -22,8 +22,7 @@ class ManualModelUpdater:
             print(f"❌ Manual models file not found: {self.manual_file}")
             return {}
             
-        with open(self.manual_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json(self.manual_file)
     
     def load_existing_provider_data(self, provider: str) -> Dict[str, Any]:
         """기존 공급업체 데이터 로드"""
@@ -42,8 +41,7 @@ class ManualModelUpdater:
                 'models': []
             }
         
-        with open(provider_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json(provider_file)
     
     def merge_models(self, existing_models: List[Dict], manual_models: List[Dict]) -> List[Dict]:
         """기존 모델과 수동 큐레이션 모델 병합"""
@@ -98,8 +96,7 @@ class ManualModelUpdater:
         # 업데이트 시간 갱신
         data['last_updated'] = datetime.now().isoformat()
         
-        with open(provider_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        dump_json(data, provider_file)
         
         print(f"💾 {provider}: {len(data['models'])} models saved")
     
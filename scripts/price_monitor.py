@@ -1,39 +1,41 @@
 #!/usr/bin/env python3
-import json
+import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional
+from utils.json_codec import load_json
+from history.reader import open_history
+from history.array_reader import HistoryArrays, PriceRowView
+from history.records import iter_price_records
+from history.price_index import PriceIndex, CONFIRM_AFTER_DAYS, content_digest
+from history.event_log import EventLog
+from analytics.price_changes import detect_history_changes, change_records, top_moves
+from analytics.anomaly import load_references, score_with_history
+from analytics.report import render_report, write_report
+from utils.run_metrics import get_metrics
+from utils.profiling import add_profile_argument, enable as enable_profiling
 
 class PriceMonitor:
-    def __init__(self):
-        self.base_dir = Path(__file__).parent.parent
+    def __init__(self, base_dir: Optional[Path] = None):
+        # base_dir: data/ 를 포함하는 루트 (합성 데이터 트리 등, 기본: 저장소 루트)
+        self.base_dir = Path(base_dir or Path(__file__).parent.parent)
         self.current_data_file = self.base_dir / "data/consolidated.json"
         self.history_dir = self.base_dir / "data/history"
         self.changes_file = self.base_dir / "price_changes.txt"
         self.report_file = self.base_dir / "price_changes_report.md"
+        self.openrouter_file = self.base_dir / "data/models/openrouter.json"
         
-    def get_previous_data(self) -> Dict:
-        """이전 데이터 가져오기 (어제 또는 가장 최근 데이터)"""
+    def previous_date(self, history=None) -> Optional[str]:
+        """이전 스냅샷 날짜 (어제, 없으면 오늘 이전의 가장 최근 날짜)"""
+        today = datetime.now().strftime("%Y-%m-%d")
         yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-        yesterday_file = self.history_dir / f"{yesterday}.json"
-        
-        if yesterday_file.exists():
-            with open(yesterday_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        
-        # 어제 데이터가 없으면 가장 최근 데이터 찾기
-        history_files = sorted(self.history_dir.glob("*.json"))
-        if history_files:
-            with open(history_files[-1], 'r', encoding='utf-8') as f:
-                return json.load(f)
-        
-        return None
+        history = history or open_history(self.history_dir)
+        return yesterday if history.has(yesterday) else history.latest(before=today)
     
     def get_current_data(self) -> Dict:
         """현재 데이터 가져오기"""
         if self.current_data_file.exists():
-            with open(self.current_data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json(self.current_data_file)
         return None
     
     def compare_prices(self, previous: Dict, current: Dict) -> List[Dict]:
@@ -42,19 +44,10 @@ class PriceMonitor:
         
         # 이전 데이터를 ID로 인덱싱
         prev_models = {}
-        if previous and 'price_snapshot' in previous:
-            for model in previous['price_snapshot']:
-                prev_models[model['unique_id']] = model
-        elif previous and 'models' in previous:
-            for model in previous['models']:
-                unique_id = model.get('unique_id', f"{model['provider']}/{model['id']}")
-                prev_models[unique_id] = {
-                    'unique_id': unique_id,
-                    'name': model['name'],
-                    'provider': model['provider'],
-                    'input_price': model.get('pricing', {}).get('input', 0) or model.get('input_price', 0),
-                    'output_price': model.get('pricing', {}).get('output', 0) or model.get('output_price', 0)
-                }
+        if isinstance(previous, (PriceRowView, PriceIndex)):
+            prev_models = previous
+        elif previous:
+            prev_models = {record['unique_id']: record for record in iter_price_records(previous)}
         
         # 현재 데이터와 비교
         if current and 'models' in current:
@@ -73,6 +66,7 @@ class PriceMonitor:
                     if (prev_input != current_input or prev_output != current_output) and prev_input > 0:
                         change = {
                             'model_id': model['id'],
+                            'unique_id': unique_id,
                             'name': model['name'],
                             'provider': model['provider'],
                             'input_price': {
@@ -94,6 +88,7 @@ class PriceMonitor:
                     if current_input > 0 or current_output > 0:
                         changes.append({
                             'model_id': model['id'],
+                            'unique_id': unique_id,
                             'name': model['name'],
                             'provider': model['provider'],
                             'type': 'new',
@@ -103,123 +98,143 @@ class PriceMonitor:
         
         return changes
     
+    def score_changes(self, changes: List[Dict], previous: Dict, current: Dict) -> List[Dict]:
+        """가격 변경마다 신뢰도를 매기고 잘못 읽은 값으로 보이는 변경 표시 (suppressed)"""
+        if isinstance(previous, PriceRowView):
+            previous_date = previous.date
+        elif isinstance(previous, PriceIndex):
+            # 색인 as_of는 오늘(이전 실행)일 수 있으므로 오늘 이전의 마지막 이력 날짜까지 사용
+            previous_date = self.previous_date()
+        else:
+            # 날짜가 없는 예전 스냅샷이면 어제까지의 이력 사용
+            previous_date = (previous or {}).get('date') or (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        
+        references = load_references(current, self.openrouter_file)
+        return score_with_history(changes, HistoryArrays.open(self.history_dir), previous_date, references)
+    
     def generate_report(self, changes: List[Dict]) -> str:
         """변경 사항 리포트 생성"""
         if not changes:
             return "No price changes detected."
+        return render_report(changes)
+    
+    def summarize_windows(self, limit: int = 5) -> List[List[str]]:
+        """히스토리 가격 배열 기준 1/7/30일 변경 요약 섹션 (write_report appendix용, 배열이 없으면 빈 목록)"""
+        arrays = HistoryArrays.open(self.history_dir)
+        if arrays is None or not arrays.dates:
+            return []
         
-        report = f"# 🚨 AI Model Price Changes Report\n\n"
-        report += f"**Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        # 새로운 모델
-        new_models = [c for c in changes if c.get('type') == 'new']
-        if new_models:
-            report += "## 🆕 New Models\n\n"
-            for model in new_models:
-                report += f"### {model['name']} ({model['provider']})\n"
-                report += f"- Input: ${model['input_price']['new']}/1M tokens\n"
-                report += f"- Output: ${model['output_price']['new']}/1M tokens\n\n"
-        
-        # 가격 변경
-        price_changes = [c for c in changes if c.get('type') != 'new']
-        if price_changes:
-            report += "## 💰 Price Changes\n\n"
-            
-            # 인상/인하 분류
-            increases = []
-            decreases = []
-            
-            for change in price_changes:
-                if change['input_price']['change'] > 0 or change['output_price']['change'] > 0:
-                    increases.append(change)
-                else:
-                    decreases.append(change)
-            
-            if increases:
-                report += "### 📈 Price Increases\n\n"
-                for change in increases:
-                    report += f"#### {change['name']} ({change['provider']})\n"
-                    
-                    if change['input_price']['change'] != 0:
-                        report += f"- **Input**: ${change['input_price']['old']} → "
-                        report += f"${change['input_price']['new']} "
-                        report += f"({change['input_price']['change']:+.2f}, "
-                        report += f"{change['input_price']['change_percent']:+.1f}%)\n"
-                    
-                    if change['output_price']['change'] != 0:
-                        report += f"- **Output**: ${change['output_price']['old']} → "
-                        report += f"${change['output_price']['new']} "
-                        report += f"({change['output_price']['change']:+.2f}, "
-                        report += f"{change['output_price']['change_percent']:+.1f}%)\n"
-                    
-                    report += "\n"
-            
-            if decreases:
-                report += "### 📉 Price Decreases\n\n"
-                for change in decreases:
-                    report += f"#### {change['name']} ({change['provider']})\n"
-                    
-                    if change['input_price']['change'] != 0:
-                        report += f"- **Input**: ${change['input_price']['old']} → "
-                        report += f"${change['input_price']['new']} "
-                        report += f"({change['input_price']['change']:+.2f}, "
-                        report += f"{change['input_price']['change_percent']:+.1f}%)\n"
-                    
-                    if change['output_price']['change'] != 0:
-                        report += f"- **Output**: ${change['output_price']['old']} → "
-                        report += f"${change['output_price']['new']} "
-                        report += f"({change['output_price']['change']:+.2f}, "
-                        report += f"{change['output_price']['change_percent']:+.1f}%)\n"
-                    
-                    report += "\n"
+        results = detect_history_changes(arrays)
+        if not results:
+            return []
         
-        # 요약
-        report += "## 📊 Summary\n\n"
-        report += f"- Total changes detected: {len(changes)}\n"
-        report += f"- New models: {len(new_models)}\n"
-        report += f"- Price changes: {len(price_changes)}\n"
+        unique_ids = arrays.unique_ids
+        sections = [[
+            "\n## 📆 Multi-window Changes\n\n",
+            "| Window | Since | Changed | New | Removed | Re-listed |\n",
+            "|--------|-------|---------|-----|---------|-----------|\n",
+            *(f"| {result['window']}d | {result['base_date']} | {len(result['changed'])} | "
+              f"{len(result['new'])} | {len(result['removed'])} | {len(result['relisted'])} |\n"
+              for result in results)
+        ]]
         
-        return report
+        # 구간별 최대 변동은 섹션을 나눠 리포트 길이 제한을 넘으면 뒤 구간부터 생략
+        for result in results:
+            moves = change_records(result, unique_ids, top_moves(result, limit))
+            if not moves:
+                continue
+            sections.append([
+                f"\n### Largest moves ({result['window']}d)\n\n",
+                *(f"- {move['unique_id']}: input {move['input_price']['change_percent']:+.1f}%, "
+                  f"output {move['output_price']['change_percent']:+.1f}%\n" for move in moves)
+            ])
+        return sections
+    
+    def load_price_index(self) -> PriceIndex:
+        """마지막으로 본 가격 색인 = run()의 비교 기준 (없으면 이전 날짜 스냅샷으로 초기화)"""
+        index = PriceIndex(self.history_dir)
+        if index.is_empty():
+            # 행 뷰(PriceRowView)에는 가격만 있어 레코드 해시가 달라지므로 전체 레코드가 있는 스냅샷으로 초기화
+            history = open_history(self.history_dir)
+            date = self.previous_date(history)
+            if date:
+                index.rebuild(iter_price_records(history.load(date)), as_of=date)
+        return index
     
     def run(self):
         """가격 모니터링 실행"""
         print("💰 Starting price monitoring...")
         
-        # 데이터 로드
-        previous = self.get_previous_data()
-        current = self.get_current_data()
-        
-        if not previous:
-            print("No previous data found for comparison.")
+        # consolidated.json이 마지막 실행 이후 그대로면 파싱하지 않음
+        index = self.load_price_index()
+        if index.is_current(self.current_data_file):
+            print("No price changes detected (data unchanged since last run).")
             with open(self.changes_file, 'w') as f:
                 f.write("false")
             return
         
+        current = self.get_current_data()
+        
         if not current:
             print("No current data found.")
             with open(self.changes_file, 'w') as f:
                 f.write("false")
             return
         
-        # 가격 비교
-        changes = self.compare_prices(previous, current)
+        # 레코드 해시가 색인과 다른 모델만 비교
+        today = datetime.now().strftime("%Y-%m-%d")
+        candidates = index.changed_records(current, as_of=today)
+        get_metrics().add_models(len(candidates))
+        if index.is_empty():
+            print("No previous data found for comparison.")
+            changes = []
+        else:
+            changes = self.compare_prices(index, {'models': candidates})
+            changes = self.score_changes(changes, index, current)
+        
+        # 제외됐던 값이 CONFIRM_AFTER_DAYS일 동안 계속 관측되면 실제 가격 변경으로 보고
+        for change in changes:
+            if change['unique_id'] in index.confirmed and change.get('suppressed'):
+                change['suppressed'] = False
+                change['anomaly_reasons'].append(f"confirmed: observed for {CONFIRM_AFTER_DAYS} days")
         
-        # 결과 저장
+        suppressed = [c for c in changes if c.get('suppressed')]
+        for change in suppressed:
+            print(f"  ⚠️ Suppressed likely misparse: {change['name']} ({change['provider']}) "
+                  f"confidence {change['confidence']:.2f}")
+        
+        # 잘못 읽은 값으로 보이는 가격은 색인 가격에 반영하지 않고, 같은 값이 계속되면 다시 보고하지 않도록 표시
+        suppressed_ids = {c['unique_id'] for c in suppressed}
+        index.update(
+            [record for record in candidates if record['unique_id'] not in suppressed_ids],
+            as_of=today,
+            source_digest=content_digest(self.current_data_file)
+        )
+        index.suppress([record for record in candidates if record['unique_id'] in suppressed_ids], as_of=today)
+        index.save()
+        print(f"📇 Examined {len(candidates)} of {len(index)} indexed models")
+        
+        # 모든 변경(제외된 변경 포함)을 이벤트 로그에 기록
         if changes:
-            print(f"✅ Found {len(changes)} price changes!")
+            EventLog(self.history_dir).append_changes(changes)
+        
+        # 결과 저장 (잘못 읽은 값으로 보이는 변경만 있으면 알림 없음)
+        if len(suppressed) < len(changes):
+            print(f"✅ Found {len(changes) - len(suppressed)} price changes!")
             
             # 변경 플래그 저장
             with open(self.changes_file, 'w') as f:
                 f.write("true")
             
-            # 상세 리포트 생성
-            report = self.generate_report(changes)
+            # 상세 리포트 생성 (이슈 본문 길이 제한 안에서 요약 우선)
             with open(self.report_file, 'w', encoding='utf-8') as f:
-                f.write(report)
+                written = write_report(changes, f, appendix=self.summarize_windows())
+            if written['omitted']:
+                print(f"  ✂️ Report truncated: {written['omitted']} section(s) omitted")
             
             # 콘솔 출력
             print("\nPrice changes summary:")
-            for change in changes[:5]:  # 상위 5개만 출력
+            for change in [c for c in changes if not c.get('suppressed')][:5]:  # 상위 5개만 출력
                 if change.get('type') == 'new':
                     print(f"  🆕 New: {change['name']} ({change['provider']})")
                 else:
@@ -230,5 +245,12 @@ class PriceMonitor:
                 f.write("false")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detect price changes")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    if args.profile:
+        enable_profiling(args.profile)
+    
     monitor = PriceMonitor()
-    monitor.run()
\ No newline at end of file
+    with get_metrics().stage('monitor'):
+        monitor.run()
\ No newline at end of file
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
+import argparse
 import sys
 import subprocess
 from pathlib import Path
 import time
+from utils.run_metrics import run_id, run_dir, write_run_report
+from utils.profiling import add_profile_argument, enable as enable_profiling
 
 def run_crawler(script_name: str) -> bool:
     """개별 크롤러 실행"""
@@ -32,8 +35,18 @@ def run_crawler(script_name: str) -> bool:
 
 def main():
     """모든 크롤러 실행"""
+    parser = argparse.ArgumentParser(description="Run all crawlers, the data processor and the price monitor")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    
     print("🚀 Starting all crawlers...")
     
+    # 하위 프로세스가 같은 실행 ID로 단계 지표를 기록하도록 환경 변수 설정
+    run = run_id()
+    if args.profile:
+        enable_profiling(args.profile)
+        print(f"🔬 Profiling stages ({args.profile}) → {run_dir(run) / 'profiles'}")
+    
     crawlers = [
         "crawlers/openai_crawler.py",
         "crawlers/anthropic_crawler.py",
@@ -74,6 +87,10 @@ def main():
     else:
         print("❌ Price monitoring failed!")
     
+    # 단계별 지표를 JSON 실행 리포트 / Prometheus textfile로 저장
+    if write_run_report(run):
+        print(f"\n📈 Run report written to {run_dir(run)}")
+    
     print("\n🎉 All tasks completed!")
     return 0
 
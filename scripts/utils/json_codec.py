@@ -0,0 +1,143 @@
+"""
+JSON 코덱 레이어
+orjson / msgspec이 설치되어 있으면 빠른 백엔드를 사용하고, 없으면 표준 json으로 동작합니다.
+
+환경 변수:
+    JSON_CODEC_BACKEND   - 백엔드 강제 지정 (orjson, msgspec, stdlib)
+    JSON_CODEC_CANONICAL - 1이면 항상 표준 json과 바이트 단위로 동일한 출력 생성
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # 선택적 의존성
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # 선택적 의존성
+    msgspec = None
+
+PathLike = Union[str, Path]
+
+BACKENDS = ('orjson', 'msgspec', 'stdlib')
+
+
+def _available_backends() -> list:
+    """설치된 백엔드 목록 (우선순위 순)"""
+    available = []
+    if orjson is not None:
+        available.append('orjson')
+    if msgspec is not None:
+        available.append('msgspec')
+    available.append('stdlib')
+    return available
+
+
+def _select_backend() -> str:
+    """환경 변수 또는 설치 여부에 따라 백엔드 선택"""
+    requested = os.environ.get('JSON_CODEC_BACKEND', '').strip().lower()
+    available = _available_backends()
+    if requested:
+        if requested not in BACKENDS:
+            raise ValueError(f"Unknown JSON_CODEC_BACKEND: {requested}")
+        if requested in available:
+            return requested
+        print(f"⚠️ JSON backend '{requested}' not installed, falling back to {available[0]}")
+    return available[0]
+
+
+BACKEND = _select_backend()
+CANONICAL = os.environ.get('JSON_CODEC_CANONICAL', '') == '1'
+
+
+def available_backends() -> list:
+    """설치된 백엔드 목록 반환"""
+    return _available_backends()
+
+
+def loads(data: Union[bytes, str], backend: Optional[str] = None) -> Any:
+    """JSON 문자열/바이트 역직렬화"""
+    backend = backend or BACKEND
+    if backend == 'orjson':
+        return orjson.loads(data)
+    if backend == 'msgspec':
+        return msgspec.json.decode(data.encode('utf-8') if isinstance(data, str) else data)
+    return json.loads(data)
+
+
+def dumps(data: Any, indent: bool = True, canonical: Optional[bool] = None,
+          backend: Optional[str] = None) -> bytes:
+    """JSON 직렬화 (UTF-8 바이트 반환)
+
+    canonical=True이면 기존 json.dump(indent=2, ensure_ascii=False)와
+    바이트 단위로 동일한 결과를 보장합니다.
+    """
+    if canonical is None:
+        canonical = CANONICAL
+    backend = 'stdlib' if canonical else (backend or BACKEND)
+
+    if backend == 'orjson':
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            # 문자열이 아닌 키, 64비트 초과 정수 등은 표준 json으로 처리
+            pass
+    elif backend == 'msgspec':
+        try:
+            encoded = msgspec.json.encode(data)
+            return msgspec.json.format(encoded, indent=2) if indent else encoded
+        except (TypeError, OverflowError):
+            pass
+
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def atomic_file_mode(path: Path) -> int:
+    """원자적 교체용 임시 파일 권한 (기존 파일 권한 유지, 없으면 umask 적용)"""
+    try:
+        return path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def load_json(path: PathLike, backend: Optional[str] = None) -> Any:
+    """JSON 파일 로드"""
+    with open(path, 'rb') as f:
+        return loads(f.read(), backend=backend)
+
+
+def dump_json(data: Any, path: PathLike, indent: bool = True,
+              canonical: Optional[bool] = None, backend: Optional[str] = None,
+              atomic: bool = False):
+    """JSON 파일 저장
+
+    atomic=True이면 같은 디렉토리의 임시 파일에 쓴 뒤 교체합니다.
+    """
+    payload = dumps(data, indent=indent, canonical=canonical, backend=backend)
+    path = Path(path)
+
+    if not atomic:
+        with open(path, 'wb') as f:
+            f.write(payload)
+        return
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        os.chmod(tmp_path, atomic_file_mode(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -0,0 +1,107 @@
+"""
+스트리밍 JSON writer
+최상위 객체의 필드와 대용량 배열을 항목 단위로 직렬화하여 직렬화된 전체 출력 문자열을 메모리에 만들지 않습니다.
+배열 항목을 생성기로 넘겨도 호출하는 쪽이 항목을 따로 보관하면 그만큼의 메모리는 그대로 필요합니다.
+임시 파일에 기록한 뒤 완료 시 원자적으로 교체합니다.
+
+출력 형식은 json.dump(indent=2, ensure_ascii=False)와 동일합니다.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from utils import json_codec
+
+
+class StreamingJSONWriter:
+    """최상위 JSON 객체를 필드 단위로 기록하는 writer
+
+    사용 예:
+        with StreamingJSONWriter(path) as writer:
+            writer.write_field('last_updated', now)
+            writer.write_array('models', iter_models())
+            writer.write_field('statistics', stats)
+    """
+
+    def __init__(self, path: Union[str, Path], indent: bool = True,
+                 canonical: Optional[bool] = None, buffer_size: int = 1024 * 1024):
+        self.path = Path(path)
+        self.indent = indent
+        self.canonical = canonical
+        self.buffer_size = buffer_size
+        self._file = None
+        self._tmp_path = None
+        self._field_count = 0
+        self.bytes_written = 0
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix='.tmp'
+        )
+        os.chmod(self._tmp_path, json_codec.atomic_file_mode(self.path))
+        self._file = os.fdopen(fd, 'wb', buffering=self.buffer_size)
+        self._write(b'{')
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                self._write(b'\n}' if self.indent and self._field_count else b'}')
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                os.replace(self._tmp_path, self.path)
+            else:
+                self._file.close()
+        finally:
+            # 실패 시 임시 파일 정리 (기존 출력 파일은 그대로 유지)
+            if os.path.exists(self._tmp_path):
+                os.unlink(self._tmp_path)
+        return False
+
+    def _write(self, chunk: bytes):
+        self._file.write(chunk)
+        self.bytes_written += len(chunk)
+
+    def _encode(self, value: Any, depth: int) -> bytes:
+        """값 직렬화 후 현재 깊이에 맞게 들여쓰기"""
+        encoded = json_codec.dumps(value, indent=self.indent, canonical=self.canonical)
+        if self.indent and depth:
+            encoded = encoded.replace(b'\n', b'\n' + b'  ' * depth)
+        return encoded
+
+    def _begin_field(self, key: str):
+        separator = b',' if self._field_count else b''
+        encoded_key = json.dumps(key, ensure_ascii=False).encode('utf-8')
+        if self.indent:
+            self._write(separator + b'\n  ' + encoded_key + b': ')
+        else:
+            self._write(separator + encoded_key + b':')
+        self._field_count += 1
+
+    def write_field(self, key: str, value: Any):
+        """단일 필드 기록"""
+        self._begin_field(key)
+        self._write(self._encode(value, depth=1))
+
+    def write_array(self, key: str, items: Iterable[Any]) -> int:
+        """이터러블을 소비하면서 배열 필드를 항목 단위로 기록하고 항목 수 반환"""
+        self._begin_field(key)
+        count = 0
+        for item in items:
+            if self.indent:
+                prefix = b',\n    ' if count else b'[\n    '
+            else:
+                prefix = b',' if count else b'['
+            self._write(prefix + self._encode(item, depth=2))
+            count += 1
+
+        if count == 0:
+            self._write(b'[]')
+        else:
+            self._write(b'\n  ]' if self.indent else b']')
+        return count
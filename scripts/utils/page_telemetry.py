@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Playwright 페이지 텔레메트리
+WebScraperBase.fetch_with_playwright의 렌더링 시간을 어디에 썼는지 나눠 기록합니다.
+
+- 구간(phase): 브라우저 실행(launch), 이동(navigation, networkidle까지), 셀렉터 대기(selector_wait),
+  고정 대기(sleep), HTML 추출(content)
+- 네비게이션 타이밍: 브라우저 Navigation Timing API (DNS, 연결, TTFB, 다운로드, DOM 처리, DOMContentLoaded, load)
+- 스크립트 실행: Chromium CDP Performance 지표 (ScriptDuration, LayoutDuration 등, 실패하면 생략)
+- 네트워크: 리소스 유형별 요청/응답/실패 수와 전송 바이트, 가장 느린 요청
+
+페이지 기록은 render 단계의 extra.playwright에 들어가고, 실행 리포트는 summarize_page_telemetry로
+제공업체(스크래퍼)별로 합쳐 parse 단계 시간과 함께 보여줍니다.
+
+Playwright 객체는 이벤트/메서드만 사용하므로 이 모듈은 playwright 없이도 import할 수 있습니다.
+텔레메트리 수집 실패는 스크래핑을 중단시키지 않습니다.
+"""
+
+import asyncio
+import heapq
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Any, Iterator
+
+SLOWEST_REQUESTS = 5
+URL_LIMIT = 200
+
+PHASES = ('launch', 'navigation', 'selector_wait', 'sleep', 'content')
+
+NAVIGATION_TIMING_SCRIPT = """() => {
+    const n = performance.getEntriesByType('navigation')[0];
+    if (!n) return null;
+    return {
+        dns_ms: n.domainLookupEnd - n.domainLookupStart,
+        connect_ms: n.connectEnd - n.connectStart,
+        ttfb_ms: n.responseStart - n.requestStart,
+        download_ms: n.responseEnd - n.responseStart,
+        dom_processing_ms: n.domInteractive - n.responseEnd,
+        dom_content_loaded_ms: n.domContentLoadedEventEnd,
+        load_ms: n.loadEventEnd,
+        transfer_bytes: n.transferSize
+    };
+}"""
+
+# CDP Performance.getMetrics 중 기록할 항목 (초 단위, JSHeapUsedSize는 바이트)
+SCRIPT_METRICS = {
+    'ScriptDuration': 'script_seconds',
+    'LayoutDuration': 'layout_seconds',
+    'RecalcStyleDuration': 'style_seconds',
+    'TaskDuration': 'task_seconds',
+    'JSHeapUsedSize': 'js_heap_bytes',
+}
+
+
+def _new_type_counts() -> Dict[str, int]:
+    return {'requests': 0, 'responses': 0, 'failed': 0, 'bytes': 0}
+
+
+class PageTelemetry:
+    """Playwright 페이지 하나의 구간 시간 / 네비게이션 타이밍 / 네트워크 기록"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.phases = defaultdict(float)
+        self.by_type = defaultdict(_new_type_counts)
+        self.navigation = None
+        self.script = {}
+        self.selector_timeouts = 0
+        self._slowest = []
+        self._sequence = 0
+        self._pending = []
+        self._cdp = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    # ---- 수집 ----
+
+    async def attach(self, context, page):
+        """네트워크 이벤트 구독 및 CDP Performance 지표 활성화"""
+        page.on('request', self._on_request)
+        page.on('response', self._on_response)
+        page.on('requestfinished', self._on_finished)
+        page.on('requestfailed', self._on_failed)
+        try:
+            self._cdp = await context.new_cdp_session(page)
+            await self._cdp.send('Performance.enable')
+        except Exception:
+            # Chromium이 아니면 CDP를 쓸 수 없음
+            self._cdp = None
+
+    def _on_request(self, request):
+        self.by_type[request.resource_type]['requests'] += 1
+
+    def _on_response(self, response):
+        self.by_type[response.request.resource_type]['responses'] += 1
+
+    def _on_failed(self, request):
+        self.by_type[request.resource_type]['failed'] += 1
+
+    def _on_finished(self, request):
+        # 크기 조회는 비동기이므로 태스크로 기록하고 collect에서 기다림
+        self._pending.append(asyncio.ensure_future(self._record_finished(request)))
+
+    async def _record_finished(self, request):
+        sizes = await request.sizes()
+        transferred = sizes.get('responseBodySize', 0) + sizes.get('responseHeadersSize', 0)
+        self.by_type[request.resource_type]['bytes'] += max(transferred, 0)
+
+        # timing 값은 startTime 기준 ms (-1이면 해당 없음)
+        duration = request.timing.get('responseEnd', -1)
+        if duration >= 0:
+            self._sequence += 1
+            item = (duration, -self._sequence, {
+                'url': request.url[:URL_LIMIT],
+                'resource_type': request.resource_type,
+                'duration_ms': round(duration, 1),
+                'bytes': max(transferred, 0)
+            })
+            if len(self._slowest) < SLOWEST_REQUESTS:
+                heapq.heappush(self._slowest, item)
+            elif item > self._slowest[0]:
+                heapq.heapreplace(self._slowest, item)
+
+    async def collect(self, page):
+        """남은 요청 기록을 기다린 뒤 네비게이션 타이밍 / 스크립트 지표 수집 (page.close 전에 호출)"""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+            self._pending = []
+        try:
+            self.navigation = await page.evaluate(NAVIGATION_TIMING_SCRIPT)
+        except Exception:
+            self.navigation = None
+        if self._cdp:
+            try:
+                metrics = (await self._cdp.send('Performance.getMetrics')).get('metrics', [])
+                self.script = {SCRIPT_METRICS[m['name']]: m['value'] for m in metrics if m['name'] in SCRIPT_METRICS}
+                await self._cdp.detach()
+            except Exception:
+                self.script = {}
+
+    # ---- 출력 ----
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'url': self.url[:URL_LIMIT],
+            'phases': {name: round(self.phases[name], 6) for name in PHASES if name in self.phases},
+            'navigation': {key: round(value, 1) for key, value in (self.navigation or {}).items()},
+            'script': {key: round(value, 6) for key, value in self.script.items()},
+            'resources': {kind: dict(counts) for kind, counts in sorted(self.by_type.items())},
+            'slowest': [item[2] for item in sorted(self._slowest, reverse=True)],
+            'selector_timeouts': self.selector_timeouts
+        }
+
+
+def summarize_page_telemetry(records: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """render 단계 기록의 extra.playwright를 제공업체별로 합산 (parse 단계 시간 포함)"""
+    providers = {}
+
+    def provider_totals(provider: str) -> Dict[str, Any]:
+        if provider not in providers:
+            providers[provider] = {
+                'pages': 0,
+                'render_seconds': 0.0,
+                'parse_seconds': 0.0,
+                'phases': defaultdict(float),
+                'navigation': defaultdict(float),
+                'script': defaultdict(float),
+                'resources': defaultdict(_new_type_counts),
+                'slowest': [],
+                'selector_timeouts': 0
+            }
+        return providers[provider]
+
+    for record in records:
+        provider = record.get('provider', '')
+        telemetry = (record.get('extra') or {}).get('playwright')
+        if record['stage'] != 'render' or not telemetry:
+            continue
+
+        totals = provider_totals(provider)
+        totals['pages'] += 1
+        totals['render_seconds'] += record.get('wall_seconds', 0)
+        totals['selector_timeouts'] += telemetry.get('selector_timeouts', 0)
+        for section in ('phases', 'script'):
+            for key, value in telemetry.get(section, {}).items():
+                totals[section][key] += value
+        for key, value in telemetry.get('navigation', {}).items():
+            totals['navigation'][key] += value
+        for kind, counts in telemetry.get('resources', {}).items():
+            for key, value in counts.items():
+                totals['resources'][kind][key] += value
+        totals['slowest'].extend(telemetry.get('slowest', []))
+
+    # 렌더링한 스크래퍼의 parse 단계 시간
+    for provider, totals in providers.items():
+        totals['parse_seconds'] = sum(
+            record.get('wall_seconds', 0) for record in records
+            if record['stage'] == 'parse' and record.get('provider', '') == provider
+        )
+
+    summary = {}
+    for provider, totals in sorted(providers.items()):
+        summary[provider] = {
+            'pages': totals['pages'],
+            'render_seconds': round(totals['render_seconds'], 6),
+            'parse_seconds': round(totals['parse_seconds'], 6),
+            'phases': {key: round(value, 6) for key, value in totals['phases'].items()},
+            'navigation': {key: round(value, 1) for key, value in totals['navigation'].items()},
+            'script': {key: round(value, 6) for key, value in totals['script'].items()},
+            'resources': {kind: dict(counts) for kind, counts in sorted(totals['resources'].items())},
+            'slowest': heapq.nlargest(SLOWEST_REQUESTS, totals['slowest'], key=lambda item: item['duration_ms']),
+            'selector_timeouts': totals['selector_timeouts']
+        }
+    return summary
+
+
+def format_breakdown(provider: str, totals: Dict[str, Any]) -> str:
+    """'openai: 2 pages, 8.1s render (navigation 3.2s, sleep 3.0s, ...), parse 0.4s, 1.2 MB in 84 requests'"""
+    phases = ', '.join(f"{name} {totals['phases'][name]:.1f}s" for name in PHASES if name in totals['phases'])
+    requests = sum(counts['requests'] for counts in totals['resources'].values())
+    transferred = sum(counts['bytes'] for counts in totals['resources'].values())
+    line = (f"{provider}: {totals['pages']} page(s), {totals['render_seconds']:.1f}s render ({phases}), "
+            f"parse {totals['parse_seconds']:.1f}s, {transferred / 1_048_576:.1f} MB in {requests} requests")
+    if 'script_seconds' in totals['script']:
+        line += f", script {totals['script']['script_seconds']:.1f}s"
+    return line
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+파이프라인 단계 프로파일링 (선택)
+PIPELINE_PROFILE이 설정되면 run_metrics의 각 단계를 cProfile / tracemalloc으로 감싸고
+결과를 실행 디렉토리의 profiles/에 단계·제공업체 이름으로 저장합니다.
+
+PIPELINE_PROFILE:
+    cpu        - cProfile (.prof, pstats / snakeviz로 열기)
+    memory     - tracemalloc 스냅샷 (.snapshot, tracemalloc.Snapshot.load로 열기)
+    all 또는 1 - 둘 다 (cpu,memory 처럼 쉼표로 나열해도 됨)
+
+run_reports/<실행 ID>/profiles/
+    <stage>-<provider>-<pid>.prof       - CPU 프로파일 (같은 단계가 반복되면 누적)
+    <stage>-<provider>-<pid>.snapshot   - 단계 종료 시점의 할당 스냅샷
+    <stage>-<provider>-<pid>.txt        - 상위 핫스팟 요약
+    hotspots.txt                        - 모든 CPU 프로파일을 합친 상위 핫스팟 (run_metrics report 시 생성)
+
+- 가장 바깥 단계만 프로파일링합니다. 중첩된 단계(예: fetch 안의 render/parse)는 바깥 단계의 프로파일에 포함됩니다.
+- 단계 요약(상위 함수, 최대/잔여 할당)은 단계 기록의 extra.profile로 실행 리포트에도 들어갑니다.
+- 스크립트의 --profile 옵션은 환경 변수를 설정하므로 run_all_crawlers의 하위 프로세스에도 적용됩니다.
+
+사용법:
+    PIPELINE_PROFILE=cpu python scripts/data_processor.py
+    python scripts/run_all_crawlers.py --profile all
+    python scripts/utils/profiling.py summary [--run-id ID] [--top 20]
+"""
+
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import re
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+PROFILE_ENV = 'PIPELINE_PROFILE'
+PROFILE_MODES = ('cpu', 'memory')
+PROFILE_DIR = "profiles"
+TOP_N = 10
+TRACEMALLOC_FRAMES = 5
+BASE_DIR = Path(__file__).parent.parent.parent
+
+# 같은 단계가 한 프로세스에서 여러 번 실행되면 하나의 프로파일에 누적
+_profiles: Dict[str, cProfile.Profile] = {}
+
+
+def profile_modes() -> Tuple[str, ...]:
+    """PIPELINE_PROFILE에서 활성화된 모드 (비활성이면 빈 튜플)"""
+    value = os.environ.get(PROFILE_ENV, '').strip().lower()
+    if value in ('', '0', 'off', 'false', 'no'):
+        return ()
+    if value in ('1', 'all', 'on', 'true', 'yes'):
+        return PROFILE_MODES
+    requested = {mode.strip() for mode in value.split(',')}
+    return tuple(mode for mode in PROFILE_MODES if mode in requested)
+
+
+def enable(modes: str = 'all'):
+    """프로파일링 활성화 (환경 변수로 설정하여 하위 프로세스에도 적용)"""
+    os.environ[PROFILE_ENV] = modes
+
+
+def add_profile_argument(parser: argparse.ArgumentParser):
+    parser.add_argument('--profile', nargs='?', const='all', metavar='MODES',
+                        help="단계별 cProfile/tracemalloc 기록 (cpu, memory, all; 기본: all)")
+
+
+def profile_name(stage: str, labels: Dict[str, str]) -> str:
+    parts = [stage, *labels.values(), str(os.getpid())]
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', '-'.join(parts))
+
+
+def _location(filename: str) -> str:
+    path = Path(filename)
+    try:
+        return str(path.relative_to(BASE_DIR))
+    except ValueError:
+        return filename
+
+
+def top_functions(stats: pstats.Stats, limit: int = TOP_N) -> List[Dict[str, Any]]:
+    """자체 시간(tottime) 상위 함수"""
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+    result = []
+    for (filename, line, function), (_, calls, self_time, cumulative, _) in rows:
+        name = function if filename == '~' else f"{_location(filename)}:{line}({function})"
+        result.append({
+            'function': name,
+            'calls': calls,
+            'self_seconds': round(self_time, 6),
+            'cumulative_seconds': round(cumulative, 6)
+        })
+    return result
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, limit: int = TOP_N) -> List[Dict[str, Any]]:
+    """단계 종료 시점에 남아 있는 할당 상위 위치"""
+    return [
+        {
+            'location': f"{_location(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+            'size_bytes': stat.size,
+            'count': stat.count
+        }
+        for stat in snapshot.statistics('lineno')[:limit]
+    ]
+
+
+def format_summary(title: str, summary: Dict[str, Any]) -> str:
+    lines = [f"# {title}\n"]
+    if 'cpu' in summary:
+        lines.append(f"\n## CPU (top {len(summary['cpu']['top'])} by self time)\n")
+        lines.append(f"{'self s':>10} {'cum s':>10} {'calls':>10}  function\n")
+        for row in summary['cpu']['top']:
+            lines.append(f"{row['self_seconds']:>10.4f} {row['cumulative_seconds']:>10.4f} "
+                         f"{row['calls']:>10,}  {row['function']}\n")
+    if 'memory' in summary:
+        memory = summary['memory']
+        lines.append(f"\n## Memory (peak {memory['peak_bytes'] / 1_048_576:,.1f} MB, "
+                     f"retained {memory['retained_bytes'] / 1_048_576:,.1f} MB)\n")
+        lines.append(f"{'KB':>12} {'blocks':>10}  location\n")
+        for row in memory['top']:
+            lines.append(f"{row['size_bytes'] / 1024:>12,.1f} {row['count']:>10,}  {row['location']}\n")
+    return ''.join(lines)
+
+
+class StageProfiler:
+    """단계 하나의 cProfile / tracemalloc 기록"""
+
+    def __init__(self, directory: Path, stage: str, labels: Dict[str, str], modes: Tuple[str, ...]):
+        self.directory = directory / PROFILE_DIR
+        self.title = ' '.join([stage, *labels.values()])
+        self.name = profile_name(stage, labels)
+        self.modes = modes
+        self.profile = None
+        self._started_tracing = False
+
+    def start(self):
+        # tracemalloc을 먼저 시작해 cProfile에 시작 비용이 잡히지 않도록 함
+        if 'memory' in self.modes:
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+            tracemalloc.reset_peak()
+        if 'cpu' in self.modes:
+            self.profile = _profiles.setdefault(self.name, cProfile.Profile())
+            self.profile.enable()
+
+    def stop(self) -> Dict[str, Any]:
+        """프로파일 저장 후 요약 반환"""
+        if self.profile:
+            self.profile.disable()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        summary = {}
+        if 'memory' in self.modes and tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ])
+            if self._started_tracing:
+                tracemalloc.stop()
+            path = self.directory / f"{self.name}.snapshot"
+            snapshot.dump(str(path))
+            summary['memory'] = {
+                'file': path.name,
+                'peak_bytes': peak,
+                'retained_bytes': sum(trace.size for trace in snapshot.traces),
+                'top': top_allocations(snapshot)
+            }
+
+        if self.profile:
+            path = self.directory / f"{self.name}.prof"
+            self.profile.dump_stats(path)
+            summary['cpu'] = {'file': path.name, 'top': top_functions(pstats.Stats(self.profile))}
+
+        with open(self.directory / f"{self.name}.txt", 'w', encoding='utf-8') as f:
+            f.write(format_summary(self.title, summary))
+        return summary
+
+
+def merged_hotspots(directory: Path, limit: int = TOP_N) -> List[Dict[str, Any]]:
+    """profiles/의 모든 CPU 프로파일을 합친 상위 함수"""
+    paths = sorted(directory.glob("*.prof"))
+    if not paths:
+        return []
+    stats = pstats.Stats(str(paths[0]), stream=io.StringIO())
+    for path in paths[1:]:
+        stats.add(str(path))
+    return top_functions(stats, limit)
+
+
+def write_hotspots(directory: Path, limit: int = TOP_N) -> List[Dict[str, Any]]:
+    """hotspots.txt 저장 후 상위 함수 반환"""
+    hotspots = merged_hotspots(directory, limit)
+    if hotspots:
+        with open(directory / "hotspots.txt", 'w', encoding='utf-8') as f:
+            f.write(format_summary("All profiled stages", {'cpu': {'top': hotspots}}))
+    return hotspots
+
+
+def main():
+    from utils.run_metrics import run_dir
+
+    parser = argparse.ArgumentParser(description="Pipeline stage profiles")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    summary = subparsers.add_parser('summary', help='Print the top hotspots across all stage profiles')
+    summary.add_argument('--run-id', help='Run ID (default: PIPELINE_RUN_ID)')
+    summary.add_argument('--top', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == 'summary':
+        run = args.run_id or os.environ.get('PIPELINE_RUN_ID')
+        if not run:
+            print("❌ No run ID (set PIPELINE_RUN_ID or pass --run-id)")
+            sys.exit(1)
+        directory = run_dir(run) / PROFILE_DIR
+        hotspots = write_hotspots(directory, args.top) if directory.exists() else []
+        if not hotspots:
+            print(f"❌ No CPU profiles for run {run}")
+            sys.exit(1)
+        print(f"🔥 Top {len(hotspots)} hotspots ({directory})")
+        for row in hotspots:
+            print(f"   {row['self_seconds']:>9.3f}s self {row['cumulative_seconds']:>9.3f}s cum "
+                  f"{row['calls']:>10,}  {row['function']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+파이프라인 단계별 실행 지표
+크롤러(fetch/render/parse/normalize/save), DataProcessor(consolidate 등), PriceMonitor(monitor)의
+각 단계에서 wall time, CPU time, 가져온 바이트 수, 생성한 모델 수, 최대 RSS를 기록합니다.
+
+워크플로의 각 스크립트는 별도 프로세스이므로 단계 기록은 실행 디렉토리에 프로세스별 JSONL로 쌓고,
+report 명령으로 합쳐 JSON 실행 리포트와 Prometheus textfile을 만듭니다.
+
+run_reports/<실행 ID>/
+    stages-<pid>.jsonl   - 단계 기록 (한 줄에 하나)
+    run_report.json      - 전체 단계 목록과 단계/제공업체별 합계, 스크래퍼별 Playwright 텔레메트리
+    metrics.prom         - node_exporter textfile collector 형식
+
+환경 변수:
+    PIPELINE_RUN_ID  - 실행 ID (같은 값을 쓰는 프로세스의 기록이 한 리포트로 합쳐짐, 기본: 프로세스 시작 시각)
+    PIPELINE_RUN_DIR - 실행 리포트 상위 디렉토리 (기본: run_reports/)
+    PIPELINE_PROFILE - 단계 프로파일링 모드 (cpu, memory, all; 기본: 끔)
+
+- 중첩된 단계는 각각 기록되며 바깥 단계의 시간에 안쪽 단계가 포함됩니다.
+  add_bytes/add_models는 진행 중인 모든 단계에 더해집니다.
+- 최대 RSS는 단계가 끝난 시점까지의 프로세스 최대값입니다 (resource 모듈이 없으면 0).
+- PIPELINE_PROFILE을 설정하면 단계별 cProfile/tracemalloc 결과를 profiles/에 함께 남깁니다 (utils/profiling.py).
+
+사용법:
+    python scripts/utils/run_metrics.py report [--run-id ID]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.json_codec import dumps, dump_json, loads
+from utils.profiling import PROFILE_DIR, StageProfiler, profile_modes, write_hotspots
+from utils.page_telemetry import format_breakdown, summarize_page_telemetry
+
+BASE_DIR = Path(__file__).parent.parent.parent
+STAGE_FIELDS = ('wall_seconds', 'cpu_seconds', 'bytes', 'models')
+
+
+def peak_rss_bytes() -> int:
+    """프로세스 최대 RSS (Linux는 KB, macOS는 바이트 단위로 보고됨)"""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_id() -> str:
+    run = os.environ.get('PIPELINE_RUN_ID')
+    if not run:
+        run = os.environ['PIPELINE_RUN_ID'] = datetime.now().strftime('%Y%m%dT%H%M%S')
+    return run
+
+
+def run_dir(run: Optional[str] = None) -> Path:
+    root = Path(os.environ.get('PIPELINE_RUN_DIR') or BASE_DIR / "run_reports")
+    return root / (run or run_id())
+
+
+class Stage:
+    """진행 중인 단계 하나의 기록"""
+
+    def __init__(self, name: str, labels: Dict[str, str]):
+        self.name = name
+        self.labels = labels
+        self.bytes = 0
+        self.models = 0
+        self.extra = {}
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self.started_at = datetime.now().isoformat()
+
+    def add_bytes(self, count: int):
+        self.bytes += count
+
+    def add_models(self, count: int):
+        self.models += count
+
+    def finish(self, status: str) -> Dict[str, Any]:
+        record = {
+            'stage': self.name,
+            **self.labels,
+            'started_at': self.started_at,
+            'wall_seconds': round(time.perf_counter() - self._wall, 6),
+            'cpu_seconds': round(time.process_time() - self._cpu, 6),
+            'bytes': self.bytes,
+            'models': self.models,
+            'peak_rss_bytes': peak_rss_bytes(),
+            'status': status,
+            'pid': os.getpid()
+        }
+        if self.extra:
+            record['extra'] = self.extra
+        return record
+
+
+class RunMetrics:
+    """프로세스 안의 단계 기록기"""
+
+    def __init__(self):
+        self.active = []
+        self.records = []
+
+    @contextmanager
+    def stage(self, name: str, **labels: str) -> Iterator[Stage]:
+        """단계 측정 (예외가 나면 status=error로 기록 후 다시 발생)
+
+        PIPELINE_PROFILE이 설정되어 있으면 가장 바깥 단계를 cProfile/tracemalloc으로 감쌉니다.
+        """
+        stage = Stage(name, {key: str(value) for key, value in labels.items() if value is not None})
+        profiler = None
+        modes = profile_modes()
+        if modes and not self.active:
+            profiler = StageProfiler(run_dir(), name, stage.labels, modes)
+            profiler.start()
+        self.active.append(stage)
+        status = 'ok'
+        try:
+            yield stage
+        except BaseException:
+            status = 'error'
+            raise
+        finally:
+            self.active.remove(stage)
+            if profiler:
+                try:
+                    stage.extra['profile'] = profiler.stop()
+                except OSError as e:
+                    print(f"⚠️ Could not write stage profile: {e}")
+            self._write(stage.finish(status))
+
+    def add_bytes(self, count: int):
+        for stage in self.active:
+            stage.add_bytes(count)
+
+    def add_models(self, count: int):
+        for stage in self.active:
+            stage.add_models(count)
+
+    def _write(self, record: Dict[str, Any]):
+        self.records.append(record)
+        try:
+            directory = run_dir()
+            directory.mkdir(parents=True, exist_ok=True)
+            with open(directory / f"stages-{os.getpid()}.jsonl", 'ab') as f:
+                f.write(dumps(record, indent=False) + b'\n')
+        except OSError as e:
+            # 지표 기록 실패로 파이프라인을 중단하지 않음
+            print(f"⚠️ Could not write stage metrics: {e}")
+
+
+_metrics = RunMetrics()
+
+
+def get_metrics() -> RunMetrics:
+    """프로세스 공용 RunMetrics"""
+    return _metrics
+
+
+def stage(name: str, **labels: str):
+    """get_metrics().stage 단축"""
+    return _metrics.stage(name, **labels)
+
+
+# ---- 실행 리포트 ----
+
+def load_stage_records(directory: Path) -> List[Dict[str, Any]]:
+    records = []
+    for path in sorted(directory.glob("stages-*.jsonl")):
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    records.append(loads(line))
+    return sorted(records, key=lambda record: record['started_at'])
+
+
+def summarize_stages(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """단계/제공업체별 합계 (최대 RSS는 최댓값)"""
+    totals = defaultdict(lambda: {**{field: 0 for field in STAGE_FIELDS}, 'peak_rss_bytes': 0, 'runs': 0, 'errors': 0})
+    for record in records:
+        total = totals[(record['stage'], record.get('provider', ''))]
+        for field in STAGE_FIELDS:
+            total[field] += record.get(field, 0)
+        total['peak_rss_bytes'] = max(total['peak_rss_bytes'], record.get('peak_rss_bytes', 0))
+        total['runs'] += 1
+        total['errors'] += record.get('status') == 'error'
+    return [
+        {'stage': stage_name, 'provider': provider, **{key: round(value, 6) for key, value in total.items()}}
+        for (stage_name, provider), total in sorted(totals.items())
+    ]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+PROMETHEUS_METRICS = (
+    ('wall_seconds', 'pipeline_stage_wall_seconds', 'Wall-clock time spent in a pipeline stage'),
+    ('cpu_seconds', 'pipeline_stage_cpu_seconds', 'CPU time spent in a pipeline stage'),
+    ('bytes', 'pipeline_stage_bytes', 'Bytes fetched during a pipeline stage'),
+    ('models', 'pipeline_stage_models', 'Models produced by a pipeline stage'),
+    ('peak_rss_bytes', 'pipeline_stage_peak_rss_bytes', 'Peak resident set size at the end of a pipeline stage'),
+    ('errors', 'pipeline_stage_errors', 'Pipeline stage runs that raised an error'),
+)
+
+
+def prometheus_text(summary: List[Dict[str, Any]], run: str, finished: float,
+                    playwright: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+    lines = []
+    for field, metric, description in PROMETHEUS_METRICS:
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} gauge")
+        for total in summary:
+            labels = f'stage="{_escape(total["stage"])}"'
+            if total['provider']:
+                labels += f',provider="{_escape(total["provider"])}"'
+            lines.append(f"{metric}{{{labels}}} {total[field]}")
+    if playwright:
+        lines.append("# HELP pipeline_render_phase_seconds Time spent in each Playwright render phase")
+        lines.append("# TYPE pipeline_render_phase_seconds gauge")
+        for provider, totals in playwright.items():
+            for phase, seconds in totals['phases'].items():
+                lines.append(f'pipeline_render_phase_seconds{{provider="{_escape(provider)}",phase="{phase}"}} {seconds}')
+        lines.append("# HELP pipeline_render_bytes Bytes transferred while rendering, by resource type")
+        lines.append("# TYPE pipeline_render_bytes gauge")
+        for provider, totals in playwright.items():
+            for kind, counts in totals['resources'].items():
+                lines.append(f'pipeline_render_bytes{{provider="{_escape(provider)}",resource_type="{_escape(kind)}"}} '
+                             f"{counts['bytes']}")
+    lines.append("# HELP pipeline_run_finished_timestamp_seconds Time the run report was written")
+    lines.append("# TYPE pipeline_run_finished_timestamp_seconds gauge")
+    lines.append(f'pipeline_run_finished_timestamp_seconds{{run_id="{_escape(run)}"}} {finished:.3f}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_run_report(run: Optional[str] = None, extra: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """실행 디렉토리의 단계 기록을 run_report.json / metrics.prom으로 저장 (기록이 없으면 None)"""
+    run = run or run_id()
+    directory = run_dir(run)
+    if not directory.exists():
+        return None
+    records = load_stage_records(directory)
+    if not records:
+        return None
+
+    summary = summarize_stages(records)
+    finished = time.time()
+    report = {
+        'run_id': run,
+        'generated_at': datetime.fromtimestamp(finished).isoformat(),
+        'summary': summary,
+        'stages': records
+    }
+    playwright = summarize_page_telemetry(records)
+    if playwright:
+        report['playwright'] = playwright
+    if (directory / PROFILE_DIR).exists():
+        report['hotspots'] = write_hotspots(directory / PROFILE_DIR)
+    if extra:
+        report.update(extra)
+    dump_json(report, directory / "run_report.json", atomic=True)
+    with open(directory / "metrics.prom", 'w', encoding='utf-8') as f:
+        f.write(prometheus_text(summary, run, finished, playwright))
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline run report")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    report = subparsers.add_parser('report', help='Write run_report.json and metrics.prom')
+    report.add_argument('--run-id', help='Run ID (default: PIPELINE_RUN_ID)')
+    args = parser.parse_args()
+
+    if args.command == 'report':
+        run = args.run_id or os.environ.get('PIPELINE_RUN_ID')
+        if not run:
+            print("❌ No run ID (set PIPELINE_RUN_ID or pass --run-id)")
+            sys.exit(1)
+        written = write_run_report(run)
+        if written is None:
+            print(f"❌ No stage records for run {run}")
+            sys.exit(1)
+        print(f"✅ Run report: {len(written['stages'])} stage records → {run_dir(run)}")
+        for total in written['summary']:
+            name = f"{total['stage']}[{total['provider']}]" if total['provider'] else total['stage']
+            print(f"   - {name}: {total['wall_seconds']:.2f}s wall, {total['cpu_seconds']:.2f}s CPU, "
+                  f"{total['bytes']:,} bytes, {total['models']} models")
+        for provider, totals in written.get('playwright', {}).items():
+            print(f"   🎭 {format_breakdown(provider, totals)}")
+
+
+if __name__ == "__main__":
+    main()
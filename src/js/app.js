@@ -1,3 +1,5 @@
+import { FacetIndex } from './facets.js';
+
 // Utility: Debounce function
 function debounce(func, wait) {
     let timeout;
@@ -15,6 +17,7 @@ function debounce(func, wait) {
 class AIModelsDashboard {
     constructor() {
         this.data = null;
+        this.facetIndex = null;
         this.filteredModels = [];
         this.currentFilter = 'all';
         this.searchTerm = '';
@@ -51,6 +54,8 @@ class AIModelsDashboard {
 
             console.log(`📊 Loaded ${this.data.statistics.total_models} models from ${this.data.statistics.providers} providers`);
 
+            await this.loadFacetIndex();
+
         } catch (error) {
             console.error('Failed to load data:', error);
             // Try to load sample data
@@ -58,6 +63,16 @@ class AIModelsDashboard {
         }
     }
 
+    async loadFacetIndex() {
+        // 패싯 비트셋 색인 (없거나 데이터와 맞지 않으면 전체 스캔으로 필터링)
+        try {
+            this.facetIndex = await FacetIndex.load('./data/indexes/facets.json', this.data);
+        } catch (error) {
+            console.warn('Facet index unavailable, falling back to scan filtering:', error.message);
+            this.facetIndex = null;
+        }
+    }
+
     loadSampleData() {
         // 샘플 데이터 (실제 데이터 로드 실패시 사용)
         this.data = {
@@ -258,11 +273,22 @@ class AIModelsDashboard {
         if (allFilter) this.handleFilterClick(allFilter);
     }
 
+    getFacetFilters() {
+        if (this.currentFilter === 'all') return {};
+        if (this.currentFilter === 'free') return { pricing: ['free'] };
+        return { provider: [this.currentFilter] };
+    }
+
     applyFilters() {
         let filtered = [...this.data.models];
 
-        // 제공업체 필터
-        if (this.currentFilter !== 'all') {
+        // 제공업체 필터 (패싯 색인이 있으면 비트셋 교집합으로 선택)
+        if (this.facetIndex) {
+            const filters = this.getFacetFilters();
+            if (Object.keys(filters).length > 0) {
+                filtered = this.facetIndex.select(filters).map(i => this.data.models[i]);
+            }
+        } else if (this.currentFilter !== 'all') {
             if (this.currentFilter === 'free') {
                 filtered = filtered.filter(model => {
                     const inputPrice = model.pricing?.input || model.input_price || 0;
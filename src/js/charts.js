@@ -2,6 +2,18 @@ export class ChartsManager {
     // Singleton instance
     static instance = null;
 
+    // Pre-aggregated chart series windows (data/charts/<days>/index.json + <provider>.json)
+    static SERIES_WINDOWS = [30, 90, 365];
+
+    // Models shown in the price history chart
+    static TRACKED_MODELS = [
+        { id: 'gpt-4o', provider: 'openai', name: 'GPT-4o', color: '#10a37f' },
+        { id: 'claude-3-5-sonnet', provider: 'anthropic', name: 'Claude 3.5 Sonnet', color: '#d2691e' },
+        { id: 'gemini-1-5-pro', provider: 'google', name: 'Gemini 1.5 Pro', color: '#4285f4' },
+        { id: 'gpt-4o-mini', provider: 'openai', name: 'GPT-4o mini', color: '#22c55e' },
+        { id: 'claude-3-5-haiku', provider: 'anthropic', name: 'Claude 3.5 Haiku', color: '#f97316' }
+    ];
+
     // Cache for history data
     static dataCache = {
         historyData: null,
@@ -51,7 +63,7 @@ export class ChartsManager {
             // Load history data with caching
             const historyData = await this.loadHistoryDataWithCache(30);
 
-            if (historyData.length > 0) {
+            if (historyData.dates.length > 0) {
                 this.createPriceHistoryChart(historyData);
             } else {
                 // Use sample data if no history available
@@ -129,24 +141,136 @@ export class ChartsManager {
     }
 
     async loadHistoryData(days) {
+        // 파이프라인이 만든 사전 집계 시계열: 프로바이더 집계와 선택한 모델의 프로바이더 파일만 요청
+        const window = ChartsManager.SERIES_WINDOWS.find(w => w >= days)
+            ?? ChartsManager.SERIES_WINDOWS[ChartsManager.SERIES_WINDOWS.length - 1];
+        const index = await this.fetchJson(`./data/charts/${window}/index.json`);
+        if (index?.dates) {
+            const historyData = this.sliceSeries({ ...index, models: {} }, days);
+            Object.assign(historyData, { window, days, loadedProviders: new Set() });
+            await this.loadProviderSeries(historyData, this.selectedProviders());
+            return historyData;
+        }
+
+        // 시계열 파일이 없으면 날짜별 스냅샷에서 직접 구성
+        return this.buildSeriesFromSnapshots(await this.loadHistorySnapshots(days));
+    }
+
+    selectedProviders() {
+        return [...new Set(ChartsManager.TRACKED_MODELS
+            .filter(model => this.selectedModels.has(model.id))
+            .map(model => model.provider))];
+    }
+
+    async loadProviderSeries(historyData, providers) {
+        // 스냅샷에서 직접 구성한 데이터는 이미 모든 모델을 포함
+        if (!historyData.loadedProviders) return;
+
+        const pending = providers.filter(provider =>
+            historyData.providers?.[provider] && !historyData.loadedProviders.has(provider));
+        const files = await Promise.all(pending.map(provider =>
+            this.fetchJson(`./data/charts/${historyData.window}/${encodeURIComponent(provider)}.json`)));
+
+        files.forEach((file, i) => {
+            historyData.loadedProviders.add(pending[i]);
+            if (file?.models) {
+                Object.assign(historyData.models, this.sliceSeries(file, historyData.days).models);
+            }
+        });
+    }
+
+    sliceSeries(series, days) {
+        const start = Math.max(0, series.dates.length - days);
+        if (start === 0) return series;
+
+        const models = {};
+        for (const [uniqueId, model] of Object.entries(series.models)) {
+            const input = model.input.slice(start);
+            if (input.every(value => value === null)) continue;
+            models[uniqueId] = { ...model, input, output: model.output.slice(start) };
+        }
+        return { ...series, dates: series.dates.slice(start), models };
+    }
+
+    buildSeriesFromSnapshots(snapshots) {
+        const dates = snapshots.map(day => day.date);
+        const models = {};
+
+        snapshots.forEach((day, position) => {
+            const records = day.price_snapshot || (day.models || []).map(model => ({
+                ...model,
+                input_price: model.pricing?.input || model.input_price || 0,
+                output_price: model.pricing?.output || model.output_price || 0
+            }));
+
+            for (const record of records) {
+                const uniqueId = record.unique_id || `${record.provider}/${record.id}`;
+                if (!models[uniqueId]) {
+                    models[uniqueId] = {
+                        id: record.id,
+                        name: record.name,
+                        provider: record.provider,
+                        input: new Array(dates.length).fill(null),
+                        output: new Array(dates.length).fill(null)
+                    };
+                }
+                models[uniqueId].input[position] = record.input_price || 0;
+                models[uniqueId].output[position] = record.output_price || 0;
+            }
+        });
+
+        return { dates, models, providers: {} };
+    }
+
+    async loadHistorySnapshots(days) {
         const promises = [];
         const today = new Date();
+        const index = await this.loadHistoryIndex();
+        const blobRequests = new Map();
 
         for (let i = 0; i < days; i++) {
             const date = new Date(today);
             date.setDate(date.getDate() - i);
             const dateStr = date.toISOString().split('T')[0];
-
-            promises.push(
-                fetch(`./data/history/${dateStr}.json`)
-                    .then(res => res.ok ? res.json() : null)
-                    .catch(() => null)
-            );
+            const entry = index?.snapshots?.[dateStr];
+
+            if (entry) {
+                // 같은 내용의 스냅샷은 blob 하나를 공유하므로 한 번만 요청
+                if (!blobRequests.has(entry.blob)) {
+                    blobRequests.set(entry.blob, this.fetchJson(
+                        `./data/history/blobs/${entry.blob.slice(0, 2)}/${entry.blob}.json`
+                    ));
+                }
+                promises.push(blobRequests.get(entry.blob).then(blob =>
+                    blob ? { date: dateStr, ...entry.fields, ...blob } : null
+                ));
+            } else {
+                // 이전 형식의 날짜별 파일
+                promises.push(this.fetchJson(`./data/history/${dateStr}.json`));
+            }
         }
 
         const results = await Promise.all(promises);
         return results.filter(data => data !== null).reverse();
     }
+
+    findModelSeries(historyData, modelId) {
+        const models = historyData.models || {};
+        return models[`openai/${modelId}`]
+            || models[`anthropic/${modelId}`]
+            || models[`google/${modelId}`]
+            || Object.values(models).find(model => model.id === modelId);
+    }
+
+    async loadHistoryIndex() {
+        return this.fetchJson('./data/history/index.json');
+    }
+
+    fetchJson(url) {
+        return fetch(url)
+            .then(res => res.ok ? res.json() : null)
+            .catch(() => null);
+    }
     
     createPriceHistoryChart(historyData) {
         const canvas = document.getElementById('priceHistoryChart');
@@ -168,31 +292,19 @@ export class ChartsManager {
         const ctx = canvas.getContext('2d');
 
         // Available models to track
-        const trackedModels = [
-            { id: 'gpt-4o', name: 'GPT-4o', color: '#10a37f' },
-            { id: 'claude-3-5-sonnet', name: 'Claude 3.5 Sonnet', color: '#d2691e' },
-            { id: 'gemini-1-5-pro', name: 'Gemini 1.5 Pro', color: '#4285f4' },
-            { id: 'gpt-4o-mini', name: 'GPT-4o mini', color: '#22c55e' },
-            { id: 'claude-3-5-haiku', name: 'Claude 3.5 Haiku', color: '#f97316' }
-        ];
+        const trackedModels = ChartsManager.TRACKED_MODELS;
 
         // Filter datasets based on selected models
         const datasets = trackedModels
             .filter(modelInfo => this.selectedModels.has(modelInfo.id))
             .map(modelInfo => {
-                const data = historyData.map(day => {
-                    const model = day.price_snapshot?.find(m =>
-                        m.id === modelInfo.id ||
-                        m.unique_id === `openai/${modelInfo.id}` ||
-                        m.unique_id === `anthropic/${modelInfo.id}` ||
-                        m.unique_id === `google/${modelInfo.id}`
-                    );
-
-                    return {
-                        x: day.date,
-                        y: model ? model.input_price : null
-                    };
-                }).filter(point => point.y !== null);
+                const series = this.findModelSeries(historyData, modelInfo.id);
+                const data = series
+                    ? historyData.dates.map((date, i) => ({
+                        x: date,
+                        y: series.input[i]
+                    })).filter(point => point.y !== null)
+                    : [];
 
                 return {
                     label: modelInfo.name,
@@ -312,13 +424,7 @@ export class ChartsManager {
             heading.insertAdjacentElement('afterend', selectionUI);
         }
 
-        const trackedModels = [
-            { id: 'gpt-4o', name: 'GPT-4o', color: '#10a37f' },
-            { id: 'claude-3-5-sonnet', name: 'Claude 3.5 Sonnet', color: '#d2691e' },
-            { id: 'gemini-1-5-pro', name: 'Gemini 1.5 Pro', color: '#4285f4' },
-            { id: 'gpt-4o-mini', name: 'GPT-4o mini', color: '#22c55e' },
-            { id: 'claude-3-5-haiku', name: 'Claude 3.5 Haiku', color: '#f97316' }
-        ];
+        const trackedModels = ChartsManager.TRACKED_MODELS;
 
         selectionUI.innerHTML = `
             <div class="flex items-center justify-between flex-wrap gap-3">
@@ -355,11 +461,13 @@ export class ChartsManager {
         });
     }
 
-    toggleModel(modelId, historyData) {
+    async toggleModel(modelId, historyData) {
         if (this.selectedModels.has(modelId)) {
             this.selectedModels.delete(modelId);
         } else {
             this.selectedModels.add(modelId);
+            // 새로 선택한 모델의 프로바이더 파일이 없으면 그 파일만 추가로 요청
+            await this.loadProviderSeries(historyData, this.selectedProviders());
         }
 
         // Re-render the chart with updated selection
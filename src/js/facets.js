@@ -0,0 +1,124 @@
+// 패싯 비트셋 색인 (data/indexes/facets.json)
+// bit i = consolidated.json models[i], 같은 패싯 안의 값은 OR, 서로 다른 패싯은 AND
+export class FacetIndex {
+    constructor(index) {
+        this.modelCount = index.model_count;
+        this.wordCount = Math.ceil(this.modelCount / 32);
+        this.cubeDimensions = index.cube.dimensions;
+        this.cubeCells = index.cube.cells;
+        this.bitsets = {};
+
+        for (const [facet, values] of Object.entries(index.facets)) {
+            this.bitsets[facet] = {};
+            for (const [value, entry] of Object.entries(values)) {
+                this.bitsets[facet][value] = this.decode(entry.bits);
+            }
+        }
+    }
+
+    static async load(url, data) {
+        const response = await fetch(url);
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+
+        const index = await response.json();
+
+        // 색인이 현재 consolidated.json과 같은 모델 순서로 만들어졌는지 확인
+        const models = data?.models || [];
+        if (index.model_count !== models.length ||
+            (index.models || []).some((uniqueId, i) => models[i].unique_id !== uniqueId)) {
+            throw new Error('Facet index does not match consolidated data');
+        }
+
+        return new FacetIndex(index);
+    }
+
+    decode(encoded) {
+        // base64 little-endian 바이트열 -> Uint32Array
+        const binary = atob(encoded);
+        const bytes = new Uint8Array(this.wordCount * 4);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return new Uint32Array(bytes.buffer);
+    }
+
+    allBits() {
+        const bits = new Uint32Array(this.wordCount).fill(0xFFFFFFFF);
+        const tail = this.modelCount % 32;
+        if (tail && this.wordCount > 0) {
+            bits[this.wordCount - 1] = (2 ** tail) - 1;
+        }
+        return bits;
+    }
+
+    mask(filters = {}, exclude = null) {
+        const result = this.allBits();
+
+        for (const [facet, values] of Object.entries(filters)) {
+            if (facet === exclude || !values || values.length === 0) continue;
+
+            const union = new Uint32Array(this.wordCount);
+            for (const value of values) {
+                const bits = this.bitsets[facet]?.[value];
+                if (!bits) continue;
+                for (let w = 0; w < this.wordCount; w++) union[w] |= bits[w];
+            }
+            for (let w = 0; w < this.wordCount; w++) result[w] &= union[w];
+        }
+
+        return result;
+    }
+
+    static popcount(bits) {
+        let count = 0;
+        for (let w = 0; w < bits.length; w++) {
+            let v = bits[w];
+            v = v - ((v >>> 1) & 0x55555555);
+            v = (v & 0x33333333) + ((v >>> 2) & 0x33333333);
+            count += (((v + (v >>> 4)) & 0x0F0F0F0F) * 0x01010101) >>> 24;
+        }
+        return count;
+    }
+
+    count(filters = {}) {
+        return FacetIndex.popcount(this.mask(filters));
+    }
+
+    select(filters = {}) {
+        // 조건에 맞는 모델 ordinal 목록
+        const bits = this.mask(filters);
+        const ordinals = [];
+        for (let w = 0; w < bits.length; w++) {
+            let word = bits[w];
+            while (word) {
+                const low = word & -word;
+                ordinals.push(w * 32 + 31 - Math.clz32(low));
+                word ^= low;
+            }
+        }
+        return ordinals;
+    }
+
+    facetCounts(filters = {}) {
+        // 각 패싯 값 선택 시 결과 수 (해당 패싯 자신의 조건은 제외)
+        const result = {};
+        for (const [facet, values] of Object.entries(this.bitsets)) {
+            const base = this.mask(filters, facet);
+            result[facet] = {};
+            for (const [value, bits] of Object.entries(values)) {
+                const intersection = new Uint32Array(this.wordCount);
+                for (let w = 0; w < this.wordCount; w++) intersection[w] = bits[w] & base[w];
+                result[facet][value] = FacetIndex.popcount(intersection);
+            }
+        }
+        return result;
+    }
+
+    cubeCount(selection = {}) {
+        // 큐브에서 직접 조회 (지정하지 않은 차원은 '*')
+        const key = this.cubeDimensions.map(dim => selection[dim] ?? '*').join('|');
+        return this.cubeCells[key] || 0;
+    }
+}
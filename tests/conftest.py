@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 스크립트는 scripts/를 기준으로 import함 (utils.*, history.* 등)
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
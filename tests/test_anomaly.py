@@ -0,0 +1,26 @@
+from analytics.anomaly import SUPPRESS_BELOW, score_changes
+
+
+def price_change(old_input, new_input, old_output, new_output, unique_id='openai/model-1'):
+    return {
+        'unique_id': unique_id,
+        'input_price': {'old': old_input, 'new': new_input},
+        'output_price': {'old': old_output, 'new': new_output}
+    }
+
+
+def test_stale_reference_does_not_penalize_normal_cut():
+    references = {'openai/model-1': [('openrouter', 10.0, 40.0)]}
+    change = score_changes([price_change(10.0, 8.0, 40.0, 32.0)], references=references)[0]
+
+    assert change['confidence'] == 1.0
+    assert change['anomaly_reasons'] == []
+
+
+def test_stale_reference_penalizes_jump_outside_normal_range():
+    references = {'openai/model-1': [('openrouter', 10.0, 40.0)]}
+    change = score_changes([price_change(10.0, 1000.0, 40.0, 4000.0)], references=references)[0]
+
+    assert change['confidence'] < SUPPRESS_BELOW
+    assert change['suppressed']
+    assert "previous price still matches openrouter" in change['anomaly_reasons']
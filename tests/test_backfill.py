@@ -0,0 +1,100 @@
+import shutil
+import sqlite3
+
+from history.backfill import Backfill
+from history.history_db import HistoryDatabase
+from history.records import to_snapshot_body
+from history.snapshot_store import HistoryStore
+from history.timeseries import FIELDS, TimeSeriesStore
+from utils.json_codec import dump_json
+
+
+def snapshot(day):
+    # 날짜마다 모델 구성과 순서가 달라 청크별 ordinal이 전체 순서와 어긋나도록 구성
+    ids = [i for i in range(6) if (i + day) % 3] + [10 + day // 3]
+    return {
+        'date': f"2025-01-{day:02d}",
+        'models': [
+            {'unique_id': f"openai/model-{i}", 'id': f"model-{i}", 'provider': 'openai',
+             'pricing': {'input': float(day + i), 'output': float(day * i)}, 'context_window': 1000 + i}
+            for i in sorted(ids, reverse=day % 2 == 0)
+        ]
+    }
+
+
+def current(day):
+    data = snapshot(day)
+    return {'date': data['date'], **to_snapshot_body(data)}
+
+
+def build(history_dir, days):
+    store = HistoryStore(history_dir)
+    for day in days:
+        if day % 4 == 0:
+            # 이전 형식의 날짜별 파일
+            dump_json(snapshot(day), history_dir / f"2025-01-{day:02d}.json")
+        else:
+            store.put(f"2025-01-{day:02d}", current(day))
+
+
+def serial(history_dir):
+    store = HistoryStore(history_dir)
+    store.convert()
+    TimeSeriesStore(history_dir).sync(store)
+    HistoryDatabase(history_dir).sync(store)
+
+
+def assert_same_outputs(left, right):
+    for name in ('meta.json', 'models.json', *(f"{field}.npy" for field in FIELDS)):
+        assert (left / 'timeseries' / name).read_bytes() == (right / 'timeseries' / name).read_bytes(), name
+    for table in ('snapshots', 'prices'):
+        rows = []
+        for path in (left, right):
+            with sqlite3.connect(path / 'history.db') as conn:
+                rows.append(conn.execute(f"SELECT * FROM {table} ORDER BY 1, 2").fetchall())
+        assert rows[0] == rows[1], table
+    assert HistoryStore(left).load_index() == HistoryStore(right).load_index()
+
+
+def test_parallel_backfill_matches_serial_sync(tmp_path):
+    parallel, expected = tmp_path / 'parallel', tmp_path / 'serial'
+    parallel.mkdir()
+    build(parallel, [day for day in range(1, 12) if day != 6])
+    shutil.copytree(parallel, expected)
+
+    stats = Backfill(parallel, chunk_size=3, workers=2).run()
+    serial(expected)
+    assert stats['snapshots'] == 2
+    assert stats['timeseries']['appended'] == 10
+    assert stats['db']['inserted'] == 10
+    assert not (parallel / '.backfill').exists()
+    assert_same_outputs(parallel, expected)
+
+    # 중간 날짜가 추가된 뒤 다시 실행하면 시계열은 그 날짜부터, DB는 새 날짜만 다시 만듦
+    for path in (parallel, expected):
+        HistoryStore(path).put("2025-01-06", current(6))
+        HistoryStore(path).put("2025-01-13", current(13))
+    stats = Backfill(parallel, chunk_size=3, workers=2).run()
+    serial(expected)
+    assert stats['timeseries']['rewritten'] == 5 and stats['timeseries']['appended'] == 7
+    assert stats['db']['inserted'] == 2 and stats['db']['replaced'] == 0
+    assert_same_outputs(parallel, expected)
+
+
+def test_resumes_from_chunk_checkpoints(tmp_path, monkeypatch):
+    build(tmp_path, range(1, 10))
+    backfill = Backfill(tmp_path, chunk_size=3, workers=1)
+    backfill.collect()
+    checkpoints = sorted(path.name for path in (tmp_path / '.backfill').iterdir())
+    assert len(checkpoints) == 3
+    # 체크포인트에는 파생 데이터만 있고 스냅샷 본문은 없음
+    assert {path.name for path in (tmp_path / '.backfill' / checkpoints[0]).iterdir()} == {
+        'chunk.json', 'timeseries', 'history.db'
+    }
+
+    def fail(*args, **kwargs):
+        raise AssertionError("checkpointed chunk was processed again")
+
+    monkeypatch.setattr('history.backfill.ProcessPoolExecutor', fail)
+    stats = Backfill(tmp_path, chunk_size=3, workers=1).run()
+    assert stats['timeseries']['dates'] == 9 and stats['db']['dates'] == 9
@@ -0,0 +1,59 @@
+from history.catalog_events import CatalogEventStore, segment_name
+from history.snapshot_store import strip_volatile
+
+
+def make_model(i, price):
+    return {
+        'id': f"model-{i}",
+        'provider': 'openai',
+        'unique_id': f"openai/model-{i}",
+        'pricing': {'input': price, 'output': price * 4},
+        'last_updated': f"2025-01-01T00:00:{i:02d}"
+    }
+
+
+def catalog(price, count=5):
+    return [make_model(i, price + i) for i in reversed(range(count))]
+
+
+def test_materialize_matches_consolidated_modulo_order_and_last_updated(tmp_path):
+    store = CatalogEventStore(tmp_path)
+    store.ingest(catalog(1.0), '2025-01-01T00:00:00')
+    models = catalog(2.0, count=4)
+    store.ingest(models, '2025-01-02T00:00:00')
+
+    materialized = CatalogEventStore(tmp_path).materialize()
+    expected = sorted((strip_volatile(model, top_level=False) for model in models), key=lambda m: m['unique_id'])
+    assert materialized == {'as_of': '2025-01-02T00:00:00', 'models': expected}
+
+
+def test_truncates_uncommitted_segment_tail(tmp_path):
+    store = CatalogEventStore(tmp_path)
+    store.ingest(catalog(1.0), '2025-01-01T00:00:00')
+    with open(tmp_path / "catalog" / segment_name(1), 'ab') as f:
+        f.write(b'{"seq": 6, "timestamp": "2025-01-02T00:00:00", "op": "remo')
+
+    store = CatalogEventStore(tmp_path)
+    assert store.ingest(catalog(2.0), '2025-01-02T00:00:00') == 5
+    reopened = CatalogEventStore(tmp_path)
+    assert [event['seq'] for event in reopened.events()] == list(range(1, 11))
+    assert reopened.state_at('2025-01-02T00:00:00')['openai/model-0']['pricing']['input'] == 2.0
+
+
+def test_removes_segment_that_was_never_committed(tmp_path):
+    store = CatalogEventStore(tmp_path, segment_bytes=1)
+    store.ingest(catalog(1.0), '2025-01-01T00:00:00')
+    manifest = (tmp_path / "catalog" / "manifest.json").read_bytes()
+    store.ingest(catalog(2.0), '2025-01-02T00:00:00')
+
+    # 새 세그먼트를 쓴 뒤 manifest 저장 전에 중단
+    (tmp_path / "catalog" / "manifest.json").write_bytes(manifest)
+
+    store = CatalogEventStore(tmp_path, segment_bytes=1)
+    assert not (tmp_path / "catalog" / segment_name(2)).exists()
+    assert store.ingest(catalog(3.0), '2025-01-03T00:00:00') == 5
+
+    reopened = CatalogEventStore(tmp_path)
+    assert [event['seq'] for event in reopened.events()] == list(range(1, 11))
+    assert reopened.state_at('2025-01-02T12:00:00')['openai/model-0']['pricing']['input'] == 1.0
+    assert reopened.materialize()['models'][0]['pricing']['input'] == 3.0
@@ -0,0 +1,39 @@
+from history.chart_series import write_chart_series
+from history.snapshot_store import HistoryStore
+from utils.json_codec import load_json
+
+
+def snapshot(day, providers):
+    return {
+        'date': f"2025-01-{day:02d}",
+        'models': [
+            {'unique_id': f"{provider}/model-{i}", 'id': f"model-{i}", 'provider': provider,
+             'pricing': {'input': float(day + i), 'output': float(day + i) * 4}}
+            for provider in providers for i in range(2)
+        ]
+    }
+
+
+def test_series_are_split_by_provider(tmp_path):
+    history_dir, charts_dir = tmp_path / 'history', tmp_path / 'charts'
+    store = HistoryStore(history_dir)
+    for day in range(1, 5):
+        store.put(f"2025-01-{day:02d}", snapshot(day, ['openai', 'anthropic']))
+    (charts_dir / '30').mkdir(parents=True)
+    (charts_dir / 'series-30.json').write_text('{}')
+    (charts_dir / '30' / 'removed.json').write_text('{}')
+
+    write_chart_series(history_dir, charts_dir, windows=(30, 2))
+
+    index = load_json(charts_dir / '30' / 'index.json')
+    assert 'models' not in index
+    assert sorted(index['providers']) == ['anthropic', 'openai']
+    assert index['providers']['openai']['models'] == [2, 2, 2, 2]
+    openai = load_json(charts_dir / '30' / 'openai.json')
+    assert openai['dates'] == index['dates']
+    assert sorted(openai['models']) == ['openai/model-0', 'openai/model-1']
+    assert openai['models']['openai/model-1']['input'] == [2.0, 3.0, 4.0, 5.0]
+    assert load_json(charts_dir / '2' / 'anthropic.json')['dates'] == ['2025-01-03', '2025-01-04']
+    # 없어진 프로바이더 파일과 이전 형식의 통합 파일은 삭제
+    assert sorted(path.name for path in (charts_dir / '30').iterdir()) == ['anthropic.json', 'index.json', 'openai.json']
+    assert not (charts_dir / 'series-30.json').exists()
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+
+from history.compaction import compact, plan_compaction
+from history.records import sorted_records
+from history.snapshot_store import HistoryStore
+
+
+def make_model(i, price):
+    return {'unique_id': f"openai/model-{i}", 'id': f"model-{i}", 'name': f"Model {i}", 'provider': 'openai',
+            'pricing': {'input': price, 'output': price * 4}, 'context_window': 128000, 'status': 'ga'}
+
+
+def fill(store, first_day, last_day):
+    first = datetime(2024, 1, 1)
+    for day in range(first_day, last_day):
+        date = (first + timedelta(days=day)).strftime("%Y-%m-%d")
+        models = [make_model(i, 1.0 + i + (day // 30) * 0.5) for i in range(3)]
+        store.put(date, {'date': date, 'schema_version': 2, 'price_snapshot': sorted_records(models)}, save=False)
+    store.save_index()
+
+
+def test_compact_is_idempotent(tmp_path):
+    store = HistoryStore(tmp_path)
+    fill(store, 0, 500)
+
+    first = compact(store, daily_days=30, weekly_days=120)
+    assert first['dates_after'] < first['dates_before']
+    index = HistoryStore(tmp_path).load_index()
+
+    store = HistoryStore(tmp_path)
+    assert plan_compaction(store, daily_days=30, weekly_days=120) == {}
+    second = compact(store, daily_days=30, weekly_days=120)
+    assert second['groups'] == 0 and second['merged'] == 0
+    assert HistoryStore(tmp_path).load_index() == index
+
+
+def test_compacting_in_steps_matches_one_pass(tmp_path):
+    once = HistoryStore(tmp_path / "once")
+    fill(once, 0, 500)
+    compact(once, daily_days=30, weekly_days=120)
+
+    steps = HistoryStore(tmp_path / "steps")
+    fill(steps, 0, 250)
+    compact(steps, daily_days=30, weekly_days=120)
+    fill(steps, 250, 500)
+    compact(steps, daily_days=30, weekly_days=120)
+
+    assert steps.dates() == once.dates()
+    for date in once.dates():
+        assert steps.load(date) == once.load(date)
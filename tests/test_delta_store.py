@@ -0,0 +1,79 @@
+import os
+
+from history.delta_store import DeltaHistory
+from history.reader import open_history
+from history.snapshot_store import HistoryStore
+from history.timeseries import TimeSeriesStore
+from utils.json_codec import dump_json
+
+
+def snapshot(day, price):
+    return {
+        'date': f"2025-01-{day:02d}",
+        'models': [
+            {'unique_id': f"openai/model-{i}", 'id': f"model-{i}", 'provider': 'openai',
+             'pricing': {'input': price + i, 'output': (price + i) * 4}}
+            for i in range(3 + day % 2)
+        ]
+    }
+
+
+def put(store, day, price):
+    store.put(f"2025-01-{day:02d}", snapshot(day, price))
+
+
+def test_round_trip_after_out_of_order_insert(tmp_path):
+    store = HistoryStore(tmp_path)
+    for day in (1, 2, 3, 5, 6, 7):
+        put(store, day, float(day))
+    deltas = DeltaHistory(tmp_path, keyframe_interval=3)
+    deltas.sync(store)
+
+    # 이미 인코딩된 날짜 사이에 과거 날짜가 뒤늦게 추가됨
+    put(store, 4, 40.0)
+    stats = DeltaHistory(tmp_path, keyframe_interval=3).sync(store)
+    assert stats['rewritten'] > 0
+
+    deltas = DeltaHistory(tmp_path)
+    assert deltas.dates() == store.dates()
+    for date in store.dates():
+        assert deltas.load(date) == store.load(date)
+    assert isinstance(open_history(tmp_path), DeltaHistory)
+    assert DeltaHistory(tmp_path).sync(store) == {'rewritten': 0, 'appended': 0, 'total': 7}
+
+
+
+def test_timeseries_includes_out_of_order_insert(tmp_path):
+    store = HistoryStore(tmp_path)
+    for day in (1, 2, 3, 5, 6):
+        put(store, day, float(day))
+    TimeSeriesStore(tmp_path).sync(store)
+
+    put(store, 4, 40.0)
+    stats = TimeSeriesStore(tmp_path).sync(HistoryStore(tmp_path))
+    assert stats['rewritten'] == 2 and stats['appended'] == 3
+
+    series = TimeSeriesStore(tmp_path)
+    assert series.dates() == store.dates()
+    assert series.model_series('openai/model-1') == [
+        ('2025-01-01', 2.0), ('2025-01-02', 3.0), ('2025-01-03', 4.0),
+        ('2025-01-04', 41.0), ('2025-01-05', 6.0), ('2025-01-06', 7.0)
+    ]
+    assert TimeSeriesStore(tmp_path).sync(HistoryStore(tmp_path))['appended'] == 0
+
+def test_open_history_does_not_hash_unchanged_legacy_files(tmp_path, monkeypatch):
+    for day in (1, 2):
+        dump_json(snapshot(day, float(day)), tmp_path / f"2025-01-{day:02d}.json")
+    DeltaHistory(tmp_path).sync(HistoryStore(tmp_path))
+
+    hashed = []
+    monkeypatch.setattr(HistoryStore, 'source_digest', lambda self, date: hashed.append(date) or '')
+    assert isinstance(open_history(tmp_path), DeltaHistory)
+    assert hashed == []
+
+    # 파일이 바뀌면 델타를 쓰지 않음
+    path = tmp_path / "2025-01-02.json"
+    dump_json(snapshot(2, 9.0), path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert isinstance(open_history(tmp_path), HistoryStore)
@@ -0,0 +1,85 @@
+from history.event_log import EventLog, segment_name
+from utils.json_codec import dumps
+
+
+def make_event(i, provider='openai'):
+    return {
+        'timestamp': f"2025-01-{1 + i % 28:02d}T00:00:{i % 60:02d}",
+        'unique_id': f"{provider}/model-{i % 5}",
+        'model_id': f"model-{i % 5}",
+        'name': f"Model {i % 5}",
+        'provider': provider,
+        'type': 'changed',
+        'input_price': {'old': float(i), 'new': float(i + 1)},
+        'output_price': {'old': float(i), 'new': float(i + 1)}
+    }
+
+
+def all_events(log):
+    return sorted((event for event in log.iter_events()), key=lambda event: event['input_price']['old'])
+
+
+def test_queries_load_shards_lazily(tmp_path):
+    log = EventLog(tmp_path)
+    log.append([make_event(i) for i in range(20)])
+
+    reopened = EventLog(tmp_path)
+    assert reopened._shards == {}
+    changes = reopened.model_changes('openai/model-2')
+    assert [event['input_price']['old'] for event in changes] == [2.0, 7.0, 12.0, 17.0]
+    assert len(reopened._shards) == 1
+    assert reopened.stats()['events'] == 20
+
+
+def test_recovers_truncated_segment_tail(tmp_path):
+    log = EventLog(tmp_path)
+    log.append([make_event(i) for i in range(3)])
+
+    # manifest 저장 전에 중단: 완전한 줄 하나와 잘린 줄 하나
+    path = tmp_path / "events" / segment_name(1)
+    with open(path, 'ab') as f:
+        f.write(dumps(make_event(3), indent=False) + b'\n')
+        f.write(dumps(make_event(4), indent=False)[:20])
+
+    log = EventLog(tmp_path)
+    assert log.stats()['events'] == 4
+    log.append([make_event(5)])
+
+    reopened = EventLog(tmp_path)
+    assert [event['input_price']['old'] for event in all_events(reopened)] == [0.0, 1.0, 2.0, 3.0, 5.0]
+    assert reopened.last_change('openai/model-0')['input_price']['old'] == 5.0
+
+
+def test_recovers_segment_that_was_never_indexed(tmp_path):
+    log = EventLog(tmp_path, segment_bytes=1)
+    log.append([make_event(0)])
+
+    # 새 세그먼트를 쓴 뒤 manifest 저장 전에 중단
+    with open(tmp_path / "events" / segment_name(2), 'wb') as f:
+        for i in (1, 2):
+            f.write(dumps(make_event(i), indent=False) + b'\n')
+
+    log = EventLog(tmp_path, segment_bytes=1)
+    assert log.stats()['segments'] == 2
+    log.append([make_event(3)])
+
+    reopened = EventLog(tmp_path)
+    stats = reopened.stats()
+    assert (stats['segments'], stats['events'], stats['models'], stats['providers']) == (3, 4, 4, 1)
+    assert [event['input_price']['old'] for event in all_events(reopened)] == [0.0, 1.0, 2.0, 3.0]
+    assert [event['input_price']['old'] for event in reopened.model_changes('openai/model-2')] == [2.0]
+    assert [event['input_price']['old'] for event in reopened.model_changes('openai/model-3')] == [3.0]
+
+
+def test_recovery_does_not_duplicate_saved_shard_entries(tmp_path):
+    log = EventLog(tmp_path)
+    log.append([make_event(0)])
+    manifest = (tmp_path / "events" / "manifest.json").read_bytes()
+    log.append([make_event(5)])
+
+    # 샤드는 저장됐지만 manifest 교체 전에 중단
+    (tmp_path / "events" / "manifest.json").write_bytes(manifest)
+
+    reopened = EventLog(tmp_path)
+    assert len(reopened.model_changes('openai/model-0')) == 2
+    assert len(reopened.provider_changes('openai')) == 2
@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+
+import price_monitor
+
+from history.event_log import EventLog
+from history.price_index import CONFIRM_AFTER_DAYS, PriceIndex, content_digest
+from history.records import sorted_records
+from history.snapshot_store import HistoryStore
+from price_monitor import PriceMonitor
+from utils.json_codec import dump_json
+
+
+def make_model(provider, model_id, input_price, output_price):
+    return {
+        'id': model_id,
+        'name': model_id.title(),
+        'provider': provider,
+        'unique_id': f"{provider}/{model_id}",
+        'pricing': {'input': input_price, 'output': output_price, 'unit': '1M tokens'},
+        'context_window': 128000,
+        'status': 'ga'
+    }
+
+
+def write_history(base_dir, date, models):
+    store = HistoryStore(base_dir / "data/history")
+    with store.open_snapshot(date, {'date': date, 'timestamp': f"{date}T00:00:00"}) as writer:
+        writer.write_field('schema_version', 2)
+        writer.write_array('price_snapshot', sorted_records(models))
+
+
+def write_consolidated(base_dir, models, last_updated):
+    (base_dir / "data").mkdir(parents=True, exist_ok=True)
+    dump_json({'last_updated': last_updated, 'models': models}, base_dir / "data/consolidated.json")
+
+
+def yesterday():
+    return (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def test_first_run_examines_only_changed_models(tmp_path):
+    models = [make_model('openai', f"model-{i}", 1.0 + i, 4.0 + i) for i in range(50)]
+    write_history(tmp_path, yesterday(), models)
+
+    current = [dict(model) for model in models]
+    current[7] = make_model('openai', 'model-7', 0.5, 2.0)
+    write_consolidated(tmp_path, current, datetime.now().isoformat())
+
+    monitor = PriceMonitor(base_dir=tmp_path)
+    index = monitor.load_price_index()
+    candidates = index.changed_records(monitor.get_current_data())
+
+    assert len(index) == 50
+    assert [record['unique_id'] for record in candidates] == ['openai/model-7']
+
+
+def test_is_current_ignores_last_updated(tmp_path):
+    models = [make_model('openai', 'model-1', 1.0, 4.0)]
+    write_consolidated(tmp_path, models, '2025-01-01T00:00:00')
+    index = PriceIndex(tmp_path / "data/history")
+    index.update([], as_of='2025-01-01', source_digest=content_digest(tmp_path / "data/consolidated.json"))
+
+    write_consolidated(tmp_path, models, '2025-01-01T06:00:00')
+    assert index.is_current(tmp_path / "data/consolidated.json")
+
+    write_consolidated(tmp_path, [make_model('openai', 'model-1', 2.0, 4.0)], '2025-01-01T12:00:00')
+    assert not index.is_current(tmp_path / "data/consolidated.json")
+
+
+def test_suppressed_change_is_logged_once(tmp_path):
+    index = PriceIndex(tmp_path / "data/history")
+    models = {'models': [make_model('openai', 'model-1', 1.0, 4.0)]}
+    index.update(index.changed_records(models), as_of='2025-01-01')
+
+    misparsed = {'models': [make_model('openai', 'model-1', 1000.0, 4.0)]}
+    candidates = index.changed_records(misparsed)
+    assert [record['unique_id'] for record in candidates] == ['openai/model-1']
+    index.suppress(candidates)
+    index.save()
+
+    index = PriceIndex(tmp_path / "data/history")
+    assert index.changed_records(misparsed) == []
+    assert index.models['openai/model-1'][:2] == [1.0, 4.0]
+
+    # 원래 가격으로 돌아오면 제외 기록이 지워지고, 다른 값이면 다시 비교
+    assert index.changed_records(models) == []
+    assert index.changed_records(misparsed) != []
+
+
+def test_monitor_does_not_relog_suppressed_change(tmp_path):
+    models = [make_model('openai', f"model-{i}", 1.0 + i, 4.0 + i) for i in range(20)]
+    write_history(tmp_path, yesterday(), models)
+    current = [dict(model) for model in models]
+    current[3] = make_model('openai', 'model-3', 4000.0, 7.0)
+
+    write_consolidated(tmp_path, current, f"{datetime.now().date()}T00:00:00")
+    PriceMonitor(base_dir=tmp_path).run()
+
+    # 다른 모델이 바뀌어 다시 비교해도 제외된 변경은 다시 기록되지 않음
+    current[5] = make_model('openai', 'model-5', 5.5, 9.0)
+    write_consolidated(tmp_path, current, f"{datetime.now().date()}T06:00:00")
+    monitor = PriceMonitor(base_dir=tmp_path)
+    assert [r['unique_id'] for r in monitor.load_price_index().changed_records(monitor.get_current_data())] == ['openai/model-5']
+    monitor.run()
+
+    log = EventLog(tmp_path / "data/history")
+    changes = log.model_changes('openai/model-3')
+    assert len(changes) == 1
+    assert changes[0].get('suppressed')
+
+
+def test_suppressed_value_is_accepted_after_consecutive_days(tmp_path):
+    index = PriceIndex(tmp_path / "data/history")
+    models = {'models': [make_model('openai', 'model-1', 10.0, 40.0)]}
+    index.update(index.changed_records(models, as_of='2025-01-01'), as_of='2025-01-01')
+
+    cut = {'models': [make_model('openai', 'model-1', 8.0, 32.0)]}
+    index.suppress(index.changed_records(cut, as_of='2025-01-02'), as_of='2025-01-02')
+
+    # 같은 날 다시 관측해도 일수는 늘지 않음
+    for day in range(CONFIRM_AFTER_DAYS - 1):
+        assert index.changed_records(cut, as_of=f"2025-01-0{2 + day}") == []
+        assert index.confirmed == set()
+
+    confirmed = index.changed_records(cut, as_of=f"2025-01-0{1 + CONFIRM_AFTER_DAYS}")
+    assert [record['unique_id'] for record in confirmed] == ['openai/model-1']
+    assert index.confirmed == {'openai/model-1'}
+
+    index.update(confirmed)
+    assert index['openai/model-1']['input_price'] == 8.0
+    assert len(index.models['openai/model-1']) == 4
+
+
+def test_monitor_reports_persistent_suppressed_change(tmp_path, monkeypatch):
+    models = [make_model('openai', f"model-{i}", 1.0 + i, 4.0 + i) for i in range(20)]
+    write_history(tmp_path, yesterday(), models)
+    current = [dict(model) for model in models]
+    current[3] = make_model('openai', 'model-3', 4000.0, 7.0)
+
+    start = datetime.now()
+    for day in range(CONFIRM_AFTER_DAYS):
+        now = start + timedelta(days=day)
+
+        class FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return now
+
+        monkeypatch.setattr(price_monitor, 'datetime', FakeDatetime)
+        write_consolidated(tmp_path, current, now.isoformat())
+        PriceMonitor(base_dir=tmp_path).run()
+        reported = (tmp_path / "price_changes.txt").read_text()
+        assert reported == ('true' if day == CONFIRM_AFTER_DAYS - 1 else 'false')
+
+    changes = EventLog(tmp_path / "data/history").model_changes('openai/model-3')
+    assert [change['suppressed'] for change in changes] == [True, False]
+    assert PriceIndex(tmp_path / "data/history")['openai/model-3']['input_price'] == 4000.0
@@ -0,0 +1,24 @@
+import io
+
+from analytics.report import NOTICE_RESERVE, write_report
+
+
+def price_change(i):
+    return {
+        'name': f"Model {i}", 'provider': 'openai',
+        'input_price': {'old': 1.0, 'new': 2.0, 'change': 1.0, 'change_percent': 100.0},
+        'output_price': {'old': 4.0, 'new': 8.0, 'change': 4.0, 'change_percent': 100.0}
+    }
+
+
+def test_appendix_sections_share_the_length_limit():
+    buffer = io.StringIO()
+    base = write_report([price_change(0)], io.StringIO())['length']
+    appendix = [["## Windows\n", "| 1d |\n"], ["### Largest moves\n", "x" * 5000]]
+    written = write_report([price_change(0)], buffer, limit=base + NOTICE_RESERVE + 100, appendix=appendix)
+
+    text = buffer.getvalue()
+    assert "## Windows" in text
+    assert "Largest moves" not in text
+    assert written['omitted'] == 1
+    assert len(text) <= base + NOTICE_RESERVE + 100
@@ -0,0 +1,24 @@
+from indexes.search_index import build_search_index
+
+
+def make_model(provider, model_id, name):
+    return {'unique_id': f"{provider}/{model_id}", 'id': model_id, 'provider': provider, 'name': name}
+
+
+def test_incremental_rebuild_has_no_duplicate_postings():
+    # 이전 목록에 같은 unique_id가 두 번 들어간 경우
+    previous_models = [
+        make_model('openai', 'gpt-4o', 'GPT-4o'),
+        make_model('openai', 'gpt-4o', 'GPT-4o'),
+        make_model('anthropic', 'claude', 'Claude'),
+    ]
+    previous = build_search_index(previous_models)
+    models = [make_model('anthropic', 'claude', 'Claude 3'), make_model('openai', 'gpt-4o', 'GPT-4o')]
+    models.insert(1, models[1])
+    index = build_search_index(models, previous)
+
+    assert index['reused_providers'] == ['openai']
+    for postings in list(index['tokens'].values()) + list(index['prefixes'].values()):
+        assert postings == sorted(set(postings))
+    assert index == {**build_search_index(models), 'generated_at': index['generated_at'],
+                     'reused_providers': ['openai']}